@@ -1,3 +1,24 @@
 from django.contrib import admin
 
-# Register your models here.
+from accountapp.models import User
+from accountapp.phone import try_normalize_phone
+
+
+@admin.register(User)
+class UserAdmin(admin.ModelAdmin):
+    list_display = ("phone", "full_name", "is_active", "is_staff", "deleted_at")
+    list_filter = ("is_active", "is_staff")
+    exclude = ("password",)
+    # only enables the search box, see get_search_results
+    search_fields = ("phone_normalized",)
+    search_help_text = "Phone number in any format (01…, 8801…, +8801…)"
+
+    def get_search_results(self, request, queryset, search_term):
+        # one equality on the normalized phone instead of LIKE scans
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        normalized = try_normalize_phone(search_term)
+        if normalized is None:
+            return queryset.filter(phone=search_term), False
+        return queryset.filter(phone_normalized=normalized), False
@@ -0,0 +1,13 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+from accountapp.hashing import run_bounded
+
+
+class BoundedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    api/token: password check (and token creation) run on the bounded
+    login pool, see accountapp.hashing.
+    """
+
+    def validate(self, attrs):
+        return run_bounded(super().validate, attrs)
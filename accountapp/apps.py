@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AccountappConfig(AppConfig):
     name = 'accountapp'
+
+    def ready(self):
+        # auth snapshot invalidation receivers
+        from accountapp import signals  # noqa: F401
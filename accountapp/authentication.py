@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from accountapp.models import User
+from accountapp.roles import mask_has_role
+
+# -----------------------------
+# DB-free JWT authentication
+# -----------------------------
+#
+# simplejwt's JWTAuthentication SELECTs the user on every request.
+# Here the few fields that auth/permission checks need are cached as a
+# small snapshot (invalidated by accountapp.signals on User/UserRole
+# writes), and request.user is a SnapshotUser built from it. Anything
+# outside the snapshot loads the real User on first access.
+
+SNAPSHOT_FIELDS = ("id", "phone", "is_active", "is_staff", "is_superuser", "role_mask")
+
+
+def user_snapshot_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def get_user_snapshot(user_id):
+    """
+    Cached snapshot of an alive user, None when the user does not exist.
+    """
+    key = user_snapshot_key(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).first()
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, timeout=settings.AUTH_USER_SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+class SnapshotUser:
+    """
+    request.user for CachedJWTAuthentication.
+
+    Snapshot fields (id/pk, phone, is_active, is_staff, is_superuser,
+    role_mask) are plain attributes; any other attribute or method
+    (full_name, has_perm, save...) is read from the real User, which is
+    loaded with one query the first time it is needed.
+
+    Note: this is not a User instance (isinstance() is False) and setting
+    attributes on it does not change the real User.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, snapshot):
+        self.__dict__.update(snapshot)
+        self.pk = snapshot["id"]
+        self._user = None
+
+    @property
+    def user(self):
+        if self._user is None:
+            self._user = User.objects.get(pk=self.pk)
+        return self._user
+
+    def has_role(self, role):
+        return mask_has_role(self.role_mask, role)
+
+    def __getattr__(self, name):
+        # only called for attributes that are not in the snapshot
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+    def __eq__(self, other):
+        return getattr(other, "pk", None) == self.pk and other.pk is not None
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return self.phone
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            # needs the password hash, which is not part of the snapshot
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return SnapshotUser(snapshot)
@@ -0,0 +1,20 @@
+from django.contrib.auth.backends import ModelBackend
+
+from accountapp.models import User
+
+
+class PhoneBackend(ModelBackend):
+    """
+    ModelBackend that never resolves a soft-deleted user.
+
+    Login goes through UserManager.get_by_natural_key (alive only).
+    Session lookups (admin) go through get_user below; the default
+    implementation uses the unfiltered default manager.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = User.objects.get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class Role(models.TextChoices):
+    STUDENT = "student", "Student"
+    PARENT = "parent", "Parent"
+    TEACHER = "teacher", "Teacher"
+    ADMIN = "admin", "Admin"
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.db import close_old_connections
+from rest_framework.exceptions import Throttled
+
+# -----------------------------
+# Bounded password hashing
+# -----------------------------
+#
+# Checking a password runs the full PBKDF2 hasher (~100ms of CPU). During a
+# login burst that would pin every request worker and starve catalog
+# reads. Login verification therefore runs on a small dedicated pool:
+#
+#   - at most WORKERS hashes run at once (hashlib releases the GIL),
+#   - at most QUEUE_SIZE more wait for a worker,
+#   - anything beyond that is rejected right away with 429 + Retry-After
+#     instead of queueing up behind the burst.
+#
+# Settings: LOGIN_HASHING = {"WORKERS", "QUEUE_SIZE", "TIMEOUT", "RETRY_AFTER"}
+
+
+class LoginBusy(Throttled):
+    default_detail = "Too many logins in progress, please retry shortly."
+    default_code = "login_busy"
+
+
+class BoundedExecutor:
+    """
+    ThreadPoolExecutor that refuses work instead of queueing without limit.
+    """
+
+    def __init__(self, workers, queue_size, retry_after=1):
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="login-hashing"
+        )
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._retry_after = retry_after
+
+    def submit(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise LoginBusy(wait=self._retry_after)
+        try:
+            future = self._executor.submit(self._run, fn, args, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    @staticmethod
+    def _run(fn, args, kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # pool threads are not request threads, nobody else closes
+            # their DB connection according to CONN_MAX_AGE
+            close_old_connections()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_login_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BoundedExecutor(
+                    settings.LOGIN_HASHING["WORKERS"],
+                    settings.LOGIN_HASHING["QUEUE_SIZE"],
+                    retry_after=settings.LOGIN_HASHING["RETRY_AFTER"],
+                )
+    return _executor
+
+
+def run_bounded(fn, *args, **kwargs):
+    """
+    Run `fn` on the login pool and wait for it.
+    Raises LoginBusy (429) when the pool is saturated or too slow.
+    """
+    future = get_login_executor().submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=settings.LOGIN_HASHING["TIMEOUT"])
+    except FutureTimeoutError:
+        raise LoginBusy(wait=settings.LOGIN_HASHING["RETRY_AFTER"])
+
+
+async def arun_bounded(fn, *args, **kwargs):
+    """
+    Async variant of run_bounded for ASGI views: awaits the pool without
+    blocking the event loop.
+    """
+    future = get_login_executor().submit(fn, *args, **kwargs)
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), timeout=settings.LOGIN_HASHING["TIMEOUT"]
+        )
+    except asyncio.TimeoutError:
+        raise LoginBusy(wait=settings.LOGIN_HASHING["RETRY_AFTER"])
+
+
+def bounded_authenticate(request=None, **credentials):
+    return run_bounded(authenticate, request, **credentials)
+
+
+async def abounded_authenticate(request=None, **credentials):
+    return await arun_bounded(authenticate, request, **credentials)
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accountapp.models import User
+from accountapp.phone import try_normalize_phone
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill User.phone_normalized in pk batches. Among alive users that "
+        "normalize to the same number the oldest account keeps it; the others "
+        "stay NULL and are reported as collisions to be merged or soft "
+        "deleted by hand (until then they only log in with their phone typed "
+        "exactly as stored, every other spelling logs in the oldest account). "
+        "Invalid numbers are reported too."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="report only, write nothing"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+        # normalized number -> pk of the alive user that owns it
+        owners = dict(
+            User.all_objects.filter(
+                deleted_at__isnull=True, phone_normalized__isnull=False
+            ).values_list("phone_normalized", "pk")
+        )
+        filled = collisions = invalid = 0
+        last_pk = 0
+
+        while True:
+            rows = list(
+                User.all_objects.filter(phone_normalized__isnull=True, pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "phone", "deleted_at")[:batch_size]
+            )
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+
+            updates = []
+            for pk, phone, deleted_at in rows:
+                normalized = try_normalize_phone(phone)
+                if normalized is None:
+                    invalid += 1
+                    self.stdout.write(f"invalid   #{pk} {phone!r}")
+                    continue
+                if deleted_at is None:
+                    owner = owners.setdefault(normalized, pk)
+                    if owner != pk:
+                        collisions += 1
+                        self.stdout.write(
+                            f"collision #{pk} {phone!r} -> {normalized} "
+                            f"(kept by #{owner})"
+                        )
+                        continue
+                updates.append(User(pk=pk, phone_normalized=normalized))
+
+            if updates and not dry_run:
+                with transaction.atomic():
+                    User.all_objects.bulk_update(updates, ["phone_normalized"])
+            filled += len(updates)
+
+        self.stdout.write(
+            f"{'would fill' if dry_run else 'filled'} {filled}, "
+            f"collisions {collisions}, invalid {invalid}"
+        )
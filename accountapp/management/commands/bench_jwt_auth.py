@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountapp.authentication import CachedJWTAuthentication
+from accountapp.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Authenticate the same Bearer token N times with simplejwt's "
+        "JWTAuthentication and with CachedJWTAuthentication, reading "
+        "request.user.is_staff like a permission check would, and print "
+        "DB queries and time per request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument(
+            "--phone", help="user to authenticate (default: first active user)"
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options["phone"]:
+            users = users.filter(phone=options["phone"])
+        user = users.order_by("pk").first()
+        if user is None:
+            raise CommandError("No active user to authenticate")
+
+        header = f"Bearer {AccessToken.for_user(user)}"
+        factory = RequestFactory()
+
+        for backend in (JWTAuthentication(), CachedJWTAuthentication()):
+            # warm up (fills the snapshot cache)
+            self._authenticate(backend, factory, header)
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(options["requests"]):
+                    self._authenticate(backend, factory, header)
+                elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f"{type(backend).__name__:<26} "
+                f"{len(queries) / options['requests']:.2f} queries/request  "
+                f"{elapsed / options['requests'] * 1e6:.0f} µs/request"
+            )
+
+    def _authenticate(self, backend, factory, header):
+        request = Request(factory.get("/", HTTP_AUTHORIZATION=header))
+        user, _ = backend.authenticate(request)
+        return user.is_staff
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from accountapp.services.onboarding import (
+    DEFAULT_CHUNK_SIZE,
+    import_roster,
+    read_roster,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a school roster (CSV with a header row, or JSONL) of students "
+        "and parents: users, roles, profiles and guardian links, in bulk. "
+        "Phones that already exist are skipped, so re-running is safe. "
+        "See accountapp.services.onboarding for the columns."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "jsonl"])
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="password hashing processes (default: one per CPU)",
+        )
+
+    def handle(self, *args, **options):
+        def progress(result):
+            self.stdout.write(
+                f"{result.rows} rows, {result.created} created "
+                f"({result.rows_per_second:.0f} rows/s)"
+            )
+
+        result = import_roster(
+            read_roster(options["path"], options["format"]),
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            on_chunk=progress,
+        )
+
+        for line, message in result.errors:
+            self.stderr.write(f"line {line}: {message}" if line else message)
+        self.stdout.write(
+            f"{result.rows} rows in {result.seconds:.1f}s "
+            f"({result.rows_per_second:.0f} rows/s): {result.created} created, "
+            f"{result.existing} already existed, {result.links} guardian links, "
+            f"{len(result.errors)} errors"
+        )
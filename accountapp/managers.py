@@ -1,6 +1,23 @@
 # accounts/managers.py
 from django.contrib.auth.base_user import BaseUserManager
 
+from accountapp.phone import normalize_phone, try_normalize_phone
+from accountapp.roles import masks_with_all, masks_with_any, roles_to_mask
+from sharedapp.managers import SoftDeleteQuerySet
+
+
+class UserQuerySet(SoftDeleteQuerySet):
+    """
+    Role filters on the precomputed User.role_mask: one indexed
+    `role_mask IN (...)` condition, no join on UserRole.
+    """
+
+    def with_any_role(self, *roles):
+        return self.filter(role_mask__in=masks_with_any(roles_to_mask(roles)))
+
+    def with_all_roles(self, *roles):
+        return self.filter(role_mask__in=masks_with_all(roles_to_mask(roles)))
+
 
 class UserManager(BaseUserManager):
     """
@@ -12,7 +29,9 @@ class UserManager(BaseUserManager):
         if not phone:
             raise ValueError("Phone is required")
 
-        phone = phone.strip()
+        # raises InvalidPhone (a ValueError); "+8801...", "8801..." and
+        # "01..." are the same number and so the same user
+        phone = normalize_phone(phone)
         user = self.model(phone=phone, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
@@ -28,4 +47,20 @@ class UserManager(BaseUserManager):
         if extra_fields.get("is_superuser") is not True:
             raise ValueError("Superuser must have is_superuser=True")
 
-        return self.create_user(phone, password, **extra_fields)
\ No newline at end of file
+        return self.create_user(phone, password, **extra_fields)
+
+    def get_by_natural_key(self, username):
+        # one equality on uniq_user_phone_normalized (alive only, so a
+        # soft-deleted user with the same phone must not match / log in);
+        # a value that isn't a phone number can only match a legacy raw phone
+        normalized = try_normalize_phone(username)
+        if normalized is not None:
+            try:
+                return self.get(phone_normalized=normalized, deleted_at__isnull=True)
+            except self.model.DoesNotExist:
+                pass
+        # accounts without a normalized number (invalid or colliding
+        # phones) still log in with their phone as stored
+        return self.get(
+            phone=username, phone_normalized__isnull=True, deleted_at__isnull=True
+        )
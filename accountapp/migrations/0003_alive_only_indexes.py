@@ -0,0 +1,55 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accountapp", "0002_alter_user_avatar_alter_user_picture_height_and_more"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="userrole",
+            name="uniq_user_role",
+        ),
+        migrations.RemoveIndex(
+            model_name="userrole",
+            name="accountapp__role_38bb7a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="userrole",
+            name="accountapp__user_id_bd7586_idx",
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="phone",
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name="userrole",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["role"],
+                name="userrole_role_alive_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("phone",),
+                name="uniq_user_phone",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="userrole",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("user", "role"),
+                name="uniq_user_role",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:41
+
+from django.db import migrations, models
+
+# keep in sync with accountapp.roles.ROLE_BITS at the time of this migration
+ROLE_BITS = {"student": 1, "parent": 2, "teacher": 4, "admin": 8}
+
+
+def backfill_role_mask(apps, schema_editor):
+    User = apps.get_model("accountapp", "User")
+    UserRole = apps.get_model("accountapp", "UserRole")
+
+    masks = {}
+    alive_roles = UserRole.objects.filter(deleted_at__isnull=True)
+    for user_id, role in alive_roles.values_list("user_id", "role").iterator():
+        masks[user_id] = masks.get(user_id, 0) | ROLE_BITS[role]
+
+    users_by_mask = {}
+    for user_id, mask in masks.items():
+        users_by_mask.setdefault(mask, []).append(user_id)
+    for mask, user_ids in users_by_mask.items():
+        User.objects.filter(pk__in=user_ids).update(role_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accountapp", "0003_alive_only_indexes"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="role_mask",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["role_mask"],
+                name="user_role_mask_alive_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_role_mask, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accountapp", "0004_user_role_mask"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="phone_normalized",
+            field=models.CharField(
+                blank=True, editable=False, max_length=16, null=True
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("phone_normalized",),
+                name="uniq_user_phone_normalized",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-17 02:10
+
+from django.db import migrations
+
+from accountapp.phone import try_normalize_phone
+
+
+def backfill_phone_normalized(apps, schema_editor):
+    # same rules as `manage.py backfill_phone_normalized`: among alive users
+    # with the same number the oldest account keeps it, the others (and
+    # invalid numbers) stay NULL and log in with their raw phone
+    User = apps.get_model("accountapp", "User")
+    users = User._base_manager  # every row, soft deleted too
+    owners = dict(
+        users.filter(
+            deleted_at__isnull=True, phone_normalized__isnull=False
+        ).values_list("phone_normalized", "pk")
+    )
+    rows = (
+        users.filter(phone_normalized__isnull=True)
+        .order_by("pk")
+        .values_list("pk", "phone", "deleted_at")
+    )
+    updates = []
+    for pk, phone, deleted_at in rows.iterator(chunk_size=1000):
+        normalized = try_normalize_phone(phone)
+        if normalized is None:
+            continue
+        if deleted_at is None and owners.setdefault(normalized, pk) != pk:
+            continue
+        updates.append(User(pk=pk, phone_normalized=normalized))
+    users.bulk_update(updates, ["phone_normalized"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accountapp", "0005_user_phone_normalized"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_phone_normalized, migrations.RunPython.noop),
+    ]
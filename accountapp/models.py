@@ -1,15 +1,27 @@
 # accounts/models.py
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from pictures.models import PictureField
 
 from sharedapp.managers import AllObjectsManager, SoftDeleteManager
-from sharedapp.models import TimeStampedSoftDeleteModel
-from .managers import UserManager
+from sharedapp.models import TimeStampedSoftDeleteModel, alive_index, alive_unique
+from .enums import Role
+from .managers import UserManager, UserQuerySet
+from .phone import try_normalize_phone
+from .roles import mask_has_role, roles_to_mask
 
 
 class User(TimeStampedSoftDeleteModel, AbstractBaseUser, PermissionsMixin):
-    phone = models.CharField(max_length=20, unique=True, db_index=True)
+    # unique among alive users only, see Meta
+    phone = models.CharField(max_length=20)
+    # E.164 form of `phone` (accountapp.phone), unique among alive users;
+    # login / lookups use this column. NULL when `phone` is not a valid
+    # number, or on accounts left colliding with an older one by the
+    # backfill (migration 0006); new collisions are refused.
+    phone_normalized = models.CharField(
+        max_length=16, null=True, blank=True, editable=False
+    )
     email = models.EmailField(blank=True, null=True)
 
     full_name = models.CharField(max_length=120, blank=True)
@@ -27,6 +39,11 @@ class User(TimeStampedSoftDeleteModel, AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
 
+    # bitmask of the user's alive UserRole rows (accountapp.roles.ROLE_BITS),
+    # maintained by accountapp.signals and recomputed by save() -> role
+    # checks need no query
+    role_mask = models.PositiveSmallIntegerField(default=0, editable=False)
+
     USERNAME_FIELD = "phone"
     REQUIRED_FIELDS = []
 
@@ -36,18 +53,69 @@ class User(TimeStampedSoftDeleteModel, AbstractBaseUser, PermissionsMixin):
     #
     # So we attach BOTH:
     base_objects = UserManager()  # for creates (Django uses this)
-    objects = SoftDeleteManager()  # alive only
-    all_objects = AllObjectsManager()  # includes deleted
+    objects = SoftDeleteManager.from_queryset(UserQuerySet)()  # alive only
+    all_objects = AllObjectsManager.from_queryset(UserQuerySet)()  # includes deleted
+
+    class Meta:
+        constraints = [
+            alive_unique("phone", name="uniq_user_phone"),
+            alive_unique("phone_normalized", name="uniq_user_phone_normalized"),
+        ]
+        indexes = [alive_index("role_mask", name="user_role_mask_alive_idx")]
 
     def __str__(self):
         return self.full_name or self.phone
 
-
-class Role(models.TextChoices):
-    STUDENT = "student", "Student"
-    PARENT = "parent", "Parent"
-    TEACHER = "teacher", "Teacher"
-    ADMIN = "admin", "Admin"
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "phone" in update_fields:
+            self.phone_normalized = self._phone_normalized()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "phone_normalized"}
+        if not self._state.adding and (
+            update_fields is None or "role_mask" in update_fields
+        ):
+            # the instance may predate a UserRole change (the signals only
+            # update the row), don't write its stale mask back
+            self.role_mask = roles_to_mask(
+                UserRole.objects.filter(user_id=self.pk).values_list("role", flat=True)
+            )
+        super().save(*args, **kwargs)
+
+    def _phone_normalized(self):
+        normalized = try_normalize_phone(self.phone)
+        if (
+            normalized is None
+            or normalized == self.phone_normalized
+            or self.deleted_at is not None
+        ):
+            return normalized
+        taken = (
+            User.all_objects.filter(
+                phone_normalized=normalized, deleted_at__isnull=True
+            )
+            .exclude(pk=self.pk)
+            .exists()
+        )
+        if not taken:
+            return normalized
+        # an account the backfill left NULL (its number was already taken)
+        # keeps saving as long as its phone does not change
+        if not self._state.adding:
+            stored = (
+                User.all_objects.filter(pk=self.pk)
+                .values_list("phone", "phone_normalized")
+                .first()
+            )
+            if stored == (self.phone, None):
+                return None
+        raise ValidationError(
+            {"phone": "A user with this phone number already exists."},
+            code="unique",
+        )
+
+    def has_role(self, role):
+        return mask_has_role(self.role_mask, role)
 
 
 class UserRole(TimeStampedSoftDeleteModel):
@@ -55,12 +123,9 @@ class UserRole(TimeStampedSoftDeleteModel):
     role = models.CharField(max_length=20, choices=Role.choices)
 
     class Meta:
-        constraints = [
-            models.UniqueConstraint(fields=["user", "role"], name="uniq_user_role")
-        ]
+        constraints = [alive_unique("user", "role", name="uniq_user_role")]
         indexes = [
-            models.Index(fields=["role"]),
-            models.Index(fields=["user", "role"]),
+            alive_index("role", name="userrole_role_alive_idx"),
         ]
 
 
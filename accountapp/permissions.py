@@ -0,0 +1,44 @@
+from rest_framework.permissions import BasePermission
+
+from accountapp.enums import Role
+from accountapp.roles import roles_to_mask
+
+
+class HasRole(BasePermission):
+    """
+    Allows authenticated users having ANY of `roles`.
+
+    Reads request.user.role_mask only (part of the cached auth snapshot),
+    so the check costs no query.
+    """
+
+    roles = ()
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        return bool(getattr(user, "role_mask", 0) & roles_to_mask(self.roles))
+
+
+class IsStudent(HasRole):
+    roles = (Role.STUDENT,)
+
+
+class IsParent(HasRole):
+    roles = (Role.PARENT,)
+
+
+class IsTeacher(HasRole):
+    roles = (Role.TEACHER,)
+
+
+class IsAdminRole(HasRole):
+    roles = (Role.ADMIN,)
+
+
+def has_any_role(*roles):
+    """
+    permission_classes = [has_any_role(Role.TEACHER, Role.ADMIN)]
+    """
+    return type("HasAnyRole", (HasRole,), {"roles": roles})
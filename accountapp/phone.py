@@ -0,0 +1,58 @@
+import re
+
+from django.conf import settings
+
+# -----------------------------
+# Phone normalization
+# -----------------------------
+#
+# Every spelling of a number ("+880 1712-345678", "8801712345678",
+# "01712345678", "1712345678") maps to one E.164 string ("+8801712345678"),
+# stored in User.phone_normalized, so login and lookups are a single
+# equality on a unique index.
+#
+# Numbers without an international prefix are read as national numbers of
+# settings.PHONE_DEFAULT_COUNTRY_CODE (leading trunk "0" dropped).
+
+_SEPARATORS = re.compile(r"[\s\-().]")
+E164_MAX_DIGITS = 15
+E164_MIN_DIGITS = 8
+
+
+class InvalidPhone(ValueError):
+    pass
+
+
+def normalize_phone(raw, country_code=None):
+    """
+    E.164 form of `raw`, raises InvalidPhone when it can't be one.
+    """
+    country_code = country_code or settings.PHONE_DEFAULT_COUNTRY_CODE
+    value = _SEPARATORS.sub("", str(raw or ""))
+
+    if value.startswith("+"):
+        digits = value[1:]
+    elif value.startswith("00"):
+        digits = value[2:]
+    elif value.startswith("0"):
+        digits = country_code + value[1:]
+    elif value.startswith(country_code):
+        digits = value
+    else:
+        digits = country_code + value
+
+    if not digits.isdigit() or not (
+        E164_MIN_DIGITS <= len(digits) <= E164_MAX_DIGITS
+    ):
+        raise InvalidPhone(f"Invalid phone number: {raw!r}")
+    return f"+{digits}"
+
+
+def try_normalize_phone(raw, country_code=None):
+    """
+    `normalize_phone` that returns None instead of raising.
+    """
+    try:
+        return normalize_phone(raw, country_code)
+    except InvalidPhone:
+        return None
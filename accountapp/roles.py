@@ -0,0 +1,37 @@
+from accountapp.enums import Role
+
+# One bit per Role, a user's roles fit in one small integer
+# (User.role_mask, kept in sync with UserRole by accountapp.signals).
+ROLE_BITS = {
+    Role.STUDENT: 1 << 0,
+    Role.PARENT: 1 << 1,
+    Role.TEACHER: 1 << 2,
+    Role.ADMIN: 1 << 3,
+}
+ALL_ROLES_MASK = sum(ROLE_BITS.values())
+
+
+def roles_to_mask(roles):
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS[role]
+    return mask
+
+
+def mask_has_role(mask, role):
+    return bool(mask & ROLE_BITS[role])
+
+
+def masks_with_any(mask):
+    """
+    Every possible role_mask sharing at least one bit with `mask`.
+
+    There are only 2**len(Role) masks, so "has any of these roles" becomes
+    `role_mask IN (...)`, which an index on role_mask can answer
+    (a bitwise AND in the WHERE clause cannot).
+    """
+    return [value for value in range(ALL_ROLES_MASK + 1) if value & mask]
+
+
+def masks_with_all(mask):
+    return [value for value in range(ALL_ROLES_MASK + 1) if value & mask == mask]
@@ -0,0 +1,278 @@
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.db import transaction
+from django.utils import timezone
+
+from accountapp.enums import Role
+from accountapp.models import ParentProfile, StudentProfile, User, UserRole
+from accountapp.phone import try_normalize_phone
+from accountapp.roles import ROLE_BITS
+from accountapp.services.passwords import hash_passwords, init_worker
+from relationshipapp.models import GuardianRelationship, GuardianRelationshipStatus
+from relationshipapp.services.access import access_map_key
+from sharedapp.cache import delete_on_commit
+
+# -----------------------------
+# Roster import (school onboarding)
+# -----------------------------
+#
+# Rows are streamed from CSV / JSONL and written per chunk with a handful
+# of bulk_create calls (users, roles, profiles) instead of one save() and
+# a few signals per user. Password hashing, the expensive part, runs in a
+# process pool so every core works on it (accountapp.services.passwords).
+#
+# Idempotent on the normalized phone: a phone that already belongs to an
+# alive user (or appeared earlier in the file) is skipped, so a roster can
+# simply be imported again after a failure.
+#
+# bulk_create skips save() and the signals, so User.phone_normalized and
+# User.role_mask are filled here, and the access maps of parents that get
+# new links are dropped explicitly.
+#
+# Columns: phone, role (student|parent), full_name, email, password,
+#   students: grade, school_name, date_of_birth (YYYY-MM-DD),
+#             parent_phone, relation_label (ACTIVE guardian link)
+#   parents:  occupation, address
+
+IMPORT_ROLES = (Role.STUDENT, Role.PARENT)
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    created: int = 0
+    existing: int = 0
+    links: int = 0
+    errors: list = field(default_factory=list)  # (line, message)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def read_roster(path, fmt=None):
+    """
+    Yield (line number, row) from a .csv or .jsonl file, one row at a
+    time. JSONL lines are yielded undecoded: `_parse` decodes them, so a
+    malformed line is a row error like any other.
+    """
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            # line 1 is the header
+            yield from enumerate(csv.DictReader(f), start=2)
+        else:
+            for line, text in enumerate(f, start=1):
+                if text.strip():
+                    yield line, text
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _clean(value):
+    return str(value).strip() if value is not None else ""
+
+
+def _parse(line, row):
+    """
+    Validated import row, raises ValueError with a readable message.
+    `row` is a dict (CSV) or the text of a JSONL line.
+    """
+    if isinstance(row, str):
+        try:
+            row = json.loads(row)
+        except ValueError as exc:
+            raise ValueError(f"invalid JSON: {exc}") from exc
+        if type(row) is not dict:
+            raise ValueError("expected a JSON object")
+    phone = try_normalize_phone(_clean(row.get("phone")))
+    if phone is None:
+        raise ValueError(f"invalid phone {row.get('phone')!r}")
+    role = _clean(row.get("role")).lower()
+    if role not in IMPORT_ROLES:
+        raise ValueError(f"role must be one of {', '.join(IMPORT_ROLES)}")
+
+    parent_phone = None
+    if _clean(row.get("parent_phone")):
+        if role != Role.STUDENT:
+            raise ValueError("parent_phone is only allowed on student rows")
+        parent_phone = try_normalize_phone(_clean(row["parent_phone"]))
+        if parent_phone is None:
+            raise ValueError(f"invalid parent_phone {row['parent_phone']!r}")
+
+    date_of_birth = None
+    if _clean(row.get("date_of_birth")):
+        date_of_birth = date.fromisoformat(_clean(row["date_of_birth"]))
+
+    return {
+        "line": line,
+        "phone": phone,
+        "role": role,
+        "full_name": _clean(row.get("full_name")),
+        "email": _clean(row.get("email")) or None,
+        "password": _clean(row.get("password")) or None,
+        "grade": _clean(row.get("grade")),
+        "school_name": _clean(row.get("school_name")),
+        "date_of_birth": date_of_birth,
+        "occupation": _clean(row.get("occupation")),
+        "address": _clean(row.get("address")),
+        "parent_phone": parent_phone,
+        "relation_label": _clean(row.get("relation_label")),
+    }
+
+
+def _create_users(rows, hashes):
+    users = User.all_objects.bulk_create(
+        [
+            User(
+                phone=row["phone"],
+                phone_normalized=row["phone"],
+                full_name=row["full_name"],
+                email=row["email"],
+                password=password,
+                role_mask=ROLE_BITS[row["role"]],
+            )
+            for row, password in zip(rows, hashes)
+        ]
+    )
+    UserRole.all_objects.bulk_create(
+        [UserRole(user=user, role=row["role"]) for row, user in zip(rows, users)]
+    )
+    StudentProfile.all_objects.bulk_create(
+        [
+            StudentProfile(
+                user=user,
+                current_grade_label=row["grade"],
+                school_name=row["school_name"],
+                date_of_birth=row["date_of_birth"],
+            )
+            for row, user in zip(rows, users)
+            if row["role"] == Role.STUDENT
+        ]
+    )
+    ParentProfile.all_objects.bulk_create(
+        [
+            ParentProfile(
+                user=user, occupation=row["occupation"], address_text=row["address"]
+            )
+            for row, user in zip(rows, users)
+            if row["role"] == Role.PARENT
+        ]
+    )
+
+
+def _create_links(links, result):
+    """
+    ACTIVE guardian links for (student phone, parent phone, label), skipping
+    pairs that are already linked or whose parent is unknown.
+    """
+    phones = {phone for student, parent, _ in links for phone in (student, parent)}
+    ids = dict(
+        User.objects.filter(phone_normalized__in=phones).values_list(
+            "phone_normalized", "pk"
+        )
+    )
+    existing = set(
+        GuardianRelationship.objects.filter(
+            student_id__in=[ids[student] for student, _, _ in links if student in ids]
+        ).values_list("parent_id", "student_id")
+    )
+
+    now = timezone.now()
+    new_links = []
+    for student, parent, label in links:
+        if parent not in ids or student not in ids:
+            result.errors.append((None, f"unknown parent {parent} for {student}"))
+            continue
+        pair = (ids[parent], ids[student])
+        if pair in existing:
+            continue
+        existing.add(pair)
+        new_links.append(
+            GuardianRelationship(
+                parent_id=pair[0],
+                student_id=pair[1],
+                status=GuardianRelationshipStatus.ACTIVE,
+                requested_at=now,
+                responded_at=now,
+                relation_label=label,
+            )
+        )
+
+    with transaction.atomic():
+        GuardianRelationship.all_objects.bulk_create(new_links)
+        delete_on_commit({access_map_key(link.parent_id) for link in new_links})
+    result.links += len(new_links)
+
+
+def import_roster(rows, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, on_chunk=None):
+    """
+    Import (line, row dict) pairs, e.g. from `read_roster`.
+
+    Users, roles and profiles are committed per chunk; guardian links are
+    created at the end, when every parent of the file exists.
+    `on_chunk(result)` is called after every chunk (progress output).
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    seen = set()
+    links = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        for chunk in _chunks(rows, chunk_size):
+            parsed = []
+            for line, row in chunk:
+                result.rows += 1
+                try:
+                    row = _parse(line, row)
+                except ValueError as exc:
+                    result.errors.append((line, str(exc)))
+                    continue
+                if row["phone"] in seen:
+                    result.errors.append((line, f"duplicate phone {row['phone']}"))
+                    continue
+                seen.add(row["phone"])
+                parsed.append(row)
+                if row["parent_phone"]:
+                    links.append(
+                        (row["phone"], row["parent_phone"], row["relation_label"])
+                    )
+
+            existing = set(
+                User.objects.filter(
+                    phone_normalized__in=[row["phone"] for row in parsed]
+                ).values_list("phone_normalized", flat=True)
+            )
+            new_rows = [row for row in parsed if row["phone"] not in existing]
+            hashes = hash_passwords(pool, [row["password"] for row in new_rows])
+
+            with transaction.atomic():
+                _create_users(new_rows, hashes)
+            result.created += len(new_rows)
+            result.existing += len(parsed) - len(new_rows)
+
+            result.seconds = time.perf_counter() - started
+            if on_chunk:
+                on_chunk(result)
+
+    for chunk in _chunks(links, chunk_size):
+        _create_links(chunk, result)
+
+    result.seconds = time.perf_counter() - started
+    return result
@@ -0,0 +1,30 @@
+import django
+from django.contrib.auth.hashers import make_password
+
+# -----------------------------
+# Password hashing pool tasks
+# -----------------------------
+#
+# Functions a ProcessPoolExecutor ships to its workers by reference, so a
+# spawn / forkserver worker imports this module before Django is set up:
+# it must not import models (directly or through another module).
+
+
+def init_worker():
+    # settings come from DJANGO_SETTINGS_MODULE, inherited by the worker
+    django.setup()
+
+
+def hash_passwords(pool, passwords):
+    """
+    Hashes of `passwords` in order, computed on `pool` (a process pool
+    started with `init_worker`). Empty passwords get an unusable one.
+    """
+    # make_password(None) is an unusable password, no need to ship it
+    to_hash = [password for password in passwords if password]
+    hashed = iter(
+        pool.map(make_password, to_hash, chunksize=max(1, len(to_hash) // 64))
+        if to_hash
+        else ()
+    )
+    return [next(hashed) if password else make_password(None) for password in passwords]
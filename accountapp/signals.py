@@ -0,0 +1,67 @@
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accountapp.authentication import user_snapshot_key
+from accountapp.models import User, UserRole
+from accountapp.roles import roles_to_mask
+from sharedapp.cache import delete_on_commit
+from sharedapp.signals import bulk_restored, bulk_soft_deleted
+
+
+def sync_role_masks(user_ids, roles):
+    """
+    Write User.role_mask for `user_ids` from `roles` (their alive
+    (user_id, role) pairs): one UPDATE per distinct mask.
+    """
+    roles_by_user = {user_id: [] for user_id in user_ids}
+    for user_id, role in roles:
+        roles_by_user[user_id].append(role)
+
+    users_by_mask = {}
+    for user_id, user_roles in roles_by_user.items():
+        users_by_mask.setdefault(roles_to_mask(user_roles), []).append(user_id)
+    for mask, ids in users_by_mask.items():
+        User.all_objects.filter(pk__in=ids).update(role_mask=mask)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_user_snapshot(sender, instance, **kwargs):
+    # save() also covers soft delete / restore
+    delete_on_commit([user_snapshot_key(instance.pk)])
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def sync_role_mask_on_role_change(sender, instance, **kwargs):
+    # save() also covers soft delete / restore
+    roles = UserRole.objects.filter(user_id=instance.user_id).values_list(
+        "user_id", "role"
+    )
+    sync_role_masks([instance.user_id], roles)
+    delete_on_commit([user_snapshot_key(instance.user_id)])
+
+
+@receiver(bulk_soft_deleted)
+@receiver(bulk_restored)
+def sync_on_bulk_update(sender, queryset, signal, **kwargs):
+    if sender is User:
+        delete_on_commit(
+            [user_snapshot_key(pk) for pk in queryset.values_list("pk", flat=True)]
+        )
+        return
+    if sender is not UserRole:
+        return
+
+    # sent before the UPDATE: work out the roles as they will be after it
+    user_ids = list(queryset.values_list("user_id", flat=True).distinct())
+    if signal is bulk_soft_deleted:
+        roles = UserRole.objects.exclude(pk__in=queryset.values("pk"))
+    else:
+        roles = UserRole.all_objects.filter(
+            Q(deleted_at__isnull=True) | Q(pk__in=queryset.values("pk"))
+        )
+    roles = roles.filter(user_id__in=user_ids)
+    sync_role_masks(user_ids, roles.values_list("user_id", "role"))
+    delete_on_commit([user_snapshot_key(user_id) for user_id in user_ids])
@@ -1,3 +1,78 @@
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 
-# Create your tests here.
+from accountapp.enums import Role
+from accountapp.models import User, UserRole
+
+
+class RoleMaskTests(TestCase):
+    def setUp(self):
+        self.user = User.base_objects.create_user("01700000000", "pass")
+
+    def test_role_change_sets_the_mask(self):
+        UserRole.objects.create(user=self.user, role=Role.STUDENT)
+
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.has_role(Role.STUDENT))
+
+    def test_save_of_a_stale_instance_keeps_the_mask(self):
+        UserRole.objects.create(user=self.user, role=Role.STUDENT)
+
+        # self.user was loaded before the role existed
+        self.user.full_name = "Student"
+        self.user.save()
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.has_role(Role.STUDENT))
+        self.assertEqual(self.user.full_name, "Student")
+
+    def test_save_after_role_removal_clears_the_mask(self):
+        role = UserRole.objects.create(user=self.user, role=Role.PARENT)
+        self.user.refresh_from_db()
+        role.delete()
+
+        self.user.save()
+
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.has_role(Role.PARENT))
+
+
+class PhoneCollisionTests(TestCase):
+    def setUp(self):
+        self.owner = User.base_objects.create_user("+8801722222222", "pass")
+
+    def test_same_number_in_another_spelling_is_refused(self):
+        with self.assertRaises(ValidationError):
+            User(phone="8801722222222").save()
+
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_changing_to_a_taken_number_is_refused(self):
+        other = User.base_objects.create_user("01733333333", "pass")
+
+        other.phone = "01722222222"
+        with self.assertRaises(ValidationError):
+            other.save()
+
+    def test_backfill_collision_still_saves(self):
+        legacy = User.base_objects.create_user("01733333333", "pass")
+        # as left by the backfill: same number as the owner, no normalized one
+        User.all_objects.filter(pk=legacy.pk).update(
+            phone="8801722222222", phone_normalized=None
+        )
+        legacy.refresh_from_db()
+
+        legacy.full_name = "Legacy"
+        legacy.save()
+
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.full_name, "Legacy")
+        self.assertIsNone(legacy.phone_normalized)
+
+    def test_number_of_a_deleted_user_can_be_reused(self):
+        self.owner.delete()
+
+        user = User.base_objects.create_user("01722222222", "pass")
+
+        self.assertEqual(user.phone_normalized, "+8801722222222")
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from contentapp.services.catalog import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+class CatalogQuerySerializer(serializers.Serializer):
+    # `next` from the previous page
+    after = serializers.IntegerField(min_value=0, required=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE
+    )
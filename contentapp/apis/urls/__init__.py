@@ -0,0 +1,7 @@
+from django.urls import path, include
+
+urlpatterns = [
+    path("/catalog", include("contentapp.apis.urls.catalog")),
+    path("/courses", include("contentapp.apis.urls.course")),
+    path("/lessons", include("contentapp.apis.urls.lesson")),
+]
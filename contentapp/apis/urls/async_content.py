@@ -0,0 +1,16 @@
+from django.urls import path
+
+from contentapp.apis.views import async_content
+
+
+urlpatterns = [
+    path(
+        "/catalog/<int:grade_id>/<int:subject_id>",
+        async_content.AsyncCatalogView.as_view(),
+    ),
+    path("/courses/<int:course_id>/tree", async_content.AsyncCourseTreeView.as_view()),
+    path(
+        "/lessons/<int:lesson_id>",
+        async_content.AsyncLessonContentView.as_view(),
+    ),
+]
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from contentapp.apis.views import catalog
+
+
+urlpatterns = [
+    path("/<int:grade_id>/<int:subject_id>", catalog.CatalogView.as_view()),
+]
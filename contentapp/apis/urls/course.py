@@ -0,0 +1,8 @@
+from django.urls import path
+
+from contentapp.apis.views import course
+
+
+urlpatterns = [
+    path("/<int:course_id>/tree", course.CourseTreeView.as_view()),
+]
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from contentapp.apis.views import lesson
+
+
+urlpatterns = [
+    path("/<int:lesson_id>", lesson.LessonContentView.as_view()),
+]
@@ -0,0 +1,59 @@
+from django.http import JsonResponse
+from django.views import View
+
+from contentapp.apis.serializers.catalog import CatalogQuerySerializer
+from contentapp.services.catalog import aget_catalog_page
+from contentapp.services.course_tree import aget_course_tree, aget_lesson_content
+
+# -----------------------------
+# Native async read endpoints
+# -----------------------------
+#
+# Same payloads as the DRF views in catalog.py / course.py / lesson.py, but
+# plain async Django views: under ASGI they run on the event loop instead
+# of a sync_to_async thread per request, so thousands of slow (mobile)
+# clients do not each hold a worker thread.
+#
+# DRF's APIView is sync only, so there is no DRF authentication/renderers
+# here; these endpoints are public and always answer JSON.
+
+
+def _not_found(detail):
+    return JsonResponse({"detail": detail}, status=404)
+
+
+class AsyncCatalogView(View):
+    http_method_names = ["get"]
+
+    async def get(self, request, grade_id, subject_id):
+        serializer = CatalogQuerySerializer(data=request.GET)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+
+        page = await aget_catalog_page(
+            grade_id,
+            subject_id,
+            after=serializer.validated_data.get("after"),
+            limit=serializer.validated_data["limit"],
+        )
+        return JsonResponse(page)
+
+
+class AsyncCourseTreeView(View):
+    http_method_names = ["get"]
+
+    async def get(self, request, course_id):
+        tree = await aget_course_tree(course_id)
+        if tree is None:
+            return _not_found("Course not found")
+        return JsonResponse(tree)
+
+
+class AsyncLessonContentView(View):
+    http_method_names = ["get"]
+
+    async def get(self, request, lesson_id):
+        lesson = await aget_lesson_content(lesson_id)
+        if lesson is None:
+            return _not_found("Lesson not found")
+        return JsonResponse(lesson)
@@ -0,0 +1,22 @@
+from rest_framework import status
+from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
+
+from contentapp.apis.serializers.catalog import CatalogQuerySerializer
+from contentapp.services.catalog import get_catalog_page
+
+
+class CatalogView(ListAPIView):
+    permission_classes = []  # public
+
+    def get(self, request, grade_id, subject_id, *args, **kwargs):
+        serializer = CatalogQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        page = get_catalog_page(
+            grade_id,
+            subject_id,
+            after=serializer.validated_data.get("after"),
+            limit=serializer.validated_data["limit"],
+        )
+        return Response(page, status=status.HTTP_200_OK)
@@ -0,0 +1,16 @@
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import RetrieveAPIView
+from rest_framework.response import Response
+
+from contentapp.services.course_tree import get_course_tree
+
+
+class CourseTreeView(RetrieveAPIView):
+    permission_classes = []  # public
+
+    def get(self, request, course_id, *args, **kwargs):
+        tree = get_course_tree(course_id)
+        if tree is None:
+            raise NotFound("Course not found")
+        return Response(tree, status=status.HTTP_200_OK)
@@ -0,0 +1,16 @@
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import RetrieveAPIView
+from rest_framework.response import Response
+
+from contentapp.services.course_tree import get_lesson_content
+
+
+class LessonContentView(RetrieveAPIView):
+    permission_classes = []  # public
+
+    def get(self, request, lesson_id, *args, **kwargs):
+        lesson = get_lesson_content(lesson_id)
+        if lesson is None:
+            raise NotFound("Lesson not found")
+        return Response(lesson, status=status.HTTP_200_OK)
@@ -2,4 +2,11 @@ from django.apps import AppConfig
 
 
 class ContentappConfig(AppConfig):
-    name = 'contentapp'
+    name = "contentapp"
+
+    def ready(self):
+        # cache invalidation receivers
+        from contentapp import signals  # noqa: F401
+        from contentapp.schemas import compile_schemas
+
+        compile_schemas()
@@ -0,0 +1,133 @@
+from django.core.cache import cache
+
+from contentapp.models import (
+    ContentBlock,
+    Course,
+    CoursePlacement,
+    GradeLevel,
+    Lesson,
+    Module,
+    Subject,
+)
+from sharedapp.cache import DEFAULT_TIMEOUT, delete_on_commit
+
+# -----------------------------
+# Content cache version keys
+# -----------------------------
+#
+#   catalog:v                    -> every catalog page (grade/subject renames)
+#   placement:{grade}:{subject}:v -> catalog pages of one grade · subject
+#   course:{id}:v                -> course outline + its lessons' content
+#   lesson:{id}:v                -> lesson content
+#
+# See sharedapp.cache for how the counters are used.
+
+CATALOG_VERSION_KEY = "catalog:v"
+
+
+def placement_version_key(grade_id, subject_id):
+    return f"placement:{grade_id}:{subject_id}:v"
+
+
+def course_version_key(course_id):
+    return f"course:{course_id}:v"
+
+
+def lesson_version_key(lesson_id):
+    return f"lesson:{lesson_id}:v"
+
+
+def _lesson_course_key(lesson_id):
+    return f"lesson:{lesson_id}:course"
+
+
+def lesson_course_id(lesson_id):
+    """
+    course id of a lesson, cached so a warm lesson read needs no DB.
+    Dropped by the signal handlers whenever the lesson is written or its
+    module moves to another course; the timeout bounds what a write they
+    do not see (queryset.update) can leave behind.
+    """
+    key = _lesson_course_key(lesson_id)
+    course_id = cache.get(key)
+    if course_id is None:
+        course_id = (
+            Lesson.all_objects.filter(pk=lesson_id)
+            .values_list("module__course_id", flat=True)
+            .first()
+        )
+        if course_id is not None:
+            cache.set(key, course_id, timeout=DEFAULT_TIMEOUT)
+    return course_id
+
+
+async def alesson_course_id(lesson_id):
+    key = _lesson_course_key(lesson_id)
+    course_id = await cache.aget(key)
+    if course_id is None:
+        course_id = await (
+            Lesson.all_objects.filter(pk=lesson_id)
+            .values_list("module__course_id", flat=True)
+            .afirst()
+        )
+        if course_id is not None:
+            await cache.aset(key, course_id, timeout=DEFAULT_TIMEOUT)
+    return course_id
+
+
+def forget_lesson_course_ids(lesson_ids):
+    # on commit: a read before it would cache the old course id again
+    delete_on_commit(_lesson_course_key(lesson_id) for lesson_id in lesson_ids)
+
+
+def version_keys_for(model, queryset):
+    """
+    Version keys touched by a write to the rows of `queryset`.
+
+    Must be called while the rows still match `queryset`
+    (i.e. before a soft delete / hard delete runs).
+    """
+    if model in (GradeLevel, Subject):
+        return [CATALOG_VERSION_KEY]
+
+    if model is CoursePlacement:
+        return [
+            placement_version_key(grade_id, subject_id)
+            for grade_id, subject_id in queryset.values_list("grade_id", "subject_id")
+        ]
+
+    if model is Course:
+        course_ids = list(queryset.values_list("pk", flat=True))
+        placements = CoursePlacement.all_objects.filter(
+            course_id__in=course_ids
+        ).values_list("grade_id", "subject_id")
+        return [course_version_key(course_id) for course_id in course_ids] + [
+            placement_version_key(grade_id, subject_id)
+            for grade_id, subject_id in placements
+        ]
+
+    if model is Module:
+        return [
+            course_version_key(course_id)
+            for course_id in queryset.values_list("course_id", flat=True).distinct()
+        ]
+
+    if model is Lesson:
+        keys = []
+        lesson_ids = []
+        for lesson_id, course_id in queryset.values_list("pk", "module__course_id"):
+            lesson_ids.append(lesson_id)
+            keys += [lesson_version_key(lesson_id), course_version_key(course_id)]
+        # the lesson may have moved to another module/course
+        forget_lesson_course_ids(lesson_ids)
+        return keys
+
+    if model is ContentBlock:
+        keys = []
+        for lesson_id, course_id in queryset.values_list(
+            "lesson_id", "lesson__module__course_id"
+        ).distinct():
+            keys += [lesson_version_key(lesson_id), course_version_key(course_id)]
+        return keys
+
+    return []
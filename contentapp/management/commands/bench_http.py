@@ -0,0 +1,118 @@
+import asyncio
+import math
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test running servers with many concurrent *slow* clients "
+        "(trickled request headers, small delayed reads, like a phone on a "
+        "bad mobile network) and print requests/sec and latency percentiles "
+        "per target. Start the servers first, e.g. "
+        "`gunicorn education_online_backend.wsgi -w 4 -b :8000` and "
+        "`uvicorn education_online_backend.asgi:application --workers 4 --port 8001`, "
+        "then run with "
+        "--target wsgi=http://127.0.0.1:8000/api/content/catalog/1/1 "
+        "--target asgi=http://127.0.0.1:8001/api/async/content/catalog/1/1"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target", action="append", required=True, help="name=url (repeatable)"
+        )
+        parser.add_argument("--clients", type=int, default=200)
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument(
+            "--send-delay",
+            type=float,
+            default=0.05,
+            help="seconds between request header lines",
+        )
+        parser.add_argument(
+            "--read-size", type=int, default=1024, help="bytes per read"
+        )
+        parser.add_argument(
+            "--read-delay", type=float, default=0.02, help="seconds between reads"
+        )
+        parser.add_argument("--timeout", type=float, default=30)
+
+    def handle(self, *args, **options):
+        for target in options["target"]:
+            name, sep, url = target.partition("=")
+            if not sep:
+                raise CommandError(f"--target must be name=url, got {target!r}")
+            result = asyncio.run(self._run(url, options))
+            self._report(name, result)
+
+    async def _run(self, url, options):
+        parts = urlsplit(url)
+        if parts.scheme != "http":
+            raise CommandError("Only plain http:// targets are supported")
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        header_lines = [
+            f"GET {path} HTTP/1.1\r\n",
+            f"Host: {parts.netloc}\r\n",
+            "Accept: application/json\r\n",
+            "Connection: close\r\n",
+            "\r\n",
+        ]
+        remaining = options["requests"]
+        latencies = []
+        errors = 0
+
+        async def client():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    ok = await asyncio.wait_for(
+                        self._request(parts, header_lines, options),
+                        timeout=options["timeout"],
+                    )
+                except (OSError, asyncio.TimeoutError):
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(options["clients"])))
+        return latencies, errors, time.perf_counter() - started
+
+    async def _request(self, parts, header_lines, options):
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        try:
+            # slow upload: the server has to wait for the full header
+            for line in header_lines:
+                writer.write(line.encode())
+                await writer.drain()
+                await asyncio.sleep(options["send_delay"])
+
+            # slow download: small reads with a pause in between
+            response = b""
+            while chunk := await reader.read(options["read_size"]):
+                response += chunk
+                await asyncio.sleep(options["read_delay"])
+        finally:
+            writer.close()
+        return response.startswith((b"HTTP/1.1 200", b"HTTP/1.0 200"))
+
+    def _report(self, name, result):
+        latencies, errors, elapsed = result
+        latencies.sort()
+
+        def percentile(p):
+            if not latencies:
+                return math.nan
+            return latencies[max(0, math.ceil(p * len(latencies)) - 1)] * 1000
+
+        self.stdout.write(
+            f"{name:<8} {len(latencies) / elapsed:8.1f} req/s  "
+            f"p50 {percentile(0.50):7.0f} ms  p99 {percentile(0.99):7.0f} ms  "
+            f"max {percentile(1.0):7.0f} ms  errors {errors}"
+        )
@@ -0,0 +1,166 @@
+import math
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from contentapp.enums import ContentBlockType
+from contentapp.schemas import clean_block_data
+from contentapp.services.grading import compile_quiz, encode_sheets, grade
+
+
+def _quiz(questions, choices, multi_share, rng):
+    data = {"questions": [], "pass_percent": 60}
+    for index in range(questions):
+        question = {
+            "prompt": f"Question {index + 1}",
+            "choices": [f"choice {c}" for c in range(choices)],
+            "points": rng.choice([1, 1, 2]),
+        }
+        if rng.random() < multi_share:
+            question["answers"] = sorted(rng.sample(range(choices), 2))
+        else:
+            question["answer"] = rng.randrange(choices)
+        data["questions"].append(question)
+    return clean_block_data(ContentBlockType.QUIZ, data)
+
+
+def _sheets(data, count, rng):
+    sheets = []
+    for _ in range(count):
+        # stronger students get more questions right (non-zero discrimination)
+        skill = rng.random()
+        sheet = []
+        for question in data["questions"]:
+            key = question.get("answers", question.get("answer"))
+            roll = rng.random()
+            if roll < 0.05:
+                sheet.append(None)
+            elif roll < 0.3 + 0.6 * skill:
+                sheet.append(key)
+            elif "answers" in question:
+                sheet.append(rng.sample(range(len(question["choices"])), 2))
+            else:
+                sheet.append(rng.randrange(len(question["choices"])))
+        sheets.append(sheet)
+    return sheets
+
+
+def _grade_python(data, sheets):
+    """
+    Reference: one sheet / question at a time, then the same
+    per-question statistics with plain Python.
+    """
+    questions = data["questions"]
+    scores, rights = [], []
+    for sheet in sheets:
+        score, right = 0, []
+        for question, answer in zip(questions, sheet):
+            if "answers" in question:
+                ok = isinstance(answer, list) and set(answer) == set(
+                    question["answers"]
+                )
+            else:
+                ok = answer == question["answer"]
+            right.append(ok)
+            if ok:
+                score += question.get("points", 1)
+        scores.append(score)
+        rights.append(right)
+
+    stats = []
+    for index, question in enumerate(questions):
+        column = [float(right[index]) for right in rights]
+        rest = [
+            score - value * question.get("points", 1)
+            for score, value in zip(scores, column)
+        ]
+        mean, rest_mean = statistics.fmean(column), statistics.fmean(rest)
+        covariance = sum((v - mean) * (r - rest_mean) for v, r in zip(column, rest))
+        spread = math.sqrt(
+            sum((v - mean) ** 2 for v in column)
+            * sum((r - rest_mean) ** 2 for r in rest)
+        )
+        stats.append((mean, covariance / spread if spread else None))
+    return scores, stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Grade a batch of random answer sheets of a generated quiz, one sheet "
+        "at a time in Python and vectorized (contentapp.services.grading), "
+        "and compare the throughput."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--submissions", type=int, default=10_000)
+        parser.add_argument("--questions", type=int, default=30)
+        parser.add_argument("--choices", type=int, default=4)
+        parser.add_argument(
+            "--multi-share",
+            type=float,
+            default=0.2,
+            help="share of multi-select questions (0 = all single choice)",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        data = _quiz(
+            options["questions"], options["choices"], options["multi_share"], rng
+        )
+        sheets = _sheets(data, options["submissions"], rng)
+
+        started = time.perf_counter()
+        expected, expected_stats = _grade_python(data, sheets)
+        python_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        quiz = compile_quiz(data)
+        compile_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        picked = encode_sheets(quiz, sheets)
+        encode_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = grade(quiz, picked)
+        grade_seconds = time.perf_counter() - started
+
+        if result.scores.tolist() != expected:
+            raise AssertionError("vectorized scores differ from the Python loop")
+        for stats, (difficulty, discrimination) in zip(
+            result.question_stats(), expected_stats
+        ):
+            if stats["difficulty"] != round(difficulty, 4) or (
+                stats["discrimination"]
+                != (None if discrimination is None else round(discrimination, 4))
+            ):
+                raise AssertionError("vectorized statistics differ")
+
+        count = len(sheets)
+        vector_seconds = encode_seconds + grade_seconds
+        self.stdout.write(
+            f"{count} sheets x {quiz.question_count} questions, "
+            f"{int(quiz.multi.sum())} multi-select"
+        )
+        self.stdout.write(
+            f"python loop: {python_seconds * 1000:.1f} ms, scores + stats "
+            f"({count / python_seconds:.0f} sheets/s)"
+        )
+        self.stdout.write(
+            f"vectorized:  {vector_seconds * 1000:.1f} ms "
+            f"({count / vector_seconds:.0f} sheets/s) = "
+            f"encode {encode_seconds * 1000:.1f} ms + grade + stats "
+            f"{grade_seconds * 1000:.1f} ms, compile {compile_seconds * 1000:.2f} ms "
+            f"(once per quiz version)"
+        )
+        self.stdout.write(
+            f"mean {result.percent.mean():.1f}%, {result.passed.mean():.0%} passed"
+        )
+        for stats in result.question_stats()[:5]:
+            self.stdout.write(
+                f"  question {stats['question']}: difficulty {stats['difficulty']}, "
+                f"discrimination {stats['discrimination']}"
+            )
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from contentapp.cache import version_keys_for
+from contentapp.models import ContentBlock
+from contentapp.payloads import load_payloads
+from contentapp.schemas import DERIVED, block_data_errors, clean_block_data
+from sharedapp.cache import bump_versions_on_commit
+
+
+class Command(BaseCommand):
+    help = (
+        "Validate every ContentBlock.data (soft deleted blocks included) "
+        "against its block_type schema (contentapp.schemas). Rows written "
+        "before the schemas existed may not pass, and then fail on their "
+        "next save(). With --repair, stale derived keys are recomputed and "
+        "invalid blocks are deactivated (is_active=False) so learners do not "
+        "get them, until an editor fixes their data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        invalid, derived = [], []
+        queryset = ContentBlock.all_objects.only("pk", "block_type", "data")
+        batch = []
+        for block in queryset.order_by("pk").iterator(chunk_size=options["batch_size"]):
+            batch.append(block)
+            if len(batch) >= options["batch_size"]:
+                self._check(batch, invalid, derived)
+                batch = []
+        self._check(batch, invalid, derived)
+
+        for block, errors in invalid:
+            self.stdout.write(
+                f"block {block.pk} ({block.block_type}): {'; '.join(errors)}"
+            )
+        self.stdout.write(
+            f"{len(invalid)} invalid blocks, {len(derived)} with stale derived keys"
+        )
+        if not options["repair"]:
+            return
+
+        # valid payloads: a normal save (externalization, cache versions)
+        for block in derived:
+            block.save(update_fields=["data"])
+        # invalid ones: a plain UPDATE, save() would reject them
+        invalid_blocks = ContentBlock.all_objects.filter(
+            pk__in=[block.pk for block, _ in invalid], is_active=True
+        )
+        with transaction.atomic():
+            bump_versions_on_commit(version_keys_for(ContentBlock, invalid_blocks))
+            deactivated = invalid_blocks.update(
+                is_active=False, updated_at=timezone.now()
+            )
+        self.stdout.write(
+            f"repaired {len(derived)} derived keys, deactivated {deactivated} blocks"
+        )
+
+    def _check(self, blocks, invalid, derived):
+        load_payloads(blocks)
+        for block in blocks:
+            errors = block_data_errors(block.block_type, block.data)
+            if errors:
+                invalid.append((block, errors))
+            elif block.block_type in DERIVED:
+                cleaned = clean_block_data(block.block_type, block.data)
+                if cleaned != block.data:
+                    block.data = cleaned
+                    derived.append(block)
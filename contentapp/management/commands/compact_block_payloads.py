@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from contentapp.payloads import delete_unused_payloads, externalize_existing
+
+
+class Command(BaseCommand):
+    help = (
+        "Move oversized ContentBlock payloads still stored inline into "
+        "ContentBlockPayload, then delete payloads no block points to anymore. "
+        "Safe to interrupt and re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="keep unused payloads younger than this (default: 24)",
+        )
+
+    def handle(self, *args, **options):
+        moved = externalize_existing(batch_size=options["batch_size"])
+        deleted = delete_unused_payloads(grace=timedelta(hours=options["grace_hours"]))
+        self.stdout.write(
+            f"{moved} payloads externalized, {deleted} unused payloads deleted"
+        )
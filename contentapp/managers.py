@@ -0,0 +1,87 @@
+from django.db import connection, models
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from contentapp.enums import ContentBlockType
+from contentapp.payloads import load_payloads, stored_payloads
+from contentapp.schemas import clean_blocks
+from sharedapp.managers import SoftDeleteManager, SoftDeleteQuerySet
+
+# indexed expressions over ContentBlock.data (see ContentBlock.Meta.indexes)
+ASSET_ID = Cast(KT("data__asset_id"), models.TextField())
+QUESTION_COUNT = Cast(KT("data__question_count"), models.IntegerField())
+
+
+class ContentBlockQuerySet(SoftDeleteQuerySet):
+    """
+    Queries on ContentBlock.data that use its indexes:
+
+        for_asset(...)   -> block_asset_alive_idx (data ->> 'asset_id')
+        with_question_count(...) -> block_question_count_idx (quizzes only)
+        with_data(...)   -> block_data_gin_idx (Postgres, containment)
+
+    Bulk writes go through the block_type schemas (contentapp.schemas).
+    """
+
+    def for_asset(self, asset_id):
+        # same expression as the index; the Cast makes it a plain text
+        # comparison (ids may be stored as string or number)
+        return self.alias(asset_id=ASSET_ID).filter(asset_id=str(asset_id))
+
+    def with_question_count(self, **lookups):
+        """
+        Quizzes filtered on their number of questions,
+        e.g. .with_question_count(gt=20).
+        """
+        return (
+            self.filter(block_type=ContentBlockType.QUIZ)
+            .alias(question_count=QUESTION_COUNT)
+            .filter(**{f"question_count__{op}": value for op, value in lookups.items()})
+        )
+
+    def with_data(self, **pairs):
+        """
+        Blocks whose data contains all `pairs` (top level keys).
+
+        Externalized payloads (contentapp.payloads) only match on their
+        INLINE_KEYS.
+        """
+        if connection.vendor == "postgresql":
+            # data @> '{...}', served by the GIN index
+            return self.filter(data__contains=pairs)
+        # SQLite has no JSON containment: compare key by key
+        return self.filter(**{f"data__{key}": value for key, value in pairs.items()})
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        clean_blocks(objs)
+        with stored_payloads(objs):
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if "data" not in fields and "block_type" not in fields:
+            return super().bulk_update(objs, fields, *args, **kwargs)
+        # validation needs the full payloads
+        load_payloads(objs)
+        clean_blocks(objs)
+        # bulk_update skips auto_now, but updated_at is the block's version
+        # (e.g. compiled quizzes are cached per version)
+        now = timezone.now()
+        for obj in objs:
+            obj.updated_at = now
+        fields = [*fields, "data", "payload", "updated_at"]
+        with stored_payloads(objs):
+            return super().bulk_update(objs, set(fields), *args, **kwargs)
+
+
+class ContentBlockManager(SoftDeleteManager.from_queryset(ContentBlockQuerySet)):
+    """
+    Default ContentBlock manager: alive blocks WITHOUT their `data`, so
+    listings never read payloads. Use contentapp.payloads.load_payloads
+    for the blocks that are opened (or .defer(None) / .values("data")).
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer("data")
@@ -0,0 +1,200 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "contentapp",
+            "0002_alter_course_cover_image_alter_course_picture_height_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="contentblock",
+            name="uniq_block_order_per_lesson",
+        ),
+        migrations.RemoveConstraint(
+            model_name="courseplacement",
+            name="uniq_course_placement",
+        ),
+        migrations.RemoveConstraint(
+            model_name="courseplacement",
+            name="uniq_course_order_per_grade_subject",
+        ),
+        migrations.RemoveConstraint(
+            model_name="lesson",
+            name="uniq_lesson_order_per_module",
+        ),
+        migrations.RemoveConstraint(
+            model_name="module",
+            name="uniq_module_order_per_course",
+        ),
+        migrations.RemoveIndex(
+            model_name="contentblock",
+            name="contentapp__lesson__3c709a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="contentblock",
+            name="contentapp__block_t_398c24_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="courseplacement",
+            name="contentapp__grade_i_68d868_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="courseplacement",
+            name="contentapp__course__13f206_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="lesson",
+            name="contentapp__module__ad8b20_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="module",
+            name="contentapp__course__b1e65e_idx",
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="slug",
+            field=models.SlugField(max_length=180),
+        ),
+        migrations.AlterField(
+            model_name="gradelevel",
+            name="name",
+            field=models.CharField(max_length=60),
+        ),
+        migrations.AlterField(
+            model_name="subject",
+            name="name",
+            field=models.CharField(max_length=80),
+        ),
+        migrations.AlterField(
+            model_name="subject",
+            name="slug",
+            field=models.SlugField(max_length=120),
+        ),
+        migrations.AddIndex(
+            model_name="contentblock",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["lesson", "is_active", "order"],
+                name="block_lesson_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentblock",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["block_type"],
+                name="block_type_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="courseplacement",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["grade", "subject", "is_published", "order"],
+                name="placement_catalog_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="courseplacement",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["course"],
+                name="placement_course_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="lesson",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["module", "is_published", "order"],
+                name="lesson_module_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="module",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["course", "order"],
+                name="module_course_alive_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contentblock",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("lesson", "order"),
+                name="uniq_block_order_per_lesson",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="course",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("slug",),
+                name="uniq_course_slug",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="courseplacement",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("grade", "subject", "course"),
+                name="uniq_course_placement",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="courseplacement",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("grade", "subject", "order"),
+                name="uniq_course_order_per_grade_subject",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="gradelevel",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("name",),
+                name="uniq_grade_name",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="lesson",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("module", "order"),
+                name="uniq_lesson_order_per_module",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="module",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("course", "order"),
+                name="uniq_module_order_per_course",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="subject",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("name",),
+                name="uniq_subject_name",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="subject",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("slug",),
+                name="uniq_subject_slug",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:03
+
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+# Postgres only: containment queries on data (ContentBlockQuerySet.with_data),
+# SQLite has no GIN / jsonb and compares key by key instead.
+GIN_INDEX = "block_data_gin_idx"
+
+
+def create_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON contentapp_contentblock "
+        "USING gin (data jsonb_path_ops) WHERE deleted_at IS NULL"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX}")
+
+
+def backfill_question_count(apps, schema_editor):
+    # derived key of contentapp.schemas, indexed by block_question_count_idx
+    ContentBlock = apps.get_model("contentapp", "ContentBlock")
+    quizzes = ContentBlock.objects.filter(block_type="quiz").only("data")
+    updated = []
+    for block in quizzes.iterator(chunk_size=500):
+        questions = (block.data or {}).get("questions")
+        if isinstance(questions, list):
+            block.data["question_count"] = len(questions)
+            updated.append(block)
+    ContentBlock.objects.bulk_update(updated, ["data"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contentapp", "0003_alive_only_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contentblock",
+            index=models.Index(
+                django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform("asset_id", "data"),
+                    models.TextField(),
+                ),
+                condition=models.Q(("deleted_at__isnull", True)),
+                name="block_asset_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentblock",
+            index=models.Index(
+                django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform(
+                        "question_count", "data"
+                    ),
+                    models.IntegerField(),
+                ),
+                condition=models.Q(
+                    ("deleted_at__isnull", True), ("block_type", "quiz")
+                ),
+                name="block_question_count_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_question_count, migrations.RunPython.noop),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contentapp", "0004_block_data_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentBlockPayload",
+            fields=[
+                (
+                    "sha256",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("data", models.JSONField()),
+                ("size", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="contentblock",
+            name="payload",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="blocks",
+                to="contentapp.contentblockpayload",
+            ),
+        ),
+    ]
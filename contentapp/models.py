@@ -1,7 +1,21 @@
 from pictures.models import PictureField
 
 from contentapp.enums import ContentBlockType
-from sharedapp.models import TimeStampedSoftDeleteModel
+from contentapp.managers import (
+    ASSET_ID,
+    QUESTION_COUNT,
+    ContentBlockManager,
+    ContentBlockQuerySet,
+)
+from contentapp.payloads import load_payloads, payload_ref, stored_payloads
+from contentapp.schemas import clean_block_data
+from sharedapp.managers import AllObjectsManager
+from sharedapp.models import (
+    ALIVE,
+    TimeStampedSoftDeleteModel,
+    alive_index,
+    alive_unique,
+)
 
 # -----------------------------
 # 1) CLASS / GRADE (BD context)
@@ -15,9 +29,14 @@ class GradeLevel(TimeStampedSoftDeleteModel):
     BD learning level: Playgroup, Class 1..10, Admission...
     """
 
-    name = models.CharField(max_length=60, unique=True)
+    name = models.CharField(max_length=60)
     order = models.PositiveIntegerField(default=0, db_index=True)
 
+    soft_delete_cascade = ("course_placements",)
+
+    class Meta:
+        constraints = [alive_unique("name", name="uniq_grade_name")]
+
     def __str__(self):
         return self.name
 
@@ -28,11 +47,19 @@ class Subject(TimeStampedSoftDeleteModel):
     It is NOT tied to a grade anymore.
     """
 
-    name = models.CharField(max_length=80, unique=True)
-    slug = models.SlugField(max_length=120, unique=True)
+    name = models.CharField(max_length=80)
+    slug = models.SlugField(max_length=120)
 
     is_active = models.BooleanField(default=True, db_index=True)
 
+    soft_delete_cascade = ("course_placements",)
+
+    class Meta:
+        constraints = [
+            alive_unique("name", name="uniq_subject_name"),
+            alive_unique("slug", name="uniq_subject_slug"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
@@ -50,7 +77,7 @@ class Course(TimeStampedSoftDeleteModel):
     """
 
     title = models.CharField(max_length=160)
-    slug = models.SlugField(max_length=180, unique=True)
+    slug = models.SlugField(max_length=180)
 
     short_description = models.CharField(max_length=255, blank=True)
 
@@ -68,6 +95,11 @@ class Course(TimeStampedSoftDeleteModel):
     # global publish (course exists / not)
     is_active = models.BooleanField(default=True, db_index=True)
 
+    soft_delete_cascade = ("placements", "modules")
+
+    class Meta:
+        constraints = [alive_unique("slug", name="uniq_course_slug")]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)[:180]
@@ -103,19 +135,25 @@ class CoursePlacement(TimeStampedSoftDeleteModel):
     is_published = models.BooleanField(default=False, db_index=True)
     published_at = models.DateTimeField(null=True, blank=True)
 
+    # siblings for gap-based ordering (sharedapp.services.ordering)
+    ordering_scope = ("grade", "subject")
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(
-                fields=["grade", "subject", "course"], name="uniq_course_placement"
-            ),
-            models.UniqueConstraint(
-                fields=["grade", "subject", "order"],
-                name="uniq_course_order_per_grade_subject",
+            alive_unique("grade", "subject", "course", name="uniq_course_placement"),
+            alive_unique(
+                "grade", "subject", "order", name="uniq_course_order_per_grade_subject"
             ),
         ]
         indexes = [
-            models.Index(fields=["grade", "subject", "is_published", "order"]),
-            models.Index(fields=["course"]),
+            alive_index(
+                "grade",
+                "subject",
+                "is_published",
+                "order",
+                name="placement_catalog_alive_idx",
+            ),
+            alive_index("course", name="placement_course_alive_idx"),
         ]
 
     def __str__(self):
@@ -142,14 +180,15 @@ class Module(TimeStampedSoftDeleteModel):
     # story-driven progression can be toggled per module if needed
     is_sequential = models.BooleanField(default=True)
 
+    soft_delete_cascade = ("lessons",)
+    ordering_scope = ("course",)
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(
-                fields=["course", "order"], name="uniq_module_order_per_course"
-            )
+            alive_unique("course", "order", name="uniq_module_order_per_course")
         ]
         indexes = [
-            models.Index(fields=["course", "order"]),
+            alive_index("course", "order", name="module_course_alive_idx"),
         ]
 
     def __str__(self):
@@ -182,20 +221,41 @@ class Lesson(TimeStampedSoftDeleteModel):
 
     is_published = models.BooleanField(default=False, db_index=True)
 
+    soft_delete_cascade = ("content_blocks",)
+    ordering_scope = ("module",)
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(
-                fields=["module", "order"], name="uniq_lesson_order_per_module"
-            )
+            alive_unique("module", "order", name="uniq_lesson_order_per_module")
         ]
         indexes = [
-            models.Index(fields=["module", "is_published", "order"]),
+            alive_index(
+                "module", "is_published", "order", name="lesson_module_alive_idx"
+            ),
         ]
 
     def __str__(self):
         return f"{self.module.title} · {self.title}"
 
 
+class ContentBlockPayload(models.Model):
+    """
+    Externalized ContentBlock.data, bigger than
+    CONTENT_PAYLOAD_INLINE_MAX_BYTES (see contentapp.payloads).
+
+    Addressed by the sha256 of its canonical JSON: immutable, and blocks
+    with the same payload share one row.
+    """
+
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    data = models.JSONField()
+    size = models.PositiveIntegerField()  # bytes of the canonical JSON
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes)"
+
+
 class ContentBlock(TimeStampedSoftDeleteModel):
     """
     Flexible building block under a lesson (like Notion blocks).
@@ -220,22 +280,78 @@ class ContentBlock(TimeStampedSoftDeleteModel):
 
     title = models.CharField(max_length=180, blank=True)
 
-    # type-specific payload (URLs, durations, JSON config, etc.)
+    # type-specific payload (URLs, durations, JSON config, etc.),
+    # validated against the block_type's schema (contentapp.schemas).
+    # Big payloads live in `payload`, `data` then only stores a stub
+    # (contentapp.payloads); not loaded by the default manager.
     data = models.JSONField(default=dict, blank=True)
+    payload = models.ForeignKey(
+        ContentBlockPayload,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="blocks",
+    )
 
     # for rollout/QA
     is_active = models.BooleanField(default=True, db_index=True)
 
+    ordering_scope = ("lesson",)
+
+    objects = ContentBlockManager()
+    all_objects = AllObjectsManager.from_queryset(ContentBlockQuerySet)()
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(
-                fields=["lesson", "order"], name="uniq_block_order_per_lesson"
-            )
+            alive_unique("lesson", "order", name="uniq_block_order_per_lesson")
         ]
         indexes = [
-            models.Index(fields=["lesson", "is_active", "order"]),
-            models.Index(fields=["block_type"]),
+            alive_index("lesson", "is_active", "order", name="block_lesson_alive_idx"),
+            alive_index("block_type", name="block_type_alive_idx"),
+            # ContentBlockQuerySet.for_asset / .with_question_count
+            # (+ a Postgres only GIN index on data, see migration 0004)
+            models.Index(ASSET_ID, name="block_asset_alive_idx", condition=ALIVE),
+            models.Index(
+                QUESTION_COUNT,
+                name="block_question_count_idx",
+                condition=ALIVE & models.Q(block_type=ContentBlockType.QUIZ),
+            ),
         ]
 
     def __str__(self):
         return f"{self.lesson.title} · {self.block_type} · {self.order}"
+
+    def clean(self):
+        if payload_ref(self.data):
+            load_payloads([self])
+        self.data = clean_block_data(self.block_type, self.data)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # block_type as loaded (None when deferred), see save()
+        instance._loaded_block_type = instance.__dict__.get("block_type")
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        deferred = self.get_deferred_fields()
+        if update_fields is None and "data" in deferred:
+            # loaded without data: Django only writes the loaded fields
+            if "block_type" in deferred or self.block_type == getattr(
+                self, "_loaded_block_type", None
+            ):
+                return super().save(*args, **kwargs)
+            # ... but a new block_type must be checked against the data
+            self.refresh_from_db(fields=["data", "payload"])
+        if update_fields is not None and not {"data", "block_type"} & set(
+            update_fields
+        ):
+            return super().save(*args, **kwargs)
+
+        self.clean()
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "data", "payload"}
+        with stored_payloads([self]):
+            super().save(*args, **kwargs)
@@ -0,0 +1,197 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+# -----------------------------
+# Externalized ContentBlock payloads
+# -----------------------------
+#
+# A block's `data` is stored inline while its JSON is at most
+# CONTENT_PAYLOAD_INLINE_MAX_BYTES. A bigger payload (long text bodies,
+# full quizzes) goes to ContentBlockPayload, addressed by the sha256 of
+# its canonical JSON, so identical payloads are stored once. The block
+# row then only keeps a stub:
+#
+#     {"asset_id": ..., "question_count": ..., "$payload": "<sha256>"}
+#
+# The stub keeps the keys the ContentBlock indexes are built on
+# (INLINE_KEYS), so for_asset / with_question_count work the same for
+# inline and externalized blocks.
+#
+# ContentBlock.objects defers `data`: listings never read payloads.
+# `load_payloads` fetches full payloads for the blocks actually opened,
+# with one query per step no matter how many blocks.
+#
+# Payload rows are immutable. Rows nothing points to anymore (edited or
+# purged blocks) are removed by `delete_unused_payloads`.
+
+PAYLOAD_REF = "$payload"
+INLINE_KEYS = ("asset_id", "question_count")
+
+
+def encode(data):
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def payload_ref(data):
+    """
+    sha256 of the externalized payload `data` is a stub of, else None.
+    """
+    return data.get(PAYLOAD_REF) if isinstance(data, dict) else None
+
+
+def split_payload(data):
+    """
+    (what to store in the data column, ContentBlockPayload or None).
+    """
+    from contentapp.models import ContentBlockPayload
+
+    raw = encode(data)
+    if len(raw) <= settings.CONTENT_PAYLOAD_INLINE_MAX_BYTES:
+        return data, None
+    sha256 = hashlib.sha256(raw).hexdigest()
+    stub = {key: data[key] for key in INLINE_KEYS if key in data}
+    stub[PAYLOAD_REF] = sha256
+    return stub, ContentBlockPayload(sha256=sha256, data=data, size=len(raw))
+
+
+@contextmanager
+def stored_payloads(blocks):
+    """
+    Inside the block, every ContentBlock in `blocks` holds what goes into
+    its data column (inline data or a stub) and its `payload`; the full
+    data is put back afterwards. Externalized payloads are written first,
+    in one query.
+    """
+    full = [block.data for block in blocks]
+    payloads = {}
+    for block in blocks:
+        block.data, payload = split_payload(block.data)
+        block.payload_id = payload and payload.sha256
+        if payload:
+            payloads[payload.sha256] = payload
+    try:
+        if payloads:
+            from contentapp.models import ContentBlockPayload
+
+            # already stored (same content) -> nothing to do
+            ContentBlockPayload.objects.bulk_create(
+                payloads.values(), ignore_conflicts=True
+            )
+        yield
+    finally:
+        for block, data in zip(blocks, full):
+            block.data = data
+
+
+def payload_rows(refs):
+    """
+    Queryset of (sha256, data) of the payloads `refs`.
+    """
+    from contentapp.models import ContentBlockPayload
+
+    return ContentBlockPayload.objects.filter(pk__in=refs).values_list("sha256", "data")
+
+
+def attach_payloads(rows, payloads):
+    """
+    Replace stubs in `rows` (dicts with a "data" key) by their payload,
+    `payloads` maps sha256 -> data.
+    """
+    for row in rows:
+        if ref := payload_ref(row["data"]):
+            row["data"] = payloads[ref]
+    return rows
+
+
+def load_payloads(blocks):
+    """
+    Give every ContentBlock in `blocks` its full `data`: one query for
+    blocks loaded without their data column (the default manager defers
+    it), one for the externalized payloads.
+    """
+    from contentapp.models import ContentBlock
+
+    blocks = list(blocks)
+    deferred = {
+        block.pk: block for block in blocks if "data" in block.get_deferred_fields()
+    }
+    if deferred:
+        rows = ContentBlock.all_objects.filter(pk__in=deferred).values_list(
+            "pk", "data"
+        )
+        for pk, data in rows:
+            deferred[pk].data = data
+
+    refs = {ref for block in blocks if (ref := payload_ref(block.data))}
+    if refs:
+        payloads = dict(payload_rows(refs))
+        for block in blocks:
+            if ref := payload_ref(block.data):
+                block.data = payloads[ref]
+    return blocks
+
+
+def externalize_existing(batch_size=500):
+    """
+    Move oversized payloads stored inline (rows written before
+    externalization) out of the block table, in keyset batches.
+    Returns the number of blocks moved.
+    """
+    from contentapp.models import ContentBlock
+
+    rows = ContentBlock.all_objects.filter(payload__isnull=True).order_by("pk")
+    moved = 0
+    last_pk = 0
+    while batch := list(rows.filter(pk__gt=last_pk).only("pk", "data")[:batch_size]):
+        last_pk = batch[-1].pk
+        # cheap size check before anything is hashed / written
+        big = [
+            block
+            for block in batch
+            if len(encode(block.data)) > settings.CONTENT_PAYLOAD_INLINE_MAX_BYTES
+        ]
+        if not big:
+            continue
+        with transaction.atomic(), stored_payloads(big):
+            for block in big:
+                # plain UPDATE: the content is unchanged, so are the caches
+                ContentBlock.all_objects.filter(pk=block.pk).update(
+                    data=block.data, payload_id=block.payload_id
+                )
+        moved += len(big)
+    return moved
+
+
+def delete_unused_payloads(grace=timedelta(days=1)):
+    """
+    Delete payloads no block (alive, soft deleted or archived by the
+    purge job) points to. Payloads younger than `grace` are kept: their
+    block may be saved by a transaction that did not commit yet.
+    """
+    from contentapp.models import ContentBlock, ContentBlockPayload
+    from sharedapp.models import SoftDeleteArchive
+
+    used = ContentBlock.all_objects.filter(payload=OuterRef("pk"))
+    archived = (
+        SoftDeleteArchive.objects.filter(model_label="contentapp.contentblock")
+        .alias(payload_id=Cast(KT("data__payload_id"), models.TextField()))
+        .filter(payload_id=OuterRef("pk"))
+    )
+    deleted, _ = (
+        ContentBlockPayload.objects.filter(created_at__lt=timezone.now() - grace)
+        .exclude(Exists(used))
+        .exclude(Exists(archived))
+        .delete()
+    )
+    return deleted
@@ -0,0 +1,231 @@
+from django.core.exceptions import ValidationError
+
+from contentapp.enums import ContentBlockType
+
+# -----------------------------
+# ContentBlock.data schemas
+# -----------------------------
+#
+# One schema per block_type, written as nested `Key`s. `compile_schemas()`
+# (called once from ContentappConfig.ready) turns every schema into a tree
+# of small closures, so validating a payload is a few dict lookups and
+# isinstance checks, no schema interpretation per call.
+#
+# Unknown keys are allowed (clients may carry extra config); declared keys
+# must have the right type. `DERIVED` keys are computed from the payload
+# after validation and stored with it, so they can be indexed
+# (e.g. data["question_count"], see ContentBlock.Meta.indexes).
+
+NUMBER = (int, float)
+ID = (str, int)
+
+
+class Key:
+    def __init__(
+        self,
+        types,
+        required=False,
+        choices=None,
+        min=None,
+        max=None,
+        items=None,
+        schema=None,
+        check=None,
+    ):
+        self.types = types if isinstance(types, tuple) else (types,)
+        self.required = required
+        self.choices = choices
+        self.min = min  # value for numbers, length for str / list
+        self.max = max
+        self.items = items  # Key of every list item
+        self.schema = schema  # {name: Key} of a dict
+        self.check = check  # value -> error message or None
+
+
+def _question_check(question):
+    # single choice: "answer" (index), multi-select: "answers" (indexes)
+    if ("answer" in question) == ("answers" in question):
+        return "needs exactly one of answer / answers"
+    choices = question.get("choices")
+    answers = question.get("answers", [question.get("answer")])
+    if not isinstance(answers, list) or not all(type(a) is int for a in answers):
+        return None  # type errors are reported by the keys
+    if isinstance(choices, list) and any(a >= len(choices) for a in answers):
+        return "answer is not one of the choices"
+    if len(set(answers)) != len(answers):
+        return "answers are not unique"
+    return None
+
+
+QUESTION = Key(
+    dict,
+    schema={
+        "prompt": Key(str, required=True, min=1),
+        # at most 64: graded as bitmasks (contentapp.services.grading)
+        "choices": Key(list, required=True, min=2, max=64, items=Key(str)),
+        "answer": Key(int, min=0),
+        "answers": Key(list, min=1, items=Key(int, min=0)),
+        "points": Key(NUMBER, min=0),
+    },
+    check=_question_check,
+)
+
+SCHEMAS = {
+    ContentBlockType.VIDEO: {
+        "asset_id": Key(ID, required=True),
+        "url": Key(str),
+        "duration_seconds": Key(int, min=0),
+        "thumbnail_url": Key(str),
+    },
+    ContentBlockType.ANIMATION: {
+        "asset_id": Key(ID, required=True),
+        "duration_seconds": Key(int, min=0),
+        "autoplay": Key(bool),
+        "loop": Key(bool),
+    },
+    ContentBlockType.TEXT: {
+        "body": Key(str, required=True),
+        "format": Key(str, choices=("markdown", "html", "plain")),
+    },
+    ContentBlockType.QUIZ: {
+        "questions": Key(list, required=True, min=1, items=QUESTION),
+        "pass_percent": Key(NUMBER, min=0, max=100),
+        "shuffle": Key(bool),
+    },
+    ContentBlockType.VISUAL: {
+        "asset_id": Key(ID, required=True),
+        "caption": Key(str),
+    },
+    ContentBlockType.FILE: {
+        "asset_id": Key(ID, required=True),
+        "file_name": Key(str),
+        "size_bytes": Key(int, min=0),
+    },
+}
+
+DERIVED = {
+    ContentBlockType.QUIZ: {
+        "question_count": lambda data: len(data["questions"]),
+    },
+}
+
+_validators = {}
+
+
+def _type_name(types):
+    return " or ".join(
+        {
+            str: "string",
+            int: "integer",
+            float: "number",
+            bool: "boolean",
+            list: "list",
+            dict: "object",
+        }[t]
+        for t in types
+    )
+
+
+def _compile(key, path):
+    """
+    Validator closure for one Key: (value, errors) -> None.
+    """
+    types = key.types
+    # bool is an int subclass: only accept it where bool is declared
+    reject_bool = bool not in types
+    type_error = f"{path}: must be {_type_name(types)}"
+    measure = None
+    if key.min is not None or key.max is not None:
+        measure = len if types[0] in (str, list) else (lambda value: value)
+    item_validator = _compile(key.items, f"{path}[]") if key.items else None
+    dict_validator = _compile_dict(key.schema, path) if key.schema else None
+
+    def validate(value, errors):
+        if not isinstance(value, types) or (reject_bool and isinstance(value, bool)):
+            errors.append(type_error)
+            return
+        if key.choices is not None and value not in key.choices:
+            errors.append(f"{path}: must be one of {', '.join(key.choices)}")
+        if measure is not None:
+            size = measure(value)
+            if key.min is not None and size < key.min:
+                errors.append(f"{path}: must be at least {key.min}")
+            if key.max is not None and size > key.max:
+                errors.append(f"{path}: must be at most {key.max}")
+        if item_validator is not None:
+            for item in value:
+                item_validator(item, errors)
+        if dict_validator is not None:
+            dict_validator(value, errors)
+        if key.check is not None and (message := key.check(value)):
+            errors.append(f"{path}: {message}")
+
+    return validate
+
+
+def _compile_dict(schema, path=""):
+    prefix = f"{path}." if path else ""
+    keys = [
+        (name, key.required, _compile(key, f"{prefix}{name}"))
+        for name, key in schema.items()
+    ]
+
+    def validate(value, errors):
+        for name, required, validator in keys:
+            if name in value:
+                validator(value[name], errors)
+            elif required:
+                errors.append(f"{prefix}{name}: is required")
+
+    return validate
+
+
+def compile_schemas():
+    _validators.clear()
+    for block_type, schema in SCHEMAS.items():
+        _validators[block_type] = _compile_dict(schema)
+
+
+def block_data_errors(block_type, data):
+    """
+    List of error messages for `data` of a `block_type` block ([] = valid).
+    """
+    if not _validators:
+        compile_schemas()
+    validator = _validators.get(block_type)
+    if validator is None:
+        return [f"unknown block type {block_type!r}"]
+    if not isinstance(data, dict):
+        return ["must be an object"]
+    errors = []
+    validator(data, errors)
+    return errors
+
+
+def clean_block_data(block_type, data):
+    """
+    Validated `data` with its derived keys, raises ValidationError.
+    """
+    errors = block_data_errors(block_type, data)
+    if errors:
+        raise ValidationError({"data": errors})
+    derived = DERIVED.get(block_type)
+    if derived:
+        data = {**data, **{name: compute(data) for name, compute in derived.items()}}
+    return data
+
+
+def clean_blocks(blocks):
+    """
+    Bulk `clean_block_data` over ContentBlock instances (data replaced in
+    place). All blocks are checked before raising, errors are prefixed
+    with the block's position in `blocks`.
+    """
+    errors = []
+    for position, block in enumerate(blocks):
+        try:
+            block.data = clean_block_data(block.block_type, block.data)
+        except ValidationError as exc:
+            errors += [f"block {position}: {message}" for message in exc.messages]
+    if errors:
+        raise ValidationError({"data": errors})
@@ -0,0 +1,115 @@
+from contentapp.cache import CATALOG_VERSION_KEY, placement_version_key
+from contentapp.models import CoursePlacement
+from sharedapp.cache import aget_or_build, get_or_build
+
+# -----------------------------
+# Grade · Subject catalog
+# -----------------------------
+#
+# Keyset (seek) pagination: instead of OFFSET we remember the `order`
+# of the last placement the client has seen and continue with
+# `order > after`. `order` is unique per (grade, subject)
+# (uniq_course_order_per_grade_subject), so it is a stable cursor and
+# every page is a range scan on (grade, subject, is_published, order),
+# no matter how deep the user scrolls.
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _serialize_placement(placement):
+    course = placement.course
+    return {
+        "placement_id": placement.id,
+        "order": placement.order,
+        "course": {
+            "id": course.id,
+            "title": course.title,
+            "slug": course.slug,
+            "short_description": course.short_description,
+            "cover_image": course.cover_image.url if course.cover_image else None,
+        },
+    }
+
+
+def _placement_rows(grade_id, subject_id, after, limit):
+    placements = (
+        CoursePlacement.objects.filter(
+            grade_id=grade_id,
+            subject_id=subject_id,
+            is_published=True,
+            grade__deleted_at__isnull=True,
+            subject__deleted_at__isnull=True,
+            course__deleted_at__isnull=True,
+            course__is_active=True,
+        )
+        .select_related("course", "grade", "subject")
+        .order_by("order")
+    )
+    if after is not None:
+        placements = placements.filter(order__gt=after)
+    # one extra row tells us whether there is a next page
+    return placements[: limit + 1]
+
+
+def _assemble_page(rows, limit):
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    grade = subject = None
+    if rows:
+        grade = {"id": rows[0].grade.id, "name": rows[0].grade.name}
+        subject = {
+            "id": rows[0].subject.id,
+            "name": rows[0].subject.name,
+            "slug": rows[0].subject.slug,
+        }
+
+    return {
+        "grade": grade,
+        "subject": subject,
+        "results": [_serialize_placement(placement) for placement in rows],
+        "next": rows[-1].order if has_more else None,
+    }
+
+
+def build_catalog_page(grade_id, subject_id, after=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    One page of published, active courses for a (grade, subject) pair.
+
+    `after` is the `next` value of the previous page (None for the first page).
+    Course/grade/subject come in the same query via select_related,
+    so the page costs exactly one query.
+    """
+    rows = list(_placement_rows(grade_id, subject_id, after, limit))
+    return _assemble_page(rows, limit)
+
+
+async def abuild_catalog_page(
+    grade_id, subject_id, after=None, limit=DEFAULT_PAGE_SIZE
+):
+    """
+    Async `build_catalog_page` (same single query, async ORM).
+    """
+    rows = [row async for row in _placement_rows(grade_id, subject_id, after, limit)]
+    return _assemble_page(rows, limit)
+
+
+def get_catalog_page(grade_id, subject_id, after=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    Cached `build_catalog_page`, invalidated through catalog:v and
+    placement:{grade}:{subject}:v.
+    """
+    return get_or_build(
+        f"catalog:{grade_id}:{subject_id}:{after}:{limit}",
+        [CATALOG_VERSION_KEY, placement_version_key(grade_id, subject_id)],
+        lambda: build_catalog_page(grade_id, subject_id, after=after, limit=limit),
+    )
+
+
+async def aget_catalog_page(grade_id, subject_id, after=None, limit=DEFAULT_PAGE_SIZE):
+    return await aget_or_build(
+        f"catalog:{grade_id}:{subject_id}:{after}:{limit}",
+        [CATALOG_VERSION_KEY, placement_version_key(grade_id, subject_id)],
+        lambda: abuild_catalog_page(grade_id, subject_id, after=after, limit=limit),
+    )
@@ -0,0 +1,228 @@
+from contentapp.cache import (
+    alesson_course_id,
+    course_version_key,
+    lesson_course_id,
+    lesson_version_key,
+)
+from contentapp.models import ContentBlock, Course, Lesson, Module
+from contentapp.payloads import attach_payloads, payload_ref, payload_rows
+from sharedapp.cache import aget_or_build, get_or_build
+
+# -----------------------------
+# Course outline (learner app)
+# -----------------------------
+#
+# The tree is loaded level by level with one query per level
+# (course, modules, lessons, blocks), so the cost does not depend on
+# how many modules or lessons a course has.
+#
+# Every level goes through the default `objects` manager, so
+# soft-deleted rows are hidden at each level. Children are fetched by
+# the ids of their *alive* parents, which also hides lessons/blocks
+# that sit under a soft-deleted parent.
+#
+# Lessons and blocks are filtered + ordered so the lookups are served by
+#   (module, is_published, order) and (lesson, is_active, order).
+
+COURSE_FIELDS = ("id", "title", "slug", "short_description")
+MODULE_FIELDS = ("id", "title", "order", "is_sequential")
+LESSON_FIELDS = ("id", "module_id", "title", "order", "lesson_type")
+BLOCK_FIELDS = ("id", "lesson_id", "block_type", "title", "order")
+
+
+def _group_by(rows, key):
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row.pop(key), []).append(row)
+    return grouped
+
+
+# Querysets are built by small helpers and the rows are put together by
+# `_assemble_*`, so the sync builders and their async twins (`abuild_*`,
+# used by the ASGI views) run exactly the same queries.
+
+
+def _course_rows(course_id):
+    return Course.objects.filter(pk=course_id, is_active=True).values(*COURSE_FIELDS)
+
+
+def _module_rows(course_id):
+    return (
+        Module.objects.filter(course_id=course_id)
+        .order_by("order")
+        .values(*MODULE_FIELDS)
+    )
+
+
+def _lesson_rows(module_ids):
+    return (
+        Lesson.objects.filter(module_id__in=module_ids, is_published=True)
+        .order_by("module_id", "order")
+        .values(*LESSON_FIELDS)
+    )
+
+
+def _block_rows(lesson_ids):
+    return (
+        ContentBlock.objects.filter(lesson_id__in=lesson_ids, is_active=True)
+        .order_by("lesson_id", "order")
+        .values(*BLOCK_FIELDS)
+    )
+
+
+def _assemble_tree(course, modules, lessons, blocks):
+    blocks_by_lesson = _group_by(blocks, "lesson_id")
+    for lesson in lessons:
+        lesson["blocks"] = blocks_by_lesson.get(lesson["id"], [])
+
+    lessons_by_module = _group_by(lessons, "module_id")
+    for module in modules:
+        module["lessons"] = lessons_by_module.get(module["id"], [])
+
+    course["modules"] = modules
+    return course
+
+
+def build_course_tree(course_id):
+    """
+    Nested outline of an active course:
+
+        course -> modules -> published lessons -> active blocks
+
+    Block payloads (`data`) are NOT part of the outline,
+    use `get_lesson_content` for a single lesson.
+
+    Returns None when the course does not exist / is not active.
+    """
+    course = _course_rows(course_id).first()
+    if course is None:
+        return None
+
+    modules = list(_module_rows(course_id))
+    module_ids = [module["id"] for module in modules]
+    lessons = list(_lesson_rows(module_ids)) if module_ids else []
+    lesson_ids = [lesson["id"] for lesson in lessons]
+    blocks = list(_block_rows(lesson_ids)) if lesson_ids else []
+
+    return _assemble_tree(course, modules, lessons, blocks)
+
+
+async def abuild_course_tree(course_id):
+    """
+    Async `build_course_tree` (same queries, async ORM).
+    """
+    course = await _course_rows(course_id).afirst()
+    if course is None:
+        return None
+
+    modules = [row async for row in _module_rows(course_id)]
+    module_ids = [module["id"] for module in modules]
+    lessons = [row async for row in _lesson_rows(module_ids)] if module_ids else []
+    lesson_ids = [lesson["id"] for lesson in lessons]
+    blocks = [row async for row in _block_rows(lesson_ids)] if lesson_ids else []
+
+    return _assemble_tree(course, modules, lessons, blocks)
+
+
+def _visible_lesson_rows(lesson_id):
+    return Lesson.objects.filter(
+        pk=lesson_id,
+        is_published=True,
+        module__deleted_at__isnull=True,
+        module__course__deleted_at__isnull=True,
+        module__course__is_active=True,
+    ).values("id", "title", "order", "lesson_type", "module_id")
+
+
+def _lesson_block_rows(lesson_id):
+    return (
+        ContentBlock.objects.filter(lesson_id=lesson_id, is_active=True)
+        .order_by("order")
+        .values("id", "block_type", "title", "order", "data")
+    )
+
+
+def _payload_refs(blocks):
+    return {ref for block in blocks if (ref := payload_ref(block["data"]))}
+
+
+def build_lesson_content(lesson_id):
+    """
+    A single published lesson with its active blocks (including `data`,
+    externalized payloads are fetched in one extra query).
+
+    The lesson is only visible when its module and course are alive
+    and the course is active.
+
+    Returns None when the lesson is not visible.
+    """
+    lesson = _visible_lesson_rows(lesson_id).first()
+    if lesson is None:
+        return None
+
+    blocks = list(_lesson_block_rows(lesson_id))
+    refs = _payload_refs(blocks)
+    lesson["blocks"] = attach_payloads(blocks, dict(payload_rows(refs)) if refs else {})
+    return lesson
+
+
+async def abuild_lesson_content(lesson_id):
+    """
+    Async `build_lesson_content`.
+    """
+    lesson = await _visible_lesson_rows(lesson_id).afirst()
+    if lesson is None:
+        return None
+
+    blocks = [row async for row in _lesson_block_rows(lesson_id)]
+    refs = _payload_refs(blocks)
+    payloads = (
+        {sha256: data async for sha256, data in payload_rows(refs)} if refs else {}
+    )
+    lesson["blocks"] = attach_payloads(blocks, payloads)
+    return lesson
+
+
+def get_course_tree(course_id):
+    """
+    Cached `build_course_tree`, invalidated through course:{id}:v.
+    """
+    return get_or_build(
+        f"course_tree:{course_id}",
+        [course_version_key(course_id)],
+        lambda: build_course_tree(course_id),
+    )
+
+
+def get_lesson_content(lesson_id):
+    """
+    Cached `build_lesson_content`, invalidated through lesson:{id}:v and
+    the version of the course the lesson belongs to.
+    """
+    course_id = lesson_course_id(lesson_id)
+    if course_id is None:
+        return None
+    return get_or_build(
+        f"lesson_content:{lesson_id}",
+        [lesson_version_key(lesson_id), course_version_key(course_id)],
+        lambda: build_lesson_content(lesson_id),
+    )
+
+
+async def aget_course_tree(course_id):
+    return await aget_or_build(
+        f"course_tree:{course_id}",
+        [course_version_key(course_id)],
+        lambda: abuild_course_tree(course_id),
+    )
+
+
+async def aget_lesson_content(lesson_id):
+    course_id = await alesson_course_id(lesson_id)
+    if course_id is None:
+        return None
+    return await aget_or_build(
+        f"lesson_content:{lesson_id}",
+        [lesson_version_key(lesson_id), course_version_key(course_id)],
+        lambda: abuild_lesson_content(lesson_id),
+    )
@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+from django.conf import settings
+
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock
+from contentapp.payloads import load_payloads
+
+# -----------------------------
+# Quiz grading (QUIZ blocks)
+# -----------------------------
+#
+# A quiz definition (block.data, see contentapp.schemas) is compiled once
+# into arrays over its Q questions, the choices of a question being bits
+# of a uint64 (hence at most 64 choices):
+#
+#   key     (Q,) uint64  bits of the correct choices
+#   valid   (Q,) uint64  bits of the choices that exist
+#   multi   (Q,) bool    multi-select question ("answers")
+#   points  (Q,) float
+#
+# and kept in an in-process LRU keyed by (block id, updated_at), so an
+# edited quiz is compiled again and an unchanged one never is.
+#
+# A batch of N answer sheets becomes one (N, Q) uint64 array of the picked
+# choices. A question is right when its picks equal its key (multi-select
+# is all or nothing); scores, percentages and the per-question statistics
+# are whole-array operations, no Python loop per sheet.
+#
+# Answer sheet: one entry per question, None (blank), a choice index, or a
+# list of choice indexes (multi-select).
+
+_lru = OrderedDict()
+_lru_lock = threading.Lock()
+
+
+class InvalidAnswerSheet(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledQuiz:
+    key: np.ndarray
+    valid: np.ndarray
+    multi: np.ndarray
+    points: np.ndarray
+    pass_percent: float
+
+    @property
+    def question_count(self):
+        return len(self.points)
+
+    @property
+    def total_points(self):
+        return float(self.points.sum())
+
+
+@dataclass
+class GradeResult:
+    correct: np.ndarray  # (N, Q) bool
+    scores: np.ndarray  # (N,) points
+    percent: np.ndarray  # (N,)
+    passed: np.ndarray  # (N,) bool
+    # share of sheets that got the question right (high = easy)
+    difficulty: np.ndarray  # (Q,)
+    # corrected item-total (point-biserial) correlation: does getting the
+    # question right go with doing well on the rest of the quiz?
+    # nan when everybody (or nobody) got it right
+    discrimination: np.ndarray  # (Q,)
+
+    def question_stats(self):
+        return [
+            {
+                "question": index,
+                "difficulty": _rounded(difficulty),
+                "discrimination": _rounded(discrimination),
+            }
+            for index, (difficulty, discrimination) in enumerate(
+                zip(self.difficulty, self.discrimination)
+            )
+        ]
+
+
+def _rounded(value):
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def _bits(choices):
+    mask = 0
+    for choice in choices:
+        mask |= 1 << choice
+    return mask
+
+
+def compile_quiz(data):
+    """
+    CompiledQuiz of a valid quiz payload.
+    """
+    questions = data["questions"]
+    key = np.array(
+        [_bits(q.get("answers", [q.get("answer")])) for q in questions], dtype=np.uint64
+    )
+    valid = np.array(
+        [_bits(range(len(q["choices"]))) for q in questions], dtype=np.uint64
+    )
+    multi = np.array(["answers" in q for q in questions], dtype=bool)
+    points = np.array([q.get("points", 1) for q in questions], dtype=float)
+
+    # shared between threads through the LRU
+    for array in (key, valid, multi, points):
+        array.flags.writeable = False
+    return CompiledQuiz(key, valid, multi, points, data.get("pass_percent", 50))
+
+
+def get_compiled_quiz(block):
+    """
+    Cached `compile_quiz` of a QUIZ ContentBlock, per block version
+    (updated_at). The payload is only loaded on a cache miss.
+    """
+    cache_key = (block.pk, block.updated_at)
+    with _lru_lock:
+        quiz = _lru.get(cache_key)
+        if quiz is not None:
+            _lru.move_to_end(cache_key)
+            return quiz
+
+    load_payloads([block])
+    quiz = compile_quiz(block.data)
+    with _lru_lock:
+        _lru[cache_key] = quiz
+        _lru.move_to_end(cache_key)
+        while len(_lru) > settings.QUIZ_GRADING_CACHE_SIZE:
+            _lru.popitem(last=False)
+    return quiz
+
+
+def _answer_bits(answer):
+    if answer is None:
+        return 0
+    if type(answer) is int:
+        return 1 << answer
+    if isinstance(answer, list) and all(type(choice) is int for choice in answer):
+        return _bits(answer)
+    raise TypeError
+
+
+def _single_choice_bits(answers):
+    # common case, no multi-select question: shift the indexes in one go
+    none = answers == None  # noqa: E711 (elementwise)
+    if not set(map(type, answers[~none])) <= {int}:
+        raise TypeError
+    picks = np.where(none, 0, answers).astype(np.int64)
+    if ((picks < 0) | (picks > 63)).any():
+        raise ValueError
+    bits = np.left_shift(np.uint64(1), picks.astype(np.uint64))
+    return np.where(none, np.uint64(0), bits)
+
+
+def encode_sheets(quiz, sheets):
+    """
+    (N, Q) uint64 array of the choices picked on `sheets`.
+    Raises InvalidAnswerSheet.
+    """
+    sheets = list(sheets)
+    count = quiz.question_count
+    if any(len(sheet) != count for sheet in sheets):
+        raise InvalidAnswerSheet(f"an answer sheet needs {count} answers")
+
+    flat = chain.from_iterable(sheets)
+    try:
+        if quiz.multi.any():
+            picked = np.fromiter(
+                map(_answer_bits, flat), dtype=np.uint64, count=len(sheets) * count
+            )
+        else:
+            picked = _single_choice_bits(
+                np.fromiter(flat, dtype=object, count=len(sheets) * count)
+            )
+    except (TypeError, ValueError, OverflowError):
+        raise InvalidAnswerSheet(
+            "answers must be a choice index, a list of them or null"
+        )
+    picked = picked.reshape(len(sheets), count)
+
+    invalid = (picked & ~quiz.valid) != 0
+    # more than one pick on a single choice question
+    invalid |= (np.bitwise_count(picked) > 1) & ~quiz.multi
+    if invalid.any():
+        sheet, question = np.argwhere(invalid)[0]
+        raise InvalidAnswerSheet(
+            f"sheet {sheet}: invalid answer to question {question}"
+        )
+    return picked
+
+
+def grade(quiz, picked):
+    """
+    GradeResult of an encoded batch (`encode_sheets`).
+    """
+    count = quiz.question_count
+    correct = picked == quiz.key
+    scores = correct @ quiz.points
+    total = quiz.total_points
+    percent = scores * (100 / total) if total else np.zeros(len(scores))
+    if not len(scores):
+        nothing = np.full(count, np.nan)
+        return GradeResult(correct, scores, percent, percent > 0, nothing, nothing)
+
+    right = correct.astype(float)
+    # score on the other questions, so a question does not correlate
+    # with itself
+    rest = scores[:, None] - right * quiz.points
+    right_centered = right - right.mean(axis=0)
+    rest_centered = rest - rest.mean(axis=0)
+    spread = np.sqrt((right_centered**2).sum(axis=0) * (rest_centered**2).sum(axis=0))
+    discrimination = np.divide(
+        (right_centered * rest_centered).sum(axis=0),
+        spread,
+        out=np.full(count, np.nan),
+        where=spread > 0,
+    )
+
+    return GradeResult(
+        correct=correct,
+        scores=scores,
+        percent=percent,
+        passed=percent >= quiz.pass_percent,
+        difficulty=right.mean(axis=0),
+        discrimination=discrimination,
+    )
+
+
+def grade_sheets(block, sheets):
+    """
+    Grade a batch of answer sheets of a QUIZ block.
+    """
+    if block.block_type != ContentBlockType.QUIZ:
+        raise ValueError(f"block {block.pk} is not a quiz")
+    quiz = get_compiled_quiz(block)
+    return grade(quiz, encode_sheets(quiz, sheets))
+
+
+def grade_quiz_block(block_id, sheets):
+    """
+    `grade_sheets` by block id: one query (without the payload) while the
+    compiled quiz is cached.
+    """
+    block = ContentBlock.objects.only("pk", "block_type", "updated_at").get(
+        pk=block_id, block_type=ContentBlockType.QUIZ, is_active=True
+    )
+    return grade_sheets(block, sheets)
@@ -0,0 +1,90 @@
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from contentapp.cache import forget_lesson_course_ids, version_keys_for
+from contentapp.models import (
+    ContentBlock,
+    Course,
+    CoursePlacement,
+    GradeLevel,
+    Lesson,
+    Module,
+    Subject,
+)
+from sharedapp.cache import bump_versions_on_commit
+from sharedapp.signals import bulk_reordered, bulk_restored, bulk_soft_deleted
+
+CACHED_MODELS = (
+    GradeLevel,
+    Subject,
+    Course,
+    CoursePlacement,
+    Module,
+    Lesson,
+    ContentBlock,
+)
+
+
+def _rows(sender, instance):
+    return sender.all_objects.filter(pk=instance.pk)
+
+
+@receiver(pre_save)
+def remember_old_version_keys(sender, instance, raw=False, **kwargs):
+    """
+    Keys of the row as it is in the DB *before* the save, so moving a
+    lesson/block/placement also invalidates the place it moved away from.
+    """
+    if sender not in CACHED_MODELS or raw or instance.pk is None:
+        return
+    instance._old_version_keys = version_keys_for(sender, _rows(sender, instance))
+
+
+@receiver(post_save)
+def bump_on_save(sender, instance, raw=False, **kwargs):
+    # save() also covers TimeStampedSoftDeleteModel.delete() / restore()
+    if sender not in CACHED_MODELS or raw:
+        return
+    keys = version_keys_for(sender, _rows(sender, instance))
+    keys += getattr(instance, "_old_version_keys", [])
+    instance._old_version_keys = []
+    bump_versions_on_commit(keys)
+
+
+@receiver(pre_save, sender=Module)
+def remember_old_course(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    instance._old_course_id = (
+        Module.all_objects.filter(pk=instance.pk)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Module)
+def forget_moved_lesson_courses(sender, instance, raw=False, **kwargs):
+    # lesson_course_id of every lesson of a module moved to another course
+    old_course_id = getattr(instance, "_old_course_id", None)
+    instance._old_course_id = None
+    if raw or old_course_id in (None, instance.course_id):
+        return
+    forget_lesson_course_ids(
+        Lesson.all_objects.filter(module_id=instance.pk).values_list("pk", flat=True)
+    )
+
+
+@receiver(pre_delete)
+def bump_on_hard_delete(sender, instance, **kwargs):
+    if sender not in CACHED_MODELS:
+        return
+    bump_versions_on_commit(version_keys_for(sender, _rows(sender, instance)))
+
+
+@receiver(bulk_soft_deleted)
+@receiver(bulk_restored)
+@receiver(bulk_reordered)
+def bump_on_bulk_update(sender, queryset, **kwargs):
+    if sender not in CACHED_MODELS:
+        return
+    bump_versions_on_commit(version_keys_for(sender, queryset))
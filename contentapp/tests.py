@@ -1,3 +1,38 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from contentapp.cache import course_version_key, lesson_course_id
+from contentapp.models import Course, Lesson, Module
+from sharedapp.cache import get_versions
+
+
+class ModuleMoveCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.old = Course.objects.create(title="Old", slug="old")
+        self.new = Course.objects.create(title="New", slug="new")
+        self.module = Module.objects.create(course=self.old, title="Module")
+        self.lesson = Lesson.objects.create(module=self.module, title="Lesson")
+
+    def move_module(self):
+        # the cache is only touched once the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.module.course = self.new
+            self.module.save()
+
+    def test_moving_a_module_forgets_its_lessons_course(self):
+        self.assertEqual(lesson_course_id(self.lesson.pk), self.old.pk)
+
+        self.move_module()
+
+        self.assertEqual(lesson_course_id(self.lesson.pk), self.new.pk)
+
+    def test_moving_a_module_bumps_both_courses(self):
+        keys = [course_version_key(self.old.pk), course_version_key(self.new.pk)]
+        before = get_versions(keys)
+
+        self.move_module()
+
+        after = get_versions(keys)
+        self.assertNotEqual(after[0], before[0])
+        self.assertNotEqual(after[1], before[1])
@@ -1,7 +1,7 @@
-from django.contrib.auth import authenticate
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from accountapp.hashing import bounded_authenticate
 from accountapp.models import User
 
 
@@ -13,7 +13,8 @@ class AdminLoginSerializer(serializers.Serializer):
         phone = attrs.get("phone")
         password = attrs.get("password")
 
-        user = authenticate(phone=phone, password=password)
+        # PBKDF2 runs on the bounded login pool (429 when saturated)
+        user = bounded_authenticate(phone=phone, password=password)
 
         if not user:
             raise serializers.ValidationError("Invalid credentials")
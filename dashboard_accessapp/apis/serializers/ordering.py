@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from contentapp.models import ContentBlock, CoursePlacement, Lesson, Module
+from sharedapp.services.ordering import scope_of
+
+ORDERED_MODELS = {
+    "placement": CoursePlacement,
+    "module": Module,
+    "lesson": Lesson,
+    "block": ContentBlock,
+}
+
+
+class ReorderSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=list(ORDERED_MODELS))
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+
+    def validate(self, attrs):
+        model = ORDERED_MODELS[attrs["kind"]]
+        scope_fields = [
+            model._meta.get_field(name).attname for name in model.ordering_scope
+        ]
+        rows = model.objects.filter(pk__in=attrs["ids"])
+        missing = set(attrs["ids"]) - set(rows.values_list("pk", flat=True))
+        if missing:
+            raise serializers.ValidationError(f"Not found: {sorted(missing)}")
+        scopes = list(rows.values(*scope_fields).distinct())
+        if len(scopes) != 1:
+            raise serializers.ValidationError("ids must be siblings of one parent")
+
+        attrs["model"] = model
+        attrs["scope"] = scopes[0]
+        return attrs
+
+
+class MoveSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=list(ORDERED_MODELS))
+    id = serializers.IntegerField(min_value=1)
+    # null -> move to the front
+    after_id = serializers.IntegerField(min_value=1, allow_null=True, default=None)
+
+    def validate(self, attrs):
+        model = ORDERED_MODELS[attrs["kind"]]
+        pks = [pk for pk in (attrs["id"], attrs["after_id"]) if pk is not None]
+        rows = model.objects.in_bulk(pks)
+
+        instance = rows.get(attrs["id"])
+        if instance is None:
+            raise serializers.ValidationError("Item not found")
+
+        after = None
+        if attrs["after_id"] is not None:
+            after = rows.get(attrs["after_id"])
+            if after is None or scope_of(after) != scope_of(instance):
+                raise serializers.ValidationError("after_id must be a sibling")
+
+        attrs["instance"] = instance
+        attrs["after"] = after
+        return attrs
@@ -8,5 +8,6 @@ from rest_framework_simplejwt.views import (
 
 urlpatterns = [
     path("/auth", include("dashboard_accessapp.apis.urls.authentication")),
+    path("/content", include("dashboard_accessapp.apis.urls.content")),
 
 ]
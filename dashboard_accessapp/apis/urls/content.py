@@ -0,0 +1,9 @@
+from django.urls import path
+
+from dashboard_accessapp.apis.views import ordering
+
+
+urlpatterns = [
+    path("/reorder", ordering.ReorderView.as_view()),
+    path("/move", ordering.MoveView.as_view()),
+]
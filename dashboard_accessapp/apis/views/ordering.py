@@ -0,0 +1,43 @@
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import CreateAPIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from dashboard_accessapp.apis.serializers.ordering import (
+    MoveSerializer,
+    ReorderSerializer,
+)
+from sharedapp.services.ordering import OrderingError, move, reorder
+
+
+class ReorderView(CreateAPIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            reorder(data["model"], data["scope"], data["ids"])
+        except OrderingError as exc:  # rows changed since validation
+            raise ValidationError(str(exc))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class MoveView(CreateAPIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = MoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            instance = move(data["instance"], after=data["after"])
+        except OrderingError as exc:
+            raise ValidationError(str(exc))
+        return Response(
+            {"id": instance.pk, "order": instance.order}, status=status.HTTP_200_OK
+        )
@@ -1,3 +1,77 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accountapp.models import User
+from contentapp.models import Course, Module
+
+
+class OrderingApiTests(TestCase):
+    reorder_url = "/api/root-admin/content/reorder"
+    move_url = "/api/root-admin/content/move"
+
+    def setUp(self):
+        admin = User.base_objects.create_user("01900000000", "pass", is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+        self.course = Course.objects.create(title="Course", slug="course")
+        self.modules = [
+            Module.objects.create(course=self.course, title=f"M{i}", order=i * 1024)
+            for i in range(1, 4)
+        ]
+
+    def titles(self):
+        return list(
+            Module.objects.filter(course=self.course)
+            .order_by("order")
+            .values_list("title", flat=True)
+        )
+
+    def test_reorder(self):
+        first, second, third = self.modules
+
+        response = self.client.post(
+            self.reorder_url,
+            {"kind": "module", "ids": [third.pk, first.pk, second.pk]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.titles(), ["M3", "M1", "M2"])
+
+    def test_reorder_rejects_unknown_ids(self):
+        response = self.client.post(
+            self.reorder_url,
+            {"kind": "module", "ids": [self.modules[0].pk, 99999]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.titles(), ["M1", "M2", "M3"])
+
+    def test_reorder_rejects_ids_of_another_scope(self):
+        other = Course.objects.create(title="Other", slug="other")
+        stranger = Module.objects.create(course=other, title="X", order=1024)
+
+        response = self.client.post(
+            self.reorder_url,
+            {"kind": "module", "ids": [self.modules[0].pk, stranger.pk]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_move_to_front(self):
+        response = self.client.post(
+            self.move_url, {"kind": "module", "id": self.modules[2].pk}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.titles(), ["M3", "M1", "M2"])
+
+    def test_move_rejects_unknown_id(self):
+        response = self.client.post(
+            self.move_url, {"kind": "module", "id": 99999}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 400)
@@ -35,9 +35,12 @@ PACKAGE_APP = [
 ]
 
 PROJECT_APP = [
+    "sharedapp.apps.SharedappConfig",
     "accountapp.apps.AccountappConfig",
     "relationshipapp.apps.RelationshipsappConfig",
     "contentapp.apps.ContentappConfig",
+    "jobapp.apps.JobappConfig",
+    "progressapp.apps.ProgressappConfig",
 ]
 
 INSTALLED_APPS = DJANGO_APP + PACKAGE_APP + PROJECT_APP
@@ -86,6 +89,19 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+#
+# LocMem is per process. In production point "default" to a shared backend
+# (e.g. django.core.cache.backends.redis.RedisCache) so the content version
+# counters (sharedapp.cache) are shared by every worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -121,6 +137,22 @@ USE_TZ = True
 STATIC_URL = "static/"
 APPEND_SLASH= False
 AUTH_USER_MODEL = "accountapp.User"
+AUTHENTICATION_BACKENDS = ["accountapp.backends.PhoneBackend"]
+# User.phone is unique among alive users only (partial unique constraint),
+# the auth check only understands field-level unique=True.
+SILENCED_SYSTEM_CHECKS = ["auth.W004"]
+
+# country code for phone numbers given without one (accountapp.phone)
+PHONE_DEFAULT_COUNTRY_CODE = "880"
+
+# soft-deleted rows older than this are archived/removed by `purge_soft_deleted`
+SOFT_DELETE_RETENTION_DAYS = 90
+
+# ContentBlock.data above this size (bytes of JSON) is stored in
+# ContentBlockPayload and left out of the block rows (contentapp.payloads)
+CONTENT_PAYLOAD_INLINE_MAX_BYTES = 2048
+# compiled quizzes kept per process (contentapp.services.grading)
+QUIZ_GRADING_CACHE_SIZE = 256
 
 PICTURES = {
     "BREAKPOINTS": {
@@ -137,12 +169,66 @@ PICTURES = {
     "USE_PLACEHOLDERS": True,
     "QUEUE_NAME": "pictures",
     "BACKEND": "default",
-    "PROCESSOR": "pictures.tasks.process_picture",
+    # lazy mode: uploads only store the original, every rendition is
+    # encoded on its first request (sharedapp.renditions). For eager
+    # rendering off the request path use PillowPicture +
+    # jobapp.tasks.enqueue_process_picture (runs on the QUEUE_NAME queue).
+    "PICTURE_CLASS": "sharedapp.renditions.LazyPicture",
+    "PROCESSOR": "sharedapp.renditions.lazy_process_picture",
+}
+# background jobs (jobapp), executed by `manage.py run_jobs`
+JOBS = {
+    # worker processes per queue
+    "QUEUES": {
+        "default": {"concurrency": 2},
+        "pictures": {"concurrency": 2},
+    },
+    "POLL_INTERVAL": 1,  # seconds an idle worker waits before looking again
+    "LOCK_TIMEOUT": 60 * 10,  # seconds until a RUNNING job counts as abandoned
+    "BACKOFF_BASE": 10,  # seconds before the first retry, doubled per attempt
+    "BACKOFF_MAX": 60 * 60,
+    "MAX_ATTEMPTS": 5,
+    "KEEP_DONE_DAYS": 7,
+}
+
+# learner progress (progressapp.services.buffer): events are coalesced per
+# (student, block) in each process and written as bulk upserts
+PROGRESS = {
+    "FLUSH_INTERVAL": 5,  # seconds between flushes
+    "MAX_PENDING": 10_000,  # buffered (student, block) entries forcing a flush
+    # "buffered": lose at most FLUSH_INTERVAL of progress if a process dies,
+    # "immediate": write every event before answering
+    "DURABILITY": "buffered",
+    "BATCH_SIZE": 500,  # rows per INSERT ... ON CONFLICT
 }
+# video heartbeats (progressapp.services.heartbeat): played ranges are
+# merged per (student, block) in each process, summaries written per flush
+HEARTBEAT = {
+    "FLUSH_INTERVAL": 30,
+    "MAX_PENDING": 20_000,
+    "DURABILITY": "buffered",
+    "BATCH_SIZE": 500,
+    "MAX_SPAN": 60,  # longest range one heartbeat may report (seconds)
+    "MERGE_GAP": 2,  # ranges this close (seconds) are joined
+    "MAX_INTERVALS": 200,  # ranges kept per (student, block)
+    "COMPLETE_RATIO": 0.9,  # share of the video watched to complete the block
+    "BLOCK_CACHE_SIZE": 4096,  # video blocks cached per process
+    "BLOCK_CACHE_TIMEOUT": 60,  # seconds a cached block is trusted
+}
+
+# disk cache of the lazily rendered pictures (safe to wipe)
+PICTURE_RENDITION_DIR = BASE_DIR / "var" / "renditions"
+# placeholder images (USE_PLACEHOLDERS): encoded once, then served from an
+# in-process LRU of this many entries backed by a disk cache
+PLACEHOLDER_CACHE_SIZE = 512
+PLACEHOLDER_CACHE_DIR = BASE_DIR / "var" / "placeholders"
+# at most this many files in PLACEHOLDER_CACHE_DIR (placeholder URLs are
+# client-controlled), further ones are kept in the LRU only
+PLACEHOLDER_DISK_CACHE_MAX_FILES = 20_000
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accountapp.authentication.CachedJWTAuthentication',
     )
 }
 
@@ -160,7 +246,22 @@ SIMPLE_JWT = {
 
     "JTI_CLAIM": "jti",
     "CHECK_USER_IS_ACTIVE": True,
+
+    "TOKEN_OBTAIN_SERIALIZER": "accountapp.apis.serializers.authentication.BoundedTokenObtainPairSerializer",
+}
+
+# password checks of the login endpoints run on a dedicated bounded pool
+# (accountapp.hashing); above WORKERS + QUEUE_SIZE logins get a 429
+LOGIN_HASHING = {
+    "WORKERS": 4,
+    "QUEUE_SIZE": 32,
+    "TIMEOUT": 10,  # seconds to wait for a free worker + the hash
+    "RETRY_AFTER": 1,  # seconds, Retry-After of the 429
 }
+# seconds a cached auth snapshot (accountapp.authentication) lives;
+# writes to User/UserRole drop it right away
+AUTH_USER_SNAPSHOT_TIMEOUT = 60 * 5
+
 CORS_ALLOW_CREDENTIALS = True
 
 CORS_ALLOWED_ORIGINS = [
@@ -14,6 +14,20 @@ urlpatterns = [
     # admin panel login
     path("api/root-admin", include("dashboard_accessapp.apis.urls")),
 
+    # learner content (catalog, course outline, lessons)
+    path("api/content", include("contentapp.apis.urls")),
+    # same endpoints as native async views (serve through asgi.py)
+    path("api/async/content", include("contentapp.apis.urls.async_content")),
+
+    # learner progress events (written behind, progressapp.services.buffer)
+    path("api/progress", include("progressapp.apis.urls")),
+
+    # parent app
+    path("api/parent", include("relationshipapp.apis.urls")),
+
+    # picture renditions, rendered on first request (sharedapp.renditions)
+    path("renditions", include("sharedapp.urls")),
+
     # jwt token
     path('api/token', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh', TokenRefreshView.as_view(), name='token_refresh'),
@@ -23,5 +37,5 @@ urlpatterns = [
 
 if get_settings().USE_PLACEHOLDERS:
     urlpatterns += [
-        path("_pictures/", include("pictures.urls")),
+        path("_pictures/", include("sharedapp.placeholder_urls")),
     ]
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from jobapp.enums import JobStatus
+from jobapp.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "queue", "priority", "status", "attempts", "run_at")
+    list_filter = ("status", "queue")
+    search_fields = ("task",)
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry now")
+    def retry_now(self, request, queryset):
+        queryset.exclude(status=JobStatus.RUNNING).update(
+            status=JobStatus.QUEUED, run_at=timezone.now(), attempts=0
+        )
@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class JobStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"  # waiting for run_at / a free worker
+    RUNNING = "running", "Running"  # claimed by a worker
+    DONE = "done", "Done"
+    FAILED = "failed", "Failed"  # gave up after max_attempts
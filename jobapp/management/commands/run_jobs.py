@@ -0,0 +1,103 @@
+import multiprocessing
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from jobapp.services.queue import delete_finished, queue_concurrency, requeue_stale
+from jobapp.services.worker import work, worker_id
+
+MAINTENANCE_INTERVAL = 60  # seconds
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background job workers: one process per concurrency slot of "
+        "every queue (JOBS['QUEUES']), plus stale job recovery and cleanup "
+        "of old finished jobs in this supervising process. A worker that "
+        "dies (crash in a job) is replaced and its job handed out again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="queue to work on (repeatable, default: every configured queue)",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="worker processes per queue (default: the queue's concurrency)",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="exit once the queues are empty",
+        )
+
+    def handle(self, *args, **options):
+        queues = options["queues"] or list(settings.JOBS["QUEUES"])
+
+        def start(queue, number):
+            # forked workers must not share the parent's DB connections
+            connections.close_all()
+            process = multiprocessing.Process(
+                target=work,
+                args=(queue,),
+                kwargs={"burst": options["burst"]},
+                name=f"jobs-{queue}-{number}",
+            )
+            process.start()
+            return process
+
+        workers = {
+            (queue, number): start(queue, number)
+            for queue in queues
+            for number in range(options["processes"] or queue_concurrency(queue))
+        }
+        self.stdout.write(f"{len(workers)} workers on {', '.join(queues)}")
+
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+            for process in workers.values():
+                if process.is_alive():
+                    process.terminate()  # SIGTERM: finish the current job
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        last_maintenance = 0
+        while any(process.is_alive() for process in workers.values()):
+            if time.monotonic() - last_maintenance > MAINTENANCE_INTERVAL:
+                requeued, failed = requeue_stale()
+                deleted = delete_finished()
+                if requeued or failed or deleted:
+                    self.stdout.write(
+                        f"requeued {requeued} stale, failed {failed} stale, "
+                        f"deleted {deleted} done"
+                    )
+                last_maintenance = time.monotonic()
+            for process in workers.values():
+                process.join(timeout=1)
+            if not stopping:
+                self._replace_dead(workers, start, options["burst"])
+
+    def _replace_dead(self, workers, start, burst):
+        for (queue, number), process in workers.items():
+            # a burst worker exits 0 once its queue is empty
+            if process.is_alive() or (burst and process.exitcode == 0):
+                continue
+            # its job cannot finish anymore: hand it out again now rather
+            # than after LOCK_TIMEOUT
+            requeued, failed = requeue_stale(worker_id(process.pid))
+            self.stderr.write(
+                f"{process.name} died (exit code {process.exitcode}), "
+                f"requeued {requeued}, failed {failed}, restarting"
+            )
+            workers[queue, number] = start(queue, number)
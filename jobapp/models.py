@@ -0,0 +1,55 @@
+from django.db import models
+from django.utils import timezone
+
+from jobapp.enums import JobStatus
+
+
+class Job(models.Model):
+    """
+    One background call of `task` (dotted path of a function) with
+    `kwargs`, executed by `run_jobs` workers, see jobapp.services.queue.
+    """
+
+    queue = models.CharField(max_length=50, default="default")
+    task = models.CharField(max_length=200)
+    kwargs = models.JSONField(default=dict, blank=True)
+
+    # higher runs first
+    priority = models.SmallIntegerField(default=0)
+    status = models.CharField(
+        max_length=10, choices=JobStatus.choices, default=JobStatus.QUEUED
+    )
+    # not before (retries are pushed back here)
+    run_at = models.DateTimeField(default=timezone.now)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    last_error = models.TextField(blank=True)
+
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # claim: next due job of a queue, only queued rows are indexed
+            models.Index(
+                "queue",
+                models.F("priority").desc(),
+                "run_at",
+                name="job_claim_idx",
+                condition=models.Q(status=JobStatus.QUEUED),
+            ),
+            # concurrency limit + stale job recovery
+            models.Index(
+                fields=["queue", "locked_at"],
+                name="job_running_idx",
+                condition=models.Q(status=JobStatus.RUNNING),
+            ),
+            models.Index(fields=["status", "finished_at"], name="job_finished_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} [{self.queue}] ({self.status})"
@@ -0,0 +1,186 @@
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from jobapp.enums import JobStatus
+from jobapp.models import Job
+
+# -----------------------------
+# Database job queue
+# -----------------------------
+#
+# Jobs are rows of jobapp.Job, so no broker is needed and a job enqueued
+# inside a transaction only becomes visible when that transaction commits.
+#
+# Claiming the next job of a queue:
+#   - Postgres: SELECT ... FOR UPDATE SKIP LOCKED, workers never wait on
+#     each other and never get the same row,
+#   - SQLite (dev/tests): compare-and-set UPDATE ... WHERE status='queued',
+#     the first worker to flip the row wins.
+#
+# Failed jobs are retried with exponential backoff (+ jitter) until
+# max_attempts. A job whose worker died is handed out again by
+# `requeue_stale` (or failed once max_attempts is used up): right away
+# when run_jobs sees the worker process die, after LOCK_TIMEOUT otherwise
+# (it no longer counts against the queue's concurrency by then). LOCK_TIMEOUT must exceed the longest job: one running longer
+# is handed out a second time (only the last claim records its outcome).
+#
+# Settings: JOBS = {"QUEUES": {name: {"concurrency": n}}, "POLL_INTERVAL",
+# "LOCK_TIMEOUT", "BACKOFF_BASE", "BACKOFF_MAX", "MAX_ATTEMPTS", "KEEP_DONE_DAYS"}
+
+
+def queue_concurrency(queue):
+    return settings.JOBS["QUEUES"].get(queue, {}).get("concurrency", 1)
+
+
+def enqueue(
+    task, *, queue="default", priority=0, run_at=None, max_attempts=None, **kwargs
+):
+    """
+    Schedule `task(**kwargs)`; `task` is a dotted path, kwargs must be JSON.
+    """
+    return Job.objects.create(
+        task=task,
+        kwargs=kwargs,
+        queue=queue,
+        priority=priority,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or settings.JOBS["MAX_ATTEMPTS"],
+    )
+
+
+def backoff(attempts):
+    """
+    Delay before retry number `attempts` (1, 2, ...).
+    """
+    delay = min(
+        settings.JOBS["BACKOFF_BASE"] * 2 ** (attempts - 1),
+        settings.JOBS["BACKOFF_MAX"],
+    )
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def _lock_cutoff():
+    return timezone.now() - timedelta(seconds=settings.JOBS["LOCK_TIMEOUT"])
+
+
+def _running(queue):
+    # stale locks (dead workers) do not hold a concurrency slot
+    return Job.objects.filter(
+        queue=queue, status=JobStatus.RUNNING, locked_at__gte=_lock_cutoff()
+    ).count()
+
+
+def claim_job(queue, worker_id):
+    """
+    Mark the next due job of `queue` RUNNING for `worker_id` and return it,
+    None when nothing is due or the queue is at its concurrency limit.
+    """
+    now = timezone.now()
+    due = Job.objects.filter(
+        queue=queue, status=JobStatus.QUEUED, run_at__lte=now
+    ).order_by("-priority", "run_at", "pk")
+    claim = {
+        "status": JobStatus.RUNNING,
+        "attempts": F("attempts") + 1,
+        "locked_at": now,
+        "locked_by": worker_id,
+    }
+    limit = queue_concurrency(queue)
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            # across hosts the limit is best effort (no lock on the count)
+            if _running(queue) >= limit:
+                return None
+            pk = (
+                due.select_for_update(skip_locked=True)
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if pk is None:
+                return None
+            Job.objects.filter(pk=pk).update(**claim)
+        return Job.objects.get(pk=pk)
+
+    for pk in due.values_list("pk", flat=True)[:10]:
+        if _running(queue) >= limit:
+            return None
+        if Job.objects.filter(pk=pk, status=JobStatus.QUEUED).update(**claim):
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def run_job(job):
+    """
+    Execute a claimed job and record the outcome. Returns True on success.
+
+    The outcome is only written while the job is still locked by this
+    worker: a job that outlived LOCK_TIMEOUT may have been requeued and
+    claimed by another worker, whose outcome wins.
+    """
+    claimed = Job.objects.filter(
+        pk=job.pk, status=JobStatus.RUNNING, locked_by=job.locked_by
+    )
+    try:
+        import_string(job.task)(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            update = {
+                "status": JobStatus.QUEUED,
+                "run_at": timezone.now() + backoff(job.attempts),
+            }
+        else:
+            update = {"status": JobStatus.FAILED, "finished_at": timezone.now()}
+        claimed.update(last_error=error, locked_at=None, locked_by="", **update)
+        return False
+
+    claimed.update(status=JobStatus.DONE, finished_at=timezone.now(), locked_at=None)
+    return True
+
+
+def requeue_stale(worker_id=None):
+    """
+    RUNNING jobs whose worker has not finished them within LOCK_TIMEOUT
+    (crashed / killed), or every RUNNING job of `worker_id` (a worker
+    known to be dead), go back to the queue, or are FAILED once they have
+    used all their attempts (a job that kills its worker every time).
+    Returns (requeued, failed).
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(status=JobStatus.RUNNING)
+    if worker_id is None:
+        stale = stale.filter(locked_at__lt=_lock_cutoff())
+    else:
+        stale = stale.filter(locked_by=worker_id)
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=JobStatus.FAILED,
+        finished_at=now,
+        locked_at=None,
+        locked_by="",
+        last_error="worker lost (no outcome)",
+    )
+    requeued = stale.update(
+        status=JobStatus.QUEUED, locked_at=None, locked_by="", run_at=now
+    )
+    return requeued, failed
+
+
+def delete_finished(batch_size=1000):
+    """
+    Drop DONE jobs older than KEEP_DONE_DAYS (failed ones are kept for
+    inspection), in batches.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.JOBS["KEEP_DONE_DAYS"])
+    old = Job.objects.filter(status=JobStatus.DONE, finished_at__lt=cutoff)
+    deleted = 0
+    while pks := list(old.values_list("pk", flat=True)[:batch_size]):
+        deleted += Job.objects.filter(pk__in=pks)._raw_delete(Job.objects.db)
+    return deleted
@@ -0,0 +1,54 @@
+import os
+import signal
+import socket
+import time
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections
+
+# This module is the target of the run_jobs worker processes. Under the
+# spawn / forkserver start methods a child imports it before Django is set
+# up, so it must not import models (or anything importing them) at module
+# level: the queue is imported inside `work`, after django.setup().
+
+
+def worker_id(pid):
+    """
+    Job.locked_by of the worker process `pid`.
+    """
+    return f"{socket.gethostname()}:{pid}"
+
+
+def work(queue, burst=False):
+    """
+    Worker process loop: claim and run jobs of `queue` one at a time.
+
+    SIGTERM / SIGINT finish the current job, then exit. With `burst` the
+    worker exits as soon as the queue has no due job.
+    """
+    if not apps.ready:
+        # spawned (not forked) process
+        django.setup()
+    from jobapp.services.queue import claim_job, run_job
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    locked_by = worker_id(os.getpid())
+    while not stopping:
+        close_old_connections()
+        job = claim_job(queue, locked_by)
+        if job is None:
+            if burst:
+                return
+            time.sleep(settings.JOBS["POLL_INTERVAL"])
+            continue
+        run_job(job)
@@ -0,0 +1,29 @@
+from pictures import conf
+from pictures.tasks import _process_picture
+
+from jobapp.services.queue import enqueue
+
+
+def process_picture(*, storage, file_name, sender=None, new=None, old=None):
+    """
+    Job: render / delete renditions of one picture (django-pictures).
+    """
+    _process_picture(
+        storage=storage, file_name=file_name, sender=sender, new=new, old=old
+    )
+
+
+def enqueue_process_picture(*, storage, file_name, sender, new=None, old=None):
+    """
+    PICTURES["PROCESSOR"] that runs the rendering on the pictures queue
+    (QUEUE_NAME) instead of inside the upload request.
+    """
+    enqueue(
+        "jobapp.tasks.process_picture",
+        queue=conf.app_settings.QUEUE_NAME,
+        storage=storage,
+        file_name=file_name,
+        sender=sender,
+        new=new,
+        old=old,
+    )
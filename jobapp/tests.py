@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from jobapp.enums import JobStatus
+from jobapp.models import Job
+from jobapp.services.queue import claim_job, enqueue, requeue_stale
+
+# only claimed here, never run
+TASK = "jobapp.tasks.process_picture"
+
+
+class QueueTests(TestCase):
+    def run_elsewhere(self, job, worker, minutes_ago=0):
+        Job.objects.filter(pk=job.pk).update(
+            status=JobStatus.RUNNING,
+            attempts=1,
+            locked_by=worker,
+            locked_at=timezone.now() - timedelta(minutes=minutes_ago),
+        )
+
+    def test_claim_respects_the_concurrency_limit(self):
+        # "default" runs 2 jobs at a time
+        for worker in ("a", "b"):
+            self.run_elsewhere(enqueue(TASK), worker)
+        enqueue(TASK)
+
+        self.assertIsNone(claim_job("default", "c"))
+
+    def test_stale_locks_do_not_hold_a_slot(self):
+        self.run_elsewhere(enqueue(TASK), "a", minutes_ago=60)
+        self.run_elsewhere(enqueue(TASK), "b", minutes_ago=60)
+        queued = enqueue(TASK)
+
+        self.assertEqual(claim_job("default", "c").pk, queued.pk)
+
+    def test_requeue_the_jobs_of_a_dead_worker(self):
+        job = enqueue(TASK)
+        spent = enqueue(TASK, max_attempts=1)
+        other = enqueue(TASK)
+        self.run_elsewhere(job, "dead")
+        self.run_elsewhere(spent, "dead")
+        self.run_elsewhere(other, "alive")
+
+        self.assertEqual(requeue_stale("dead"), (1, 1))
+
+        statuses = dict(Job.objects.values_list("pk", "status"))
+        self.assertEqual(statuses[job.pk], JobStatus.QUEUED)
+        self.assertEqual(statuses[spent.pk], JobStatus.FAILED)
+        self.assertEqual(statuses[other.pk], JobStatus.RUNNING)
@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from progressapp.models import BlockProgress, LessonProgress
+
+
+@admin.register(BlockProgress)
+class BlockProgressAdmin(admin.ModelAdmin):
+    list_display = ("student", "block", "started_at", "completed_at", "score")
+    raw_id_fields = ("student", "block", "lesson")
+
+
+@admin.register(LessonProgress)
+class LessonProgressAdmin(admin.ModelAdmin):
+    list_display = ("student", "lesson", "blocks_completed", "completed_at", "score")
+    raw_id_fields = ("student", "lesson", "last_block")
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+MAX_EVENTS = 100
+
+
+class ProgressEventSerializer(serializers.Serializer):
+    block_id = serializers.IntegerField(min_value=1)
+    # seconds / page reached inside the block
+    position = serializers.IntegerField(min_value=0, required=False)
+    completed = serializers.BooleanField(default=False)
+    score = serializers.FloatField(min_value=0, max_value=100, required=False)
+
+
+class ProgressEventsSerializer(serializers.Serializer):
+    events = ProgressEventSerializer(
+        many=True, allow_empty=False, max_length=MAX_EVENTS
+    )
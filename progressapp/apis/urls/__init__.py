@@ -0,0 +1,9 @@
+from django.urls import path
+
+from progressapp.apis.views import events, heartbeat, unlocks
+
+urlpatterns = [
+    path("/events", events.ProgressEventsView.as_view()),
+    path("/heartbeat", heartbeat.heartbeat),
+    path("/courses/<int:course_id>/unlocks", unlocks.CourseUnlocksView.as_view()),
+]
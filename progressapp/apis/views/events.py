@@ -0,0 +1,83 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accountapp.permissions import IsStudent
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock
+from progressapp.apis.serializers.events import ProgressEventsSerializer
+from progressapp.services.buffer import get_progress_buffer
+from progressapp.services.unlock import get_unlock_map
+
+
+class ProgressEventsView(APIView):
+    """
+    Progress events of the requesting student, buffered and written in
+    bulk (progressapp.services.buffer): 202, visible within FLUSH_INTERVAL.
+
+    Events are dropped (and their blocks listed in the response) for
+    blocks that are unknown / inactive, in a lesson the student has not
+    unlocked (progressapp.services.unlock; a lesson opens once the
+    completion of the previous one is flushed), or that carry a score
+    on anything but a quiz block.
+    """
+
+    permission_classes = [IsStudent]
+
+    def post(self, request, *args, **kwargs):
+        serializer = ProgressEventsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        events = serializer.validated_data["events"]
+        student_id = request.user.pk
+
+        blocks = {
+            pk: (lesson_id, block_type, course_id)
+            for pk, lesson_id, block_type, course_id in ContentBlock.objects.filter(
+                pk__in={event["block_id"] for event in events}, is_active=True
+            ).values_list("pk", "lesson_id", "block_type", "lesson__module__course_id")
+        }
+        unlocked = set()
+        for course_id in {course_id for _, _, course_id in blocks.values()}:
+            unlock_map = get_unlock_map(student_id, course_id)
+            if unlock_map is not None:
+                unlocked.update(
+                    lesson["id"]
+                    for lesson in unlock_map["lessons"]
+                    if lesson["unlocked"]
+                )
+
+        buffer = get_progress_buffer()
+        accepted = 0
+        unknown, locked, scored = set(), set(), set()
+        for event in events:
+            block_id = event["block_id"]
+            if block_id not in blocks:
+                unknown.add(block_id)
+                continue
+            lesson_id, block_type, _ = blocks[block_id]
+            if lesson_id not in unlocked:
+                locked.add(block_id)
+                continue
+            if "score" in event and block_type != ContentBlockType.QUIZ:
+                scored.add(block_id)
+                continue
+            buffer.record(
+                student_id,
+                block_id,
+                lesson_id,
+                position=event.get("position"),
+                completed=event["completed"],
+                score=event.get("score"),
+            )
+            accepted += 1
+
+        return Response(
+            {
+                "accepted": accepted,
+                "unknown_blocks": sorted(unknown),
+                "locked_blocks": sorted(locked),
+                # only quiz blocks are scored
+                "unscored_blocks": sorted(scored),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -0,0 +1,81 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework.exceptions import AuthenticationFailed
+
+from accountapp.authentication import CachedJWTAuthentication
+from accountapp.enums import Role
+from accountapp.roles import mask_has_role
+from progressapp.services.heartbeat import get_heartbeat_buffer, get_video_block
+
+# A heartbeat is {"block_id": <id>, "from": <second>, "to": <second>}: the
+# range of the video played since the previous one. It is sent every few
+# seconds by every watching student, so this is a plain Django view: no
+# DRF request / negotiation / serializer, the JWT is checked by
+# CachedJWTAuthentication (no query) and the fixed-shape body by hand.
+
+HEARTBEAT_KEYS = frozenset(("block_id", "from", "to"))
+# generous for the 3 small integers above
+MAX_BODY_BYTES = 256
+
+_authentication = CachedJWTAuthentication()
+
+
+def _error(detail, status):
+    return JsonResponse({"detail": detail}, status=status)
+
+
+def parse_heartbeat(body, max_span):
+    """
+    (block_id, start, end) of a heartbeat body. Raises ValueError.
+    """
+    if len(body) > MAX_BODY_BYTES:
+        raise ValueError("heartbeat too large")
+    payload = json.loads(body)
+    if type(payload) is not dict or payload.keys() != HEARTBEAT_KEYS:
+        raise ValueError("expected exactly block_id, from and to")
+    block_id, start, end = payload["block_id"], payload["from"], payload["to"]
+    # type() is: rejects floats and booleans
+    if not (type(block_id) is int and type(start) is int and type(end) is int):
+        raise ValueError("block_id, from and to must be integers")
+    if block_id <= 0 or not 0 <= start <= end or end - start > max_span:
+        raise ValueError(f"need 0 <= from <= to <= from + {max_span}")
+    return block_id, start, end
+
+
+@csrf_exempt
+@require_POST
+def heartbeat(request):
+    """
+    Buffer one heartbeat of the requesting student: 204, written within
+    HEARTBEAT["FLUSH_INTERVAL"] (progressapp.services.heartbeat).
+    """
+    try:
+        authenticated = _authentication.authenticate(request)
+    except AuthenticationFailed as exc:
+        # same body as DRF (InvalidToken details are a dict)
+        detail = exc.detail
+        return JsonResponse(
+            detail if isinstance(detail, dict) else {"detail": detail}, status=401
+        )
+    if authenticated is None:
+        return _error("Authentication credentials were not provided.", 401)
+    user = authenticated[0]
+    if not mask_has_role(getattr(user, "role_mask", 0), Role.STUDENT):
+        return _error("You do not have permission to perform this action.", 403)
+
+    try:
+        block_id, start, end = parse_heartbeat(
+            request.body, settings.HEARTBEAT["MAX_SPAN"]
+        )
+    except ValueError as exc:  # json.JSONDecodeError / UnicodeDecodeError too
+        return _error(str(exc), 400)
+
+    video = get_video_block(block_id)
+    if video is None:
+        return _error("Unknown video block.", 404)
+    get_heartbeat_buffer().record_heartbeat(user.pk, block_id, video, start, end)
+    return HttpResponse(status=204)
@@ -0,0 +1,22 @@
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accountapp.permissions import IsStudent
+from progressapp.services.unlock import get_unlock_map
+
+
+class CourseUnlocksView(APIView):
+    """
+    Lessons of a course the requesting student may open
+    (progressapp.services.unlock): no query while cached.
+    """
+
+    permission_classes = [IsStudent]
+
+    def get(self, request, course_id, *args, **kwargs):
+        unlocks = get_unlock_map(request.user.pk, course_id)
+        if unlocks is None:
+            raise NotFound("Course not found")
+        return Response(unlocks, status=status.HTTP_200_OK)
@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class ProgressappConfig(AppConfig):
+    name = "progressapp"
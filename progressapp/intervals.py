@@ -0,0 +1,70 @@
+from bisect import bisect_left
+
+# -----------------------------
+# Watched interval sets
+# -----------------------------
+#
+# What a student watched of a video is a list of [start, end) second
+# ranges, sorted and non-overlapping. Ranges closer than `gap` seconds are
+# joined (a heartbeat lost on the way does not split the set), so a
+# linear watch stays a single range however many heartbeats it took.
+
+
+def add_interval(intervals, start, end, gap=0):
+    """
+    Merge [start, end) into the sorted list `intervals`, in place.
+    """
+    if end <= start:
+        return intervals
+    # fast path: playback continues the last range
+    if intervals and intervals[-1][0] <= start <= intervals[-1][1] + gap:
+        if end > intervals[-1][1]:
+            intervals[-1][1] = end
+        return intervals
+
+    index = bisect_left(intervals, [start])
+    if index and intervals[index - 1][1] + gap >= start:
+        index -= 1
+    stop = index
+    while stop < len(intervals) and intervals[stop][0] <= end + gap:
+        start = min(start, intervals[stop][0])
+        end = max(end, intervals[stop][1])
+        stop += 1
+    intervals[index:stop] = [[start, end]]
+    return intervals
+
+
+def merge_intervals(*interval_lists, gap=0):
+    """
+    Union of several interval sets, as a new sorted list.
+    """
+    ranges = sorted(
+        (start, end) for intervals in interval_lists for start, end in intervals
+    )
+    merged = []
+    for start, end in ranges:
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1] + gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def compact(intervals, limit):
+    """
+    At most `limit` ranges: the closest ones are joined (the gaps between
+    them count as watched).
+    """
+    if len(intervals) <= limit:
+        return intervals
+    gaps = sorted(b[0] - a[1] for a, b in zip(intervals, intervals[1:]))
+    return merge_intervals(intervals, gap=gaps[len(intervals) - limit - 1])
+
+
+def covered(intervals):
+    """
+    Seconds covered by an interval set.
+    """
+    return sum(end - start for start, end in intervals)
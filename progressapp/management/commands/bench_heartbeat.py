@@ -0,0 +1,148 @@
+import json
+import math
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountapp.enums import Role
+from accountapp.models import User
+from accountapp.roles import ROLE_BITS, masks_with_any
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock
+from progressapp.services.buffer import get_progress_buffer
+from progressapp.services.heartbeat import get_heartbeat_buffer
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay simulated video heartbeats of existing students on existing "
+        "VIDEO blocks through the whole Django stack in this process (one "
+        "worker, one thread), against the heartbeat endpoint and against the "
+        "DRF progress events endpoint, and print requests/sec and latency "
+        "percentiles of each, then the time of the final flush. Writes "
+        "progress of those students: use a development database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=10_000)
+        parser.add_argument("--students", type=int, default=200)
+        parser.add_argument("--blocks", type=int, default=5)
+        parser.add_argument(
+            "--interval", type=int, default=5, help="seconds played per heartbeat"
+        )
+        parser.add_argument(
+            "--seek-share",
+            type=float,
+            default=0.05,
+            help="share of heartbeats after a seek",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        students = list(
+            User.objects.filter(
+                role_mask__in=masks_with_any(ROLE_BITS[Role.STUDENT])
+            ).order_by("pk")[: options["students"]]
+        )
+        videos = list(
+            ContentBlock.objects.filter(
+                block_type=ContentBlockType.VIDEO, is_active=True
+            ).order_by("pk")[: options["blocks"]]
+        )
+        if not students or not videos:
+            raise CommandError("Needs at least one student and one active VIDEO block")
+
+        heartbeats = self._heartbeats(students, videos, options)
+        self.stdout.write(
+            f"{len(heartbeats)} heartbeats of {len(students)} students "
+            f"on {len(videos)} videos"
+        )
+        client = Client()
+
+        def heartbeat_request(token, block_id, start, end):
+            return client.post(
+                "/api/progress/heartbeat",
+                json.dumps({"block_id": block_id, "from": start, "to": end}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=token,
+            )
+
+        def events_request(token, block_id, start, end):
+            return client.post(
+                "/api/progress/events",
+                json.dumps({"events": [{"block_id": block_id, "position": end}]}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=token,
+            )
+
+        for name, send, buffer in (
+            ("heartbeat", heartbeat_request, get_heartbeat_buffer()),
+            ("events", events_request, get_progress_buffer()),
+        ):
+            latencies, errors, elapsed = self._run(send, heartbeats)
+            started = time.perf_counter()
+            flushed = buffer.flush()
+            flush_seconds = time.perf_counter() - started
+            self._report(name, latencies, errors, elapsed)
+            self.stdout.write(
+                f"{'':<10} final flush: {flushed} rows in "
+                f"{flush_seconds * 1000:.0f} ms"
+            )
+
+    def _heartbeats(self, students, videos, options):
+        rng = random.Random(options["seed"])
+        tokens = {
+            student.pk: f"Bearer {AccessToken.for_user(student)}"
+            for student in students
+        }
+        durations = {
+            video.pk: ContentBlock.all_objects.filter(pk=video.pk)
+            .values_list("data__duration_seconds", flat=True)
+            .first()
+            or 600
+            for video in videos
+        }
+        step = options["interval"]
+        positions = {}
+        heartbeats = []
+        for _ in range(options["requests"]):
+            student = rng.choice(students)
+            block_id = rng.choice(videos).pk
+            key = (student.pk, block_id)
+            start = positions.get(key, 0)
+            if rng.random() < options["seek_share"]:
+                start = rng.randrange(durations[block_id])
+            end = start + step
+            positions[key] = end % durations[block_id]
+            heartbeats.append((tokens[student.pk], block_id, start, end))
+        return heartbeats
+
+    def _run(self, send, heartbeats):
+        latencies = []
+        errors = 0
+        started = time.perf_counter()
+        for heartbeat in heartbeats:
+            sent = time.perf_counter()
+            response = send(*heartbeat)
+            if response.status_code in (202, 204):
+                latencies.append(time.perf_counter() - sent)
+            else:
+                errors += 1
+        return latencies, errors, time.perf_counter() - started
+
+    def _report(self, name, latencies, errors, elapsed):
+        latencies.sort()
+
+        def percentile(p):
+            if not latencies:
+                return math.nan
+            return latencies[max(0, math.ceil(p * len(latencies)) - 1)] * 1000
+
+        self.stdout.write(
+            f"{name:<10} {len(latencies) / elapsed:8.1f} req/s  "
+            f"p50 {percentile(0.50):6.2f} ms  p99 {percentile(0.99):6.2f} ms  "
+            f"errors {errors}"
+        )
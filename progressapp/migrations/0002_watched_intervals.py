@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-17 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("progressapp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blockprogress",
+            name="watched",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="blockprogress",
+            name="watched_seconds",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
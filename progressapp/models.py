@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.db import models
+
+from contentapp.models import ContentBlock, Lesson
+
+
+class BlockProgress(models.Model):
+    """
+    A student's progress on one content block.
+
+    Written in bulk by the progress buffers (progressapp.services.buffer,
+    progressapp.services.heartbeat), never one row per event. Merging is
+    monotonic: the earliest start and completion, the best score, the
+    position of the latest event and the union of the watched intervals
+    win, so writing the same events twice changes nothing.
+
+    RELATIONSHIPS:
+        User (student) 1 ---< BlockProgress >--- 1 ContentBlock
+    """
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="block_progress",
+    )
+    block = models.ForeignKey(
+        ContentBlock, on_delete=models.CASCADE, related_name="progress"
+    )
+    # denormalized from block, for the lesson roll-up
+    lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name="+")
+
+    started_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    score = models.FloatField(null=True, blank=True)  # percent, best so far
+    # last position inside the block (seconds of a video, page, ...)
+    position = models.PositiveIntegerField(null=True, blank=True)
+    # video blocks: merged [start, end) seconds watched (progressapp.intervals)
+    # and the seconds they cover, from the heartbeats
+    watched = models.JSONField(default=list, blank=True)
+    watched_seconds = models.PositiveIntegerField(default=0)
+    # time of the latest event
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "block"], name="uniq_block_progress"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["student", "lesson"], name="block_progress_lesson_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} · block {self.block_id}"
+
+
+class LessonProgress(models.Model):
+    """
+    Roll-up of a student's BlockProgress rows of one lesson, recomputed
+    after every flush that touched the lesson.
+
+    RELATIONSHIPS:
+        User (student) 1 ---< LessonProgress >--- 1 Lesson
+    """
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="lesson_progress",
+    )
+    lesson = models.ForeignKey(
+        Lesson, on_delete=models.CASCADE, related_name="progress"
+    )
+
+    started_at = models.DateTimeField()
+    # all active blocks of the lesson completed
+    completed_at = models.DateTimeField(null=True, blank=True)
+    blocks_completed = models.PositiveIntegerField(default=0)
+    score = models.FloatField(null=True, blank=True)  # mean of the scored blocks
+    # block of the latest event (resume here)
+    last_block = models.ForeignKey(
+        ContentBlock, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "lesson"], name="uniq_lesson_progress"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} · lesson {self.lesson_id}"
@@ -0,0 +1,231 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections
+from django.utils import timezone
+
+from progressapp.services.store import upsert_block_progress, without_orphans
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Write-behind progress buffer
+# -----------------------------
+#
+# Progress events (video ticks, block opened / completed, quiz scores)
+# arrive far more often than progress needs to be written. Each process
+# keeps one buffer that coalesces events per (student, block) in memory
+# (same merge rules as progressapp.services.store) and a background
+# thread flushes it as bulk upserts:
+#
+#   - every FLUSH_INTERVAL seconds,
+#   - right away once MAX_PENDING (student, block) entries are waiting,
+#   - on graceful shutdown (atexit, e.g. gunicorn / uvicorn SIGTERM).
+#
+# DURABILITY:
+#   "buffered"   events are acknowledged before they are written; a
+#                crashed / killed process loses at most FLUSH_INTERVAL
+#                seconds of progress,
+#   "immediate"  every `record` writes before returning (no coalescing
+#                across requests, for tests / low traffic).
+#
+# A flush that fails puts its entries back and is retried next interval.
+# The merge is monotonic, so an entry written twice (retry, buffer copied
+# into a forked child) changes nothing.
+#
+# Settings: PROGRESS = {"FLUSH_INTERVAL", "MAX_PENDING", "DURABILITY",
+# "BATCH_SIZE"}
+
+BUFFERED = "buffered"
+IMMEDIATE = "immediate"
+
+
+def merge_entry(entry, other):
+    """
+    Fold `other` (a later or concurrent entry of the same key) into `entry`.
+    """
+    entry["lesson_id"] = other["lesson_id"]
+    entry["started_at"] = min(entry["started_at"], other["started_at"])
+    if other["completed_at"] and (
+        entry["completed_at"] is None or other["completed_at"] < entry["completed_at"]
+    ):
+        entry["completed_at"] = other["completed_at"]
+    if other["score"] is not None and (
+        entry["score"] is None or other["score"] > entry["score"]
+    ):
+        entry["score"] = other["score"]
+    if other["position"] is not None and (
+        entry["position"] is None or other["updated_at"] >= entry["updated_at"]
+    ):
+        entry["position"] = other["position"]
+    entry["updated_at"] = max(entry["updated_at"], other["updated_at"])
+
+
+class ProgressBuffer:
+    thread_name = "progress-flusher"
+
+    def __init__(
+        self, flush_interval=5, max_pending=10_000, durability=BUFFERED, batch_size=500
+    ):
+        if durability not in (BUFFERED, IMMEDIATE):
+            raise ValueError(f"Unknown progress durability {durability!r}")
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.durability = durability
+        self.batch_size = batch_size
+
+        self._pending = {}
+        self._lock = threading.Lock()
+        # one flush at a time (timer, early flush, shutdown)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+    def record(
+        self,
+        student_id,
+        block_id,
+        lesson_id,
+        *,
+        position=None,
+        completed=False,
+        score=None,
+        at=None,
+    ):
+        """
+        Buffer one progress event of `student_id` on `block_id`.
+        """
+        at = at or timezone.now()
+        entry = {
+            "student_id": student_id,
+            "block_id": block_id,
+            "lesson_id": lesson_id,
+            "started_at": at,
+            "completed_at": at if completed else None,
+            "score": score,
+            "position": position,
+            "updated_at": at,
+        }
+        self.record_entries([entry])
+
+    def record_entries(self, entries):
+        """
+        Buffer already built entries (dicts of store.BLOCK_COLUMNS).
+        """
+        if self.durability == IMMEDIATE:
+            self._write(self._coalesce(entries))
+            return
+
+        with self._lock:
+            self._ensure_flusher()
+            self._add(self._pending, entries)
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    @staticmethod
+    def _add(pending, entries):
+        for entry in entries:
+            key = (entry["student_id"], entry["block_id"])
+            current = pending.get(key)
+            if current is None:
+                pending[key] = dict(entry)
+            else:
+                merge_entry(current, entry)
+
+    def _coalesce(self, entries):
+        pending = {}
+        self._add(pending, entries)
+        return pending.values()
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def flush(self):
+        """
+        Write everything buffered so far. Returns the number of entries.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                return self._write(pending.values())
+            except BaseException:
+                # keep them for the next flush, newer events merge in
+                with self._lock:
+                    self._add(pending, self._pending.values())
+                    self._pending = pending
+                raise
+
+    def _write(self, entries):
+        try:
+            return self._store(entries)
+        except IntegrityError:
+            # a block / student was hard deleted after its event: drop
+            # those entries instead of retrying them forever
+            return self._store(without_orphans(entries))
+
+    def _store(self, entries):
+        return upsert_block_progress(entries, batch_size=self.batch_size)
+
+    def close(self):
+        """
+        Stop the flusher and write what is left (graceful shutdown).
+        """
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval + 30)
+        self.flush()
+
+    def _ensure_flusher(self):
+        # called with self._lock held
+        if self._pid != os.getpid():
+            # first use, or a forked child (its copy of the parent's buffer
+            # is dropped: the parent writes those entries itself)
+            self._pid = os.getpid()
+            self._pending = {}
+            self._thread = threading.Thread(
+                target=self._run, name=self.thread_name, daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Progress flush failed, retrying")
+            finally:
+                # not a request thread: nobody else recycles its connection
+                close_old_connections()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_progress_buffer():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                config = settings.PROGRESS
+                _buffer = ProgressBuffer(
+                    flush_interval=config["FLUSH_INTERVAL"],
+                    max_pending=config["MAX_PENDING"],
+                    durability=config["DURABILITY"],
+                    batch_size=config["BATCH_SIZE"],
+                )
+    return _buffer
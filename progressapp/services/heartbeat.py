@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock
+from contentapp.payloads import load_payloads
+from progressapp.intervals import add_interval, compact
+from progressapp.services.buffer import BUFFERED, ProgressBuffer, merge_entry
+from progressapp.services.store import upsert_watched
+
+# -----------------------------
+# Video heartbeats
+# -----------------------------
+#
+# The player of a VIDEO block reports every few seconds which range of the
+# video it just played. Heartbeats never touch the database on the way in:
+#
+#   - the block (lesson, duration) comes from an in-process cache of
+#     BLOCK_CACHE_SIZE entries, each trusted for BLOCK_CACHE_TIMEOUT
+#     seconds,
+#   - the ranges are merged per (student, block) into an interval set
+#     (progressapp.intervals) by a HeartbeatBuffer, a ProgressBuffer whose
+#     flushes union the sets into BlockProgress.watched
+#     (store.upsert_watched) and complete the block once COMPLETE_RATIO of
+#     the video is covered.
+#
+# A continuous watch stays one [start, end) range in memory however many
+# heartbeats it took, so a flush writes one summary per (student, block).
+#
+# Settings: HEARTBEAT = {"FLUSH_INTERVAL", "MAX_PENDING", "DURABILITY",
+# "BATCH_SIZE", "MAX_SPAN", "MERGE_GAP", "MAX_INTERVALS", "COMPLETE_RATIO",
+# "BLOCK_CACHE_SIZE", "BLOCK_CACHE_TIMEOUT"}
+
+VideoBlock = namedtuple("VideoBlock", "lesson_id duration")
+
+_blocks = OrderedDict()
+_blocks_lock = threading.Lock()
+
+
+def get_video_block(block_id):
+    """
+    VideoBlock of an active VIDEO block, None when there is no such block
+    (also cached, unknown ids cost no query either).
+    """
+    config = settings.HEARTBEAT
+    now = time.monotonic()
+    with _blocks_lock:
+        cached = _blocks.get(block_id)
+        if cached is not None and cached[0] > now:
+            _blocks.move_to_end(block_id)
+            return cached[1]
+
+    video = None
+    block = (
+        ContentBlock.objects.filter(
+            pk=block_id, block_type=ContentBlockType.VIDEO, is_active=True
+        )
+        .only("pk", "lesson_id")
+        .first()
+    )
+    if block is not None:
+        load_payloads([block])
+        video = VideoBlock(block.lesson_id, block.data.get("duration_seconds"))
+
+    with _blocks_lock:
+        _blocks[block_id] = (now + config["BLOCK_CACHE_TIMEOUT"], video)
+        _blocks.move_to_end(block_id)
+        while len(_blocks) > config["BLOCK_CACHE_SIZE"]:
+            _blocks.popitem(last=False)
+    return video
+
+
+class HeartbeatBuffer(ProgressBuffer):
+    thread_name = "heartbeat-flusher"
+
+    def __init__(
+        self,
+        flush_interval=30,
+        max_pending=20_000,
+        durability=BUFFERED,
+        batch_size=500,
+        merge_gap=2,
+        max_intervals=200,
+        complete_ratio=0.9,
+    ):
+        super().__init__(flush_interval, max_pending, durability, batch_size)
+        self.merge_gap = merge_gap
+        self.max_intervals = max_intervals
+        self.complete_ratio = complete_ratio
+
+    def record_heartbeat(self, student_id, block_id, video, start, end, at=None):
+        """
+        Buffer that `student_id` played [start, end) (seconds) of the
+        VideoBlock `video`.
+        """
+        if video.duration:
+            end = min(end, video.duration)
+            start = min(start, end)
+        at = at or timezone.now()
+        entry = {
+            "student_id": student_id,
+            "block_id": block_id,
+            "lesson_id": video.lesson_id,
+            "started_at": at,
+            "completed_at": None,
+            "score": None,
+            "position": end,
+            "updated_at": at,
+            "intervals": [[start, end]] if end > start else [],
+            "duration": video.duration,
+        }
+        self.record_entries([entry])
+
+    def _add(self, pending, entries):
+        for entry in entries:
+            key = (entry["student_id"], entry["block_id"])
+            current = pending.get(key)
+            if current is None:
+                entry = dict(entry)
+                entry["intervals"] = [list(r) for r in entry["intervals"]]
+                pending[key] = entry
+                continue
+            merge_entry(current, entry)
+            current["duration"] = entry["duration"]
+            intervals = current["intervals"]
+            for start, end in entry["intervals"]:
+                add_interval(intervals, start, end, self.merge_gap)
+            if len(intervals) > self.max_intervals:
+                current["intervals"] = compact(intervals, self.max_intervals)
+
+    def _store(self, entries):
+        return upsert_watched(
+            entries,
+            batch_size=self.batch_size,
+            gap=self.merge_gap,
+            max_intervals=self.max_intervals,
+            complete_ratio=self.complete_ratio,
+        )
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_heartbeat_buffer():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                config = settings.HEARTBEAT
+                _buffer = HeartbeatBuffer(
+                    flush_interval=config["FLUSH_INTERVAL"],
+                    max_pending=config["MAX_PENDING"],
+                    durability=config["DURABILITY"],
+                    batch_size=config["BATCH_SIZE"],
+                    merge_gap=config["MERGE_GAP"],
+                    max_intervals=config["MAX_INTERVALS"],
+                    complete_ratio=config["COMPLETE_RATIO"],
+                )
+    return _buffer
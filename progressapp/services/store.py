@@ -0,0 +1,330 @@
+import json
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from accountapp.models import User
+from contentapp.models import ContentBlock
+from progressapp.intervals import compact, covered, merge_intervals
+from progressapp.models import BlockProgress, LessonProgress
+from progressapp.services.unlock import apply_lesson_states
+
+# -----------------------------
+# Progress writes
+# -----------------------------
+#
+# `upsert_block_progress` writes coalesced entries with multi-row
+#
+#   INSERT ... ON CONFLICT (student_id, block_id) DO UPDATE SET ...
+#
+# statements (Postgres, SQLite). The merge happens in SQL, against the
+# row as it is, so concurrent flushes from several processes never lose
+# each other's progress:
+#
+#   started_at    earliest
+#   completed_at  earliest completion
+#   score         best
+#   position      the one of the latest event carrying a position
+#   updated_at    latest
+#
+# bulk_create(update_conflicts=True) can only overwrite columns
+# (col = EXCLUDED.col), hence the hand written statement.
+#
+# Watched intervals of videos (`upsert_watched`) are a set union, done in
+# Python on the locked rows right after the upsert.
+
+BLOCK_COLUMNS = (
+    "student_id",
+    "block_id",
+    "lesson_id",
+    "started_at",
+    "completed_at",
+    "score",
+    "position",
+    "updated_at",
+)
+DATETIME_COLUMNS = {"started_at", "completed_at", "updated_at"}
+# video progress, written by `upsert_watched` only: other writes insert
+# these SQL literals and never update them
+WATCHED_COLUMNS = {"watched": "'[]'", "watched_seconds": "0"}
+
+
+def _merge_sql(rows, columns):
+    q = connection.ops.quote_name
+    table = q(BlockProgress._meta.db_table)
+
+    def old(column):
+        return f"{table}.{q(column)}"
+
+    def new(column):
+        return f"EXCLUDED.{q(column)}"
+
+    merged = {
+        "lesson_id": new("lesson_id"),
+        "started_at": (
+            f"CASE WHEN {new('started_at')} < {old('started_at')} "
+            f"THEN {new('started_at')} ELSE {old('started_at')} END"
+        ),
+        "completed_at": (
+            f"CASE WHEN {old('completed_at')} IS NULL "
+            f"OR {new('completed_at')} < {old('completed_at')} "
+            f"THEN {new('completed_at')} ELSE {old('completed_at')} END"
+        ),
+        "score": (
+            f"CASE WHEN {old('score')} IS NULL OR {new('score')} > {old('score')} "
+            f"THEN {new('score')} ELSE {old('score')} END"
+        ),
+        "position": (
+            f"CASE WHEN {new('position')} IS NOT NULL AND ({old('position')} IS NULL "
+            f"OR {new('updated_at')} >= {old('updated_at')}) "
+            f"THEN {new('position')} ELSE {old('position')} END"
+        ),
+        "updated_at": (
+            f"CASE WHEN {new('updated_at')} > {old('updated_at')} "
+            f"THEN {new('updated_at')} ELSE {old('updated_at')} END"
+        ),
+    }
+    # merged by the caller (upsert_watched), taken as they are
+    for column in WATCHED_COLUMNS:
+        if column in columns:
+            merged[column] = new(column)
+    literals = {c: v for c, v in WATCHED_COLUMNS.items() if c not in columns}
+
+    row = f"({', '.join(['%s'] * len(columns) + list(literals.values()))})"
+    return (
+        f"INSERT INTO {table} ({', '.join(q(c) for c in [*columns, *literals])}) "
+        f"VALUES {', '.join([row] * rows)} "
+        f"ON CONFLICT ({q('student_id')}, {q('block_id')}) DO UPDATE SET "
+        + ", ".join(f"{q(column)} = {value}" for column, value in merged.items())
+    )
+
+
+def _params(entry, columns):
+    params = []
+    for column in columns:
+        value = entry[column]
+        if column in DATETIME_COLUMNS:
+            value = connection.ops.adapt_datetimefield_value(value)
+        params.append(value)
+    return params
+
+
+def _upsert(entries, batch_size, columns=BLOCK_COLUMNS):
+    if max_params := connection.features.max_query_params:  # SQLite
+        batch_size = min(batch_size, max_params // len(columns))
+    with connection.cursor() as cursor:
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start : start + batch_size]
+            cursor.execute(
+                _merge_sql(len(batch), columns),
+                [param for entry in batch for param in _params(entry, columns)],
+            )
+
+
+def upsert_block_progress(entries, batch_size=500):
+    """
+    Merge `entries` (dicts with BLOCK_COLUMNS) into BlockProgress, one
+    statement per batch, and refresh the LessonProgress of every
+    (student, lesson) touched. Returns the number of entries written.
+    """
+    entries = list(entries)
+    with transaction.atomic():
+        _upsert(entries, batch_size)
+        refresh_lesson_progress(
+            {(entry["student_id"], entry["lesson_id"]) for entry in entries}
+        )
+    return len(entries)
+
+
+def upsert_watched(
+    entries, batch_size=500, gap=0, max_intervals=200, complete_ratio=None
+):
+    """
+    `upsert_block_progress` for video heartbeat entries, which also carry
+    "intervals" (merged [start, end) seconds) and "duration" (seconds or
+    None).
+
+    The rows are created first, then the intervals are unioned into
+    BlockProgress.watched under a row lock (SELECT ... FOR UPDATE on
+    Postgres), so concurrent flushes of several processes add up. A block
+    is completed once `complete_ratio` of its duration is covered.
+    """
+    entries = list(entries)
+    # the row lookup takes up to two parameters per entry
+    chunk_size = batch_size
+    if max_params := connection.features.max_query_params:  # SQLite
+        chunk_size = min(chunk_size, max_params // 2)
+    columns = (*BLOCK_COLUMNS, *WATCHED_COLUMNS)
+    with transaction.atomic():
+        _upsert(entries, batch_size)
+        for start in range(0, len(entries), chunk_size):
+            merged = _merge_watched(
+                entries[start : start + chunk_size],
+                gap,
+                max_intervals,
+                complete_ratio,
+            )
+            _upsert(merged, batch_size, columns)
+        refresh_lesson_progress(
+            {(entry["student_id"], entry["lesson_id"]) for entry in entries}
+        )
+    return len(entries)
+
+
+def _merge_watched(entries, gap, max_intervals, complete_ratio):
+    """
+    `entries` with their intervals unioned with the (locked) rows',
+    as entries with WATCHED_COLUMNS.
+    """
+    by_key = {(entry["student_id"], entry["block_id"]): entry for entry in entries}
+    blocks_of, students_of = {}, {}
+    for student_id, block_id in by_key:
+        blocks_of.setdefault(student_id, set()).add(block_id)
+        students_of.setdefault(block_id, set()).add(student_id)
+    # one OR-ed term per student or per block, whichever are fewer (many
+    # students watch the same few videos)
+    condition = Q()
+    if len(students_of) < len(blocks_of):
+        for block_id, student_ids in students_of.items():
+            condition |= Q(block_id=block_id, student_id__in=student_ids)
+    else:
+        for student_id, block_ids in blocks_of.items():
+            condition |= Q(student_id=student_id, block_id__in=block_ids)
+
+    merged = []
+    for student_id, block_id, watched, completed_at in (
+        BlockProgress.objects.select_for_update()
+        .filter(condition)
+        .values_list("student_id", "block_id", "watched", "completed_at")
+    ):
+        entry = dict(by_key[(student_id, block_id)])
+        watched = compact(
+            merge_intervals(watched, entry["intervals"], gap=gap), max_intervals
+        )
+        entry["watched"] = json.dumps(watched)
+        entry["watched_seconds"] = covered(watched)
+        duration = entry["duration"]
+        if (
+            completed_at is None
+            and complete_ratio is not None
+            and duration
+            and entry["watched_seconds"] >= complete_ratio * duration
+        ):
+            entry["completed_at"] = entry["updated_at"]
+        merged.append(entry)
+    return merged
+
+
+def without_orphans(entries):
+    """
+    `entries` whose student and block (still) exist.
+    """
+    entries = list(entries)
+    blocks = set(
+        ContentBlock.all_objects.filter(
+            pk__in={entry["block_id"] for entry in entries}
+        ).values_list("pk", flat=True)
+    )
+    students = set(
+        User.all_objects.filter(
+            pk__in={entry["student_id"] for entry in entries}
+        ).values_list("pk", flat=True)
+    )
+    return [
+        entry
+        for entry in entries
+        if entry["block_id"] in blocks and entry["student_id"] in students
+    ]
+
+
+def _progress_of(pairs):
+    """
+    BlockProgress rows of the (student_id, lesson_id) `pairs`, one OR-ed
+    lookup per student on the (student, lesson) index.
+    """
+    lessons_of = {}
+    for student_id, lesson_id in pairs:
+        lessons_of.setdefault(student_id, set()).add(lesson_id)
+    condition = Q()
+    for student_id, lesson_ids in lessons_of.items():
+        condition |= Q(student_id=student_id, lesson_id__in=lesson_ids)
+    return BlockProgress.objects.filter(condition).values_list(
+        "student_id",
+        "lesson_id",
+        "block_id",
+        "started_at",
+        "completed_at",
+        "score",
+        "updated_at",
+    )
+
+
+def refresh_lesson_progress(pairs, chunk_size=200):
+    """
+    Recompute LessonProgress of the (student_id, lesson_id) `pairs` from
+    their BlockProgress rows (the source of truth, so a plain overwrite).
+    """
+    pairs = sorted(pairs)
+    for start in range(0, len(pairs), chunk_size):
+        _refresh_chunk(pairs[start : start + chunk_size])
+
+
+def _refresh_chunk(pairs):
+    lesson_ids = {lesson_id for _, lesson_id in pairs}
+    active_blocks = {}
+    for lesson_id, block_id in ContentBlock.objects.filter(
+        lesson_id__in=lesson_ids, is_active=True
+    ).values_list("lesson_id", "pk"):
+        active_blocks.setdefault(lesson_id, set()).add(block_id)
+
+    rollups = {}
+    for row in _progress_of(pairs):
+        student_id, lesson_id, block_id, started, completed, score, updated = row
+        rollup = rollups.setdefault(
+            (student_id, lesson_id),
+            {"started_at": started, "completed": [], "scores": [], "last": None},
+        )
+        rollup["started_at"] = min(rollup["started_at"], started)
+        if completed and block_id in active_blocks.get(lesson_id, ()):
+            rollup["completed"].append(completed)
+        if score is not None:
+            rollup["scores"].append(score)
+        if rollup["last"] is None or updated > rollup["last"][0]:
+            rollup["last"] = (updated, block_id)
+
+    progress = []
+    for (student_id, lesson_id), rollup in rollups.items():
+        blocks = len(active_blocks.get(lesson_id, ()))
+        completed = rollup["completed"]
+        scores = rollup["scores"]
+        progress.append(
+            LessonProgress(
+                student_id=student_id,
+                lesson_id=lesson_id,
+                started_at=rollup["started_at"],
+                completed_at=(
+                    max(completed) if blocks and len(completed) >= blocks else None
+                ),
+                blocks_completed=len(completed),
+                score=sum(scores) / len(scores) if scores else None,
+                last_block_id=rollup["last"][1],
+                updated_at=rollup["last"][0],
+            )
+        )
+    LessonProgress.objects.bulk_create(
+        progress,
+        update_conflicts=True,
+        unique_fields=["student", "lesson"],
+        update_fields=[
+            "started_at",
+            "completed_at",
+            "blocks_completed",
+            "score",
+            "last_block",
+            "updated_at",
+        ],
+    )
+    # cached unlock bitmaps follow, once the rows are visible to readers
+    states = [(p.student_id, p.lesson_id, p.completed_at is not None) for p in progress]
+    transaction.on_commit(partial(apply_lesson_states, states), robust=True)
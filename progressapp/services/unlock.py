@@ -0,0 +1,187 @@
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from contentapp.cache import course_version_key, lesson_course_id
+from contentapp.services.course_tree import get_course_tree
+from progressapp.models import LessonProgress
+from sharedapp.cache import DEFAULT_TIMEOUT, get_versions
+
+# -----------------------------
+# Sequential unlocking
+# -----------------------------
+#
+# In a sequential module (Module.is_sequential) a lesson opens once the
+# previous lesson of the module is completed; the first lesson of a
+# module and every lesson of a free module are always open, and so is a
+# completed lesson.
+#
+# The published lessons of a course, in outline order, are the bits of
+# plain ints:
+#
+#   layout.gated  lessons that wait for their predecessor (per course)
+#   layout.empty  lessons without active blocks (per course)
+#   completed     the student's completed lessons (LessonProgress)
+#   unlocked      (~gated | passed << 1 | completed) & all lessons
+#
+# where `passed` is the completed lessons plus the unlocked empty ones: a
+# lesson without blocks can never be completed, so it is passed as soon
+# as it opens instead of locking the rest of its module. A run of empty
+# lessons takes one more round per lesson of the run; a whole course is
+# still answered with a few integer operations. Both are
+# cached under the course version (course:{id}:v, see sharedapp.cache):
+# editing the outline rebuilds the layout and every student's state.
+# A warm unlock map costs no query and two cache round trips.
+#
+# Completions do not invalidate: once LessonProgress rows are written
+# (progressapp.services.store) `apply_lesson_states` flips the bits of the
+# cached states in place. A state that is not cached is built from the
+# rows on its next read. Two updates of the same student's state at the
+# same instant (two processes flushing) may lose one of them until the
+# entry expires (DEFAULT_TIMEOUT).
+
+CourseLayout = namedtuple("CourseLayout", "lesson_ids positions gated empty")
+UnlockState = namedtuple("UnlockState", "completed unlocked")
+
+
+def _layout_key(course_id, version):
+    return f"unlock_layout:{course_id}:{version}"
+
+
+def _state_key(course_id, student_id, version):
+    return f"unlock:{course_id}:{student_id}:{version}"
+
+
+def build_course_layout(course_id):
+    """
+    CourseLayout of an active course (from its cached outline), None when
+    the course does not exist / is not active.
+    """
+    tree = get_course_tree(course_id)
+    if tree is None:
+        return None
+    lesson_ids = []
+    gated = empty = 0
+    for module in tree["modules"]:
+        for index, lesson in enumerate(module["lessons"]):
+            bit = 1 << len(lesson_ids)
+            if module["is_sequential"] and index:
+                gated |= bit
+            if not lesson["blocks"]:
+                empty |= bit
+            lesson_ids.append(lesson["id"])
+    positions = {lesson_id: bit for bit, lesson_id in enumerate(lesson_ids)}
+    return CourseLayout(tuple(lesson_ids), positions, gated, empty)
+
+
+def unlocked_mask(layout, completed):
+    every = (1 << len(layout.lesson_ids)) - 1
+    passed = completed
+    while True:
+        unlocked = (~layout.gated | passed << 1 | completed) & every
+        more = completed | unlocked & layout.empty
+        if more == passed:
+            return unlocked
+        passed = more
+
+
+def build_unlock_state(layout, student_id, course_id):
+    completed = 0
+    for lesson_id in LessonProgress.objects.filter(
+        student_id=student_id,
+        lesson__module__course_id=course_id,
+        completed_at__isnull=False,
+    ).values_list("lesson_id", flat=True):
+        if (bit := layout.positions.get(lesson_id)) is not None:
+            completed |= 1 << bit
+    return UnlockState(completed, unlocked_mask(layout, completed))
+
+
+def get_unlock_map(student_id, course_id):
+    """
+    Which lessons of a course the student may open, in outline order:
+
+        {"course_id", "lessons": [{"id", "unlocked", "completed"}, ...]}
+
+    None when the course does not exist / is not active.
+    """
+    (version,) = get_versions([course_version_key(course_id)])
+    layout_key = _layout_key(course_id, version)
+    state_key = _state_key(course_id, student_id, version)
+    cached = cache.get_many([layout_key, state_key])
+
+    if layout_key in cached:
+        layout = cached[layout_key]
+    else:
+        layout = build_course_layout(course_id)
+        cache.set(layout_key, layout, DEFAULT_TIMEOUT)
+    if layout is None:
+        return None
+
+    state = cached.get(state_key)
+    if state is None:
+        state = build_unlock_state(layout, student_id, course_id)
+        cache.set(state_key, state, DEFAULT_TIMEOUT)
+
+    return {
+        "course_id": course_id,
+        "lessons": [
+            {
+                "id": lesson_id,
+                "unlocked": bool(state.unlocked >> bit & 1),
+                "completed": bool(state.completed >> bit & 1),
+            }
+            for bit, lesson_id in enumerate(layout.lesson_ids)
+        ],
+    }
+
+
+def apply_lesson_states(states):
+    """
+    Update the cached unlock states with (student_id, lesson_id, completed)
+    triples, once the LessonProgress rows they come from are committed.
+    """
+    states = list(states)
+    course_of = {lesson_id: lesson_course_id(lesson_id) for _, lesson_id, _ in states}
+    states = [
+        (student_id, course_of[lesson_id], lesson_id, completed)
+        for student_id, lesson_id, completed in states
+        if course_of[lesson_id] is not None
+    ]
+    if not states:
+        return
+    course_ids = sorted({course_id for _, course_id, _, _ in states})
+    versions = dict(
+        zip(course_ids, get_versions([course_version_key(c) for c in course_ids]))
+    )
+    layout_keys = {c: _layout_key(c, versions[c]) for c in course_ids}
+    state_keys = {
+        (student_id, course_id): _state_key(course_id, student_id, versions[course_id])
+        for student_id, course_id, _, _ in states
+    }
+    cached = cache.get_many([*layout_keys.values(), *state_keys.values()])
+
+    changed, stale = {}, set()
+    for student_id, course_id, lesson_id, completed in states:
+        key = state_keys[(student_id, course_id)]
+        state = changed.get(key) or cached.get(key)
+        if state is None:
+            continue
+        layout = cached.get(layout_keys[course_id])
+        if layout is None:
+            # layout evicted: drop the state too, the next read rebuilds both
+            stale.add(key)
+            continue
+        bit = layout.positions.get(lesson_id)
+        if bit is None:  # unpublished lesson
+            continue
+        done = (
+            state.completed | 1 << bit if completed else state.completed & ~(1 << bit)
+        )
+        if done != state.completed:
+            changed[key] = UnlockState(done, unlocked_mask(layout, done))
+
+    if changed:
+        cache.set_many(changed, DEFAULT_TIMEOUT)
+    if stale:
+        cache.delete_many(list(stale))
@@ -0,0 +1,125 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accountapp.enums import Role
+from accountapp.models import User, UserRole
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock, Course, Lesson, Module
+from progressapp.models import LessonProgress
+from progressapp.services.unlock import get_unlock_map
+
+
+class SequentialUnlockTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.base_objects.create_user("01700000000", "pass")
+        self.course = Course.objects.create(title="Course", slug="course")
+        self.module = Module.objects.create(course=self.course, title="Module")
+
+    def add_lesson(self, order, blocks=1):
+        lesson = Lesson.objects.create(
+            module=self.module, title=f"Lesson {order}", order=order, is_published=True
+        )
+        for i in range(blocks):
+            ContentBlock.objects.create(
+                lesson=lesson,
+                block_type=ContentBlockType.TEXT,
+                order=i,
+                data={"body": f"block {i}"},
+            )
+        return lesson
+
+    def complete(self, lesson):
+        now = timezone.now()
+        LessonProgress.objects.create(
+            student=self.student,
+            lesson=lesson,
+            started_at=now,
+            completed_at=now,
+            updated_at=now,
+        )
+
+    def unlocked(self):
+        unlock_map = get_unlock_map(self.student.pk, self.course.pk)
+        return [lesson["unlocked"] for lesson in unlock_map["lessons"]]
+
+    def test_completing_a_lesson_opens_the_next(self):
+        first = self.add_lesson(1)
+        self.add_lesson(2)
+        self.add_lesson(3)
+        self.assertEqual(self.unlocked(), [True, False, False])
+
+        self.complete(first)
+        cache.clear()
+
+        self.assertEqual(self.unlocked(), [True, True, False])
+
+    def test_empty_lessons_do_not_block_the_module(self):
+        first = self.add_lesson(1)
+        self.add_lesson(2, blocks=0)
+        self.add_lesson(3, blocks=0)
+        self.add_lesson(4)
+        self.add_lesson(5)
+        # an empty lesson opens with its predecessor, not before
+        self.assertEqual(self.unlocked(), [True, False, False, False, False])
+
+        self.complete(first)
+        cache.clear()
+
+        self.assertEqual(self.unlocked(), [True, True, True, True, False])
+
+
+class ProgressEventsTests(TestCase):
+    url = "/api/progress/events"
+
+    def setUp(self):
+        cache.clear()
+        student = User.base_objects.create_user("01700000000", "pass")
+        UserRole.objects.create(user=student, role=Role.STUDENT)
+        student.refresh_from_db()
+        self.client = APIClient()
+        self.client.force_authenticate(student)
+
+        course = Course.objects.create(title="Course", slug="course")
+        module = Module.objects.create(course=course, title="Module")
+        first, second = [
+            Lesson.objects.create(module=module, title=title, is_published=True)
+            for title in ("First", "Second")
+        ]
+        self.text = ContentBlock.objects.create(
+            lesson=first, block_type=ContentBlockType.TEXT, data={"body": "x"}
+        )
+        self.quiz = ContentBlock.objects.create(
+            lesson=first,
+            block_type=ContentBlockType.QUIZ,
+            data={"questions": [{"prompt": "?", "choices": ["a", "b"], "answer": 0}]},
+        )
+        self.locked = ContentBlock.objects.create(
+            lesson=second, block_type=ContentBlockType.TEXT, data={"body": "y"}
+        )
+
+    def post(self, *events):
+        return self.client.post(self.url, {"events": list(events)}, format="json")
+
+    def test_events_of_an_unlocked_lesson_are_accepted(self):
+        response = self.post(
+            {"block_id": self.text.pk, "completed": True},
+            {"block_id": self.quiz.pk, "completed": True, "score": 80},
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["accepted"], 2)
+
+    def test_events_of_a_locked_lesson_are_dropped(self):
+        response = self.post({"block_id": self.locked.pk, "completed": True})
+
+        self.assertEqual(response.data["accepted"], 0)
+        self.assertEqual(response.data["locked_blocks"], [self.locked.pk])
+
+    def test_only_quiz_blocks_take_a_score(self):
+        response = self.post({"block_id": self.text.pk, "score": 100})
+
+        self.assertEqual(response.data["accepted"], 0)
+        self.assertEqual(response.data["unscored_blocks"], [self.text.pk])
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from relationshipapp.apis.views import dashboard
+
+urlpatterns = [
+    path("/dashboard", dashboard.ParentDashboardView.as_view()),
+]
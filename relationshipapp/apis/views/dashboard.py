@@ -0,0 +1,14 @@
+from rest_framework import status
+from rest_framework.generics import RetrieveAPIView
+from rest_framework.response import Response
+
+from accountapp.permissions import IsParent
+from relationshipapp.services.dashboard import get_parent_dashboard
+
+
+class ParentDashboardView(RetrieveAPIView):
+    permission_classes = [IsParent]
+
+    def get(self, request, *args, **kwargs):
+        dashboard = get_parent_dashboard(request.user.pk)
+        return Response(dashboard, status=status.HTTP_200_OK)
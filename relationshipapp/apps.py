@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class RelationshipsappConfig(AppConfig):
     name = 'relationshipapp'
+
+    def ready(self):
+        # guardian access map invalidation receivers
+        from relationshipapp import signals  # noqa: F401
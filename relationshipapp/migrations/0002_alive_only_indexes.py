@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("relationshipapp", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="guardianrelationship",
+            name="uniq_parent_student_link",
+        ),
+        migrations.RemoveIndex(
+            model_name="guardianrelationship",
+            name="relationshi_parent__b2f8b4_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="guardianrelationship",
+            name="relationshi_student_cccaf4_idx",
+        ),
+        migrations.AddIndex(
+            model_name="guardianrelationship",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["parent", "status"],
+                name="guardian_parent_alive_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="guardianrelationship",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["student", "status"],
+                name="guardian_student_alive_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="guardianrelationship",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("parent", "student"),
+                name="uniq_parent_student_link",
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@ from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils import timezone
 
-from sharedapp.models import TimeStampedSoftDeleteModel
+from sharedapp.models import TimeStampedSoftDeleteModel, alive_index, alive_unique
 
 User = get_user_model()
 
@@ -161,14 +161,11 @@ class GuardianRelationship(TimeStampedSoftDeleteModel):
 
     class Meta:
         constraints = [
-            models.UniqueConstraint(
-                fields=["parent", "student"],
-                name="uniq_parent_student_link"
-            )
+            alive_unique("parent", "student", name="uniq_parent_student_link")
         ]
         indexes = [
-            models.Index(fields=["parent", "status"]),
-            models.Index(fields=["student", "status"]),
+            alive_index("parent", "status", name="guardian_parent_alive_idx"),
+            alive_index("student", "status", name="guardian_student_alive_idx"),
         ]
 
     def __str__(self):
@@ -0,0 +1,21 @@
+from rest_framework.permissions import BasePermission
+
+from relationshipapp.services.access import VIEW_PROGRESS, can_access
+
+
+class HasGuardianAccess(BasePermission):
+    """
+    For parent endpoints about one student (URL kwarg `student_id`).
+
+    The requesting parent needs an ACTIVE link to the student with the
+    view's `guardian_permission` bits (default VIEW_PROGRESS).
+    Answered from the cached access map, no query once it is warm.
+    """
+
+    def has_permission(self, request, view):
+        user = request.user
+        student_id = view.kwargs.get("student_id")
+        if not user or not user.is_authenticated or student_id is None:
+            return False
+        permission = getattr(view, "guardian_permission", VIEW_PROGRESS)
+        return can_access(user.pk, int(student_id), permission)
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+
+from relationshipapp.models import GuardianRelationship, GuardianRelationshipStatus
+
+# -----------------------------
+# Guardian access checks
+# -----------------------------
+#
+# "May parent P see student S's progress / reports / assessments?"
+#
+# All ACTIVE links of a parent to alive students are loaded with ONE
+# query on the (parent, status) index and cached as {student_id:
+# permission bits}. Any number of checks for that parent then cost no
+# query. The map is dropped by relationshipapp.signals whenever a link of
+# the parent changes or one of its students is soft deleted / restored.
+
+VIEW_PROGRESS = 1 << 0
+RECEIVE_REPORTS = 1 << 1
+VIEW_ASSESSMENTS = 1 << 2
+
+PERMISSION_FLAGS = {
+    "can_view_progress": VIEW_PROGRESS,
+    "can_receive_reports": RECEIVE_REPORTS,
+    "can_view_assessments": VIEW_ASSESSMENTS,
+}
+
+ACCESS_MAP_TIMEOUT = 60 * 60
+
+
+def access_map_key(parent_id):
+    return f"guardian:{parent_id}:access"
+
+
+def get_access_map(parent_id):
+    """
+    {student_id: permission bits} for every ACTIVE link of `parent_id` to
+    an alive student.
+    """
+    key = access_map_key(parent_id)
+    access = cache.get(key)
+    if access is None:
+        links = GuardianRelationship.objects.filter(
+            parent_id=parent_id,
+            status=GuardianRelationshipStatus.ACTIVE,
+            student__deleted_at__isnull=True,
+        ).values_list("student_id", *PERMISSION_FLAGS)
+
+        access = {}
+        for student_id, *flags in links:
+            access[student_id] = sum(
+                bit for bit, allowed in zip(PERMISSION_FLAGS.values(), flags) if allowed
+            )
+        cache.set(key, access, timeout=ACCESS_MAP_TIMEOUT)
+    return access
+
+
+def can_access(parent_id, student_id, permission):
+    """
+    True when the parent has ALL bits of `permission` for the student,
+    e.g. can_access(p, s, VIEW_PROGRESS | VIEW_ASSESSMENTS).
+    """
+    bits = get_access_map(parent_id).get(student_id, 0)
+    return bits & permission == permission
+
+
+def permitted_students(parent_id, student_ids, permission):
+    """
+    The subset of `student_ids` the parent has `permission` for.
+    """
+    access = get_access_map(parent_id)
+    return {
+        student_id
+        for student_id in student_ids
+        if access.get(student_id, 0) & permission == permission
+    }
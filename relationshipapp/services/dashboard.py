@@ -0,0 +1,50 @@
+from django.core.exceptions import ObjectDoesNotExist
+
+from relationshipapp.models import GuardianRelationship, GuardianRelationshipStatus
+
+
+def _student_profile(student):
+    # select_related caches a missing reverse one-to-one too, no query here
+    try:
+        profile = student.student_profile
+    except ObjectDoesNotExist:
+        return None
+    return profile if profile.deleted_at is None else None
+
+
+def get_parent_dashboard(parent_id):
+    """
+    Every actively linked child of a parent with grade and permissions.
+
+    ONE query however many children: ACTIVE links on the (parent, status)
+    index, student and student profile joined through select_related.
+    """
+    links = (
+        GuardianRelationship.objects.filter(
+            parent_id=parent_id,
+            status=GuardianRelationshipStatus.ACTIVE,
+            student__deleted_at__isnull=True,
+        )
+        .select_related("student", "student__student_profile")
+        .order_by("requested_at", "id")
+    )
+
+    children = []
+    for link in links:
+        student = link.student
+        profile = _student_profile(student)
+        children.append(
+            {
+                "student_id": student.id,
+                "full_name": student.full_name,
+                "grade": profile.current_grade_label if profile else "",
+                "school_name": profile.school_name if profile else "",
+                "relation_label": link.relation_label,
+                "permissions": {
+                    "view_progress": link.can_view_progress,
+                    "receive_reports": link.can_receive_reports,
+                    "view_assessments": link.can_view_assessments,
+                },
+            }
+        )
+    return {"children": children}
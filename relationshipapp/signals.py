@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accountapp.models import User
+from relationshipapp.models import GuardianRelationship
+from relationshipapp.services.access import access_map_key
+from sharedapp.cache import delete_on_commit
+from sharedapp.signals import bulk_restored, bulk_soft_deleted
+
+
+@receiver(pre_save, sender=GuardianRelationship)
+def remember_old_parent(sender, instance, raw=False, **kwargs):
+    # a link moved to another parent must also leave the old parent's map
+    if raw or instance.pk is None:
+        return
+    instance._old_parent_id = (
+        GuardianRelationship.all_objects.filter(pk=instance.pk)
+        .values_list("parent_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=GuardianRelationship)
+@receiver(post_delete, sender=GuardianRelationship)
+def forget_access_map(sender, instance, **kwargs):
+    # save() also covers status/flag changes and soft delete / restore
+    parent_ids = {instance.parent_id, getattr(instance, "_old_parent_id", None)}
+    delete_on_commit(
+        [access_map_key(parent_id) for parent_id in parent_ids if parent_id]
+    )
+
+
+def _forget_access_maps_of_students(students):
+    parent_ids = (
+        GuardianRelationship.objects.filter(student__in=students)
+        .values_list("parent_id", flat=True)
+        .distinct()
+    )
+    delete_on_commit([access_map_key(parent_id) for parent_id in parent_ids])
+
+
+@receiver(post_save, sender=User)
+def forget_access_maps_of_student(sender, instance, update_fields=None, **kwargs):
+    # User.delete() / restore() save only deleted_at; the maps only list
+    # alive students
+    if update_fields and "deleted_at" in update_fields:
+        _forget_access_maps_of_students([instance.pk])
+
+
+@receiver(bulk_soft_deleted)
+@receiver(bulk_restored)
+def forget_access_maps_on_bulk_update(sender, queryset, **kwargs):
+    if sender is User:
+        _forget_access_maps_of_students(queryset.values("pk"))
+        return
+    if sender is not GuardianRelationship:
+        return
+    parent_ids = queryset.values_list("parent_id", flat=True).distinct()
+    delete_on_commit([access_map_key(parent_id) for parent_id in parent_ids])
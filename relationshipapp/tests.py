@@ -1,3 +1,67 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accountapp.enums import Role
+from accountapp.models import StudentProfile, User, UserRole
+from relationshipapp.models import GuardianRelationship, GuardianRelationshipStatus
+
+
+class ParentDashboardTests(TestCase):
+    url = "/api/parent/dashboard"
+
+    def setUp(self):
+        self.parent = User.base_objects.create_user("01800000000", "pass")
+        UserRole.objects.create(user=self.parent, role=Role.PARENT)
+        self.parent.refresh_from_db()
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.parent)
+
+    def link_children(self, count):
+        for i in range(count):
+            student = User.base_objects.create_user(
+                f"0170000{i:04d}", "pass", full_name=f"Child {i}"
+            )
+            StudentProfile.objects.create(user=student, current_grade_label="Class 7")
+            GuardianRelationship.objects.create(
+                parent=self.parent,
+                student=student,
+                status=GuardianRelationshipStatus.ACTIVE,
+                relation_label="Mother",
+            )
+
+    def assert_dashboard_in_one_query(self, children):
+        self.link_children(children)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["children"]), children)
+
+    def test_one_child_in_one_query(self):
+        self.assert_dashboard_in_one_query(1)
+
+    def test_five_children_in_one_query(self):
+        self.assert_dashboard_in_one_query(5)
+
+    def test_only_active_links_are_listed(self):
+        self.link_children(2)
+        GuardianRelationship.objects.filter(student__full_name="Child 1").update(
+            status=GuardianRelationshipStatus.REVOKED
+        )
+
+        response = self.client.get(self.url)
+
+        children = response.data["children"]
+        self.assertEqual([child["full_name"] for child in children], ["Child 0"])
+        self.assertEqual(children[0]["grade"], "Class 7")
+        self.assertEqual(children[0]["relation_label"], "Mother")
+
+    def test_requires_parent_role(self):
+        student = User.base_objects.create_user("01711111111", "pass")
+        self.client.force_authenticate(student)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,109 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+# -----------------------------
+# Version-keyed caching
+# -----------------------------
+#
+# Cached values are never deleted. Every entity gets a version counter
+# (e.g. "course:12:v") and the cache key of a value contains the current
+# versions of everything it depends on. A write bumps the counter, so
+# the next read builds a new key and old entries simply expire.
+#
+# Counters live in the same cache as the values. With LocMemCache that is
+# per process (fine for tests / single process); production needs a shared
+# backend (Redis/Memcached) so every worker sees the bumps.
+
+DEFAULT_TIMEOUT = 60 * 60
+_MISSING = object()
+
+
+def _fresh_version():
+    # A counter that got evicted restarts from "now" (ms) instead of 1,
+    # so it can never line up with keys built from its previous values.
+    return int(time.time() * 1000)
+
+
+def get_versions(version_keys):
+    """
+    Current value of every counter in `version_keys` (one cache round trip
+    when all counters exist).
+    """
+    versions = cache.get_many(version_keys)
+    missing = [key for key in version_keys if key not in versions]
+    for key in missing:
+        # add() is a no-op when another worker created it in between
+        cache.add(key, _fresh_version(), timeout=None)
+        versions[key] = cache.get(key)
+    return [versions[key] for key in version_keys]
+
+
+async def aget_versions(version_keys):
+    versions = await cache.aget_many(version_keys)
+    missing = [key for key in version_keys if key not in versions]
+    for key in missing:
+        await cache.aadd(key, _fresh_version(), timeout=None)
+        versions[key] = await cache.aget(key)
+    return [versions[key] for key in version_keys]
+
+
+def bump_versions(version_keys):
+    for key in version_keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_version(), timeout=None)
+
+
+def bump_versions_on_commit(version_keys):
+    """
+    Bump after the surrounding transaction commits, otherwise a concurrent
+    reader could rebuild the value from the old rows under the new version.
+    """
+    version_keys = set(version_keys)
+    if version_keys:
+        transaction.on_commit(lambda: bump_versions(version_keys))
+
+
+def get_or_build(name, version_keys, build, timeout=DEFAULT_TIMEOUT):
+    """
+    Return the cached value of `name` for the current versions of
+    `version_keys`, calling `build()` only on a miss.
+
+    A warm read is two cache round trips and no DB query.
+    `None` is a valid (cached) value.
+    """
+    versions = get_versions(version_keys)
+    key = ":".join([name, *map(str, versions)])
+
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = build()
+        cache.set(key, value, timeout)
+    return value
+
+
+async def aget_or_build(name, version_keys, abuild, timeout=DEFAULT_TIMEOUT):
+    """
+    Async `get_or_build`: same keys (so sync and async readers share the
+    cache), `abuild()` must return an awaitable.
+    """
+    versions = await aget_versions(version_keys)
+    key = ":".join([name, *map(str, versions)])
+
+    value = await cache.aget(key, _MISSING)
+    if value is _MISSING:
+        value = await abuild()
+        await cache.aset(key, value, timeout)
+    return value
+
+
+def delete_on_commit(keys):
+    """
+    Drop plain (non versioned) cache entries once the transaction commits.
+    """
+    keys = set(keys)
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(list(keys)))
@@ -0,0 +1,103 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from contentapp.models import ContentBlock, Course, Lesson, Module
+
+HOT_QUERY = """
+    SELECT id, block_type, title, "order"
+    FROM {table}
+    WHERE lesson_id = %s AND is_active AND deleted_at IS NULL
+    ORDER BY "order"
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "PostgreSQL only. Seeds content blocks with a share of tombstones inside a "
+        "rolled-back transaction and compares the alive-only partial index against "
+        "an equivalent full index: size on disk and plan/timing of the hot query."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lessons", type=int, default=200)
+        parser.add_argument("--blocks-per-lesson", type=int, default=250)
+        parser.add_argument(
+            "--dead-ratio",
+            type=float,
+            default=0.8,
+            help="share of seeded blocks that are soft deleted",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("bench_alive_indexes needs PostgreSQL")
+
+        with transaction.atomic():
+            lesson_ids = self._seed(options)
+            self._report(lesson_ids[len(lesson_ids) // 2])
+            # nothing of this run is kept
+            transaction.set_rollback(True)
+
+    def _seed(self, options):
+        course = Course.objects.create(title="bench", slug=f"bench-{time.time_ns()}")
+        module = Module.objects.create(course=course, title="bench")
+        lessons = Lesson.objects.bulk_create(
+            Lesson(module=module, title=f"lesson {i}", order=i, is_published=True)
+            for i in range(options["lessons"])
+        )
+
+        per_lesson = options["blocks_per_lesson"]
+        dead_percent = options["dead_ratio"] * 100
+        now = timezone.now()
+        blocks = []
+        for lesson in lessons:
+            for i in range(per_lesson):
+                alive = i % 100 >= dead_percent
+                blocks.append(
+                    ContentBlock(
+                        lesson=lesson,
+                        block_type="text",
+                        order=i,
+                        data={"body": f"block {i}"},
+                        deleted_at=None if alive else now,
+                    )
+                )
+        ContentBlock.objects.bulk_create(blocks, batch_size=5000)
+        self.stdout.write(
+            f"seeded {len(blocks)} blocks, "
+            f"{ContentBlock.all_objects.dead().filter(lesson__module=module).count()} soft deleted"
+        )
+        return [lesson.id for lesson in lessons]
+
+    def _report(self, lesson_id):
+        table = ContentBlock._meta.db_table
+        partial = "block_lesson_alive_idx"
+        full = "bench_block_lesson_full_idx"
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX {full} ON {table} (lesson_id, is_active, "order")'
+            )
+            cursor.execute(f"ANALYZE {table}")
+
+            self.stdout.write("\nindex size")
+            for name in (partial, full):
+                cursor.execute(
+                    "SELECT pg_size_pretty(pg_relation_size(%s::regclass))", [name]
+                )
+                self.stdout.write(f"  {name:<32} {cursor.fetchone()[0]}")
+
+            self._explain(cursor, "alive-only partial index", table, lesson_id)
+            cursor.execute(f"DROP INDEX {partial}")
+            self._explain(cursor, "full index", table, lesson_id)
+
+    def _explain(self, cursor, label, table, lesson_id):
+        cursor.execute(
+            "EXPLAIN (ANALYZE, BUFFERS) " + HOT_QUERY.format(table=table), [lesson_id]
+        )
+        self.stdout.write(f"\nplan with {label}")
+        for (line,) in cursor.fetchall():
+            self.stdout.write(f"  {line}")
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sharedapp.services.purge import PURGE_ORDER, purge_soft_deleted, purgeable
+
+
+class Command(BaseCommand):
+    help = (
+        "Move soft-deleted rows older than the retention period out of the hot "
+        "tables (archive or hard delete), in small batches. Safe to interrupt "
+        "and re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.SOFT_DELETE_RETENTION_DAYS,
+            help="retention period (default: SOFT_DELETE_RETENTION_DAYS)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--mode",
+            choices=["archive", "delete"],
+            default="archive",
+            help="archive into SoftDeleteArchive, or hard delete only",
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=0.0, help="seconds to pause between batches"
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help=f"app_label.Model to purge (repeatable, default: {', '.join(PURGE_ORDER)})",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="only count purgeable rows"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        labels = options["models"] or PURGE_ORDER
+
+        if options["dry_run"]:
+            for label in labels:
+                count = purgeable(apps.get_model(label), cutoff).count()
+                self.stdout.write(f"{label}: {count} purgeable")
+            return
+
+        results = purge_soft_deleted(
+            cutoff,
+            model_labels=labels,
+            batch_size=options["batch_size"],
+            archive=options["mode"] == "archive",
+            pause=options["sleep"],
+            on_batch=self._progress if options["verbosity"] > 1 else None,
+        )
+
+        total = sum(result.rows for result in results)
+        seconds = sum(result.seconds for result in results)
+        for result in results:
+            self.stdout.write(
+                f"{result.model_label}: {result.rows} rows in {result.batches} batches, "
+                f"{result.rows_per_second:.0f} rows/s"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"purged {total} rows in {seconds:.1f}s "
+                f"({total / seconds if seconds else 0:.0f} rows/s)"
+            )
+        )
+
+    def _progress(self, result):
+        self.stdout.write(
+            f"  {result.model_label}: {result.rows} rows "
+            f"({result.rows_per_second:.0f} rows/s)"
+        )
@@ -0,0 +1,39 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from sharedapp.services.ordering import rebalance
+
+ORDERED_MODELS = [
+    "contentapp.CoursePlacement",
+    "contentapp.Module",
+    "contentapp.Lesson",
+    "contentapp.ContentBlock",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Spread `order` values ORDER_GAP apart again for every sibling group "
+        "(one UPDATE per group), so later inserts/moves stay single-row writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help=f"app_label.Model (repeatable, default: {', '.join(ORDERED_MODELS)})",
+        )
+
+    def handle(self, *args, **options):
+        for label in options["models"] or ORDERED_MODELS:
+            model = apps.get_model(label)
+            scope_fields = [
+                model._meta.get_field(name).attname for name in model.ordering_scope
+            ]
+            scopes = model.objects.values(*scope_fields).distinct().order_by()
+            count = 0
+            for scope in scopes.iterator():
+                rebalance(model, scope)
+                count += 1
+            self.stdout.write(f"{label}: {count} groups rebalanced")
@@ -0,0 +1,61 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from sharedapp.services.reprocess import reprocess_pictures
+
+
+class Command(BaseCommand):
+    help = (
+        "Encode the renditions of the current PICTURES settings for every "
+        "existing avatar and course cover, in a process pool. Resumes from "
+        "its checkpoint after an interruption and skips originals that did "
+        "not change since they were last rendered."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="encoding processes (default: one per CPU)",
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--checkpoint",
+            default=settings.BASE_DIR / "var" / "reprocess_pictures.json",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="ignore the checkpoint and re-encode everything",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        results = reprocess_pictures(
+            options["checkpoint"],
+            workers=workers,
+            restart=options["restart"],
+            batch_size=options["batch_size"],
+            on_batch=self._progress if options["verbosity"] > 1 else None,
+        )
+
+        for result in results:
+            # share of the pool's CPU time actually spent encoding
+            utilization = (
+                result.cpu_seconds / (result.seconds * workers) if result.seconds else 0
+            )
+            self.stdout.write(
+                f"{result.field_label}: {result.images} images "
+                f"({result.renditions} renditions), {result.skipped} unchanged, "
+                f"{result.failed} failed, {result.images_per_second:.1f} images/s, "
+                f"CPU {utilization:.0%} of {workers} workers"
+            )
+
+    def _progress(self, result):
+        self.stdout.write(
+            f"  {result.field_label}: {result.images} images, "
+            f"{result.skipped} unchanged ({result.images_per_second:.1f} images/s)"
+        )
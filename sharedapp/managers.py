@@ -1,11 +1,96 @@
 # core/models.py
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
+from sharedapp.signals import bulk_restored, bulk_soft_deleted
+
+
+class RestoreConflict(ValidationError):
+    """
+    A row cannot be restored: an alive row took its unique value
+    (slug, phone, order...) while it was deleted.
+    """
+
 
 class SoftDeleteQuerySet(models.QuerySet):
-    def soft_delete(self):
-        return super().update(deleted_at=timezone.now())
+    def soft_delete(self, at=None):
+        """
+        Bulk soft delete of the alive rows.
+
+        Relations listed in the model's `soft_delete_cascade` are soft
+        deleted first, ONE UPDATE per level (children are matched through
+        a subquery on their parents), and every level gets the same
+        `deleted_at`, so `restore()` can undo exactly this operation.
+        """
+        at = at or timezone.now()
+        alive = self.alive()
+        with transaction.atomic(using=self.db):
+            alive.soft_delete_children(at)
+            bulk_soft_deleted.send(sender=self.model, queryset=alive)
+            return alive.update(deleted_at=at)
+
+    def restore(self):
+        """
+        Bulk restore of the dead rows, cascading to the children that
+        were soft deleted together with them (same `deleted_at`).
+        Raises RestoreConflict (and restores nothing) when one of them lost
+        its unique value to an alive row meanwhile.
+        """
+        dead = self.dead()
+        with transaction.atomic(using=self.db):
+            dead.check_restore()
+            dead.restore_children()
+            bulk_restored.send(sender=self.model, queryset=dead)
+            return dead.update(deleted_at=None)
+
+    def soft_delete_children(self, at):
+        for related_model, fk in self._soft_delete_cascade():
+            related_model.all_objects.filter(
+                **{f"{fk.name}__in": self.values("pk")}
+            ).soft_delete(at)
+
+    def check_restore(self):
+        """
+        Raise RestoreConflict when an alive row holds the value of an
+        alive-only unique constraint (sharedapp.models.alive_unique) of one
+        of these rows; restoring them would fail on the constraint.
+        """
+        alive = models.Q(deleted_at__isnull=True)
+        for constraint in self.model._meta.constraints:
+            if not (
+                isinstance(constraint, models.UniqueConstraint)
+                and constraint.condition == alive
+            ):
+                continue
+            fields = [
+                self.model._meta.get_field(name).attname for name in constraint.fields
+            ]
+            taken = self.model._base_manager.filter(
+                alive, **{field: OuterRef(field) for field in fields}
+            ).exclude(pk=OuterRef("pk"))
+            conflict = self.filter(Exists(taken)).values(*fields).first()
+            if conflict is not None:
+                values = ", ".join(f"{k}={v!r}" for k, v in conflict.items())
+                raise RestoreConflict(
+                    f"Cannot restore {self.model._meta.label}: an alive row "
+                    f"already has {values}.",
+                    code="restore_conflict",
+                )
+
+    def restore_children(self):
+        for related_model, fk in self._soft_delete_cascade():
+            deleted_with_parent = self.filter(
+                pk=OuterRef(fk.attname), deleted_at=OuterRef("deleted_at")
+            )
+            related_model.all_objects.filter(Exists(deleted_with_parent)).restore()
+
+    def _soft_delete_cascade(self):
+        # reverse relation name -> (child model, FK field on the child)
+        for name in getattr(self.model, "soft_delete_cascade", ()):
+            rel = self.model._meta.get_field(name)
+            yield rel.related_model, rel.field
 
     def hard_delete(self):
         return super().delete()
@@ -20,13 +105,18 @@ class SoftDeleteQuerySet(models.QuerySet):
 class SoftDeleteManager(models.Manager):
     """
     Default manager: hides soft-deleted rows.
+
+    Use `SoftDeleteManager.from_queryset(SomeSoftDeleteQuerySet)()` for
+    model specific queryset helpers.
     """
+    _queryset_class = SoftDeleteQuerySet
+
     def get_queryset(self):
-        return SoftDeleteQuerySet(self.model, using=self._db).alive()
+        return self._queryset_class(self.model, using=self._db).alive()
 
     # Optional convenience pass-throughs
     def dead(self):
-        return SoftDeleteQuerySet(self.model, using=self._db).dead()
+        return self._queryset_class(self.model, using=self._db).dead()
 
     def hard_delete(self):
         return self.get_queryset().hard_delete()
@@ -36,8 +126,10 @@ class AllObjectsManager(models.Manager):
     """
     Includes deleted rows (use for admin/restore/audit).
     """
+    _queryset_class = SoftDeleteQuerySet
+
     def get_queryset(self):
-        return SoftDeleteQuerySet(self.model, using=self._db)
+        return self._queryset_class(self.model, using=self._db)
 
     def alive(self):
         return self.get_queryset().alive()
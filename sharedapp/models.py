@@ -1,7 +1,31 @@
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
 from django.utils import timezone
 
 from sharedapp.managers import SoftDeleteManager, AllObjectsManager
+from sharedapp.services.ordering import next_order, scope_of
+
+# Rows visible through the default manager (SoftDeleteManager).
+ALIVE = models.Q(deleted_at__isnull=True)
+
+
+def alive_index(*fields, name):
+    """
+    Partial index over alive rows only (WHERE deleted_at IS NULL).
+
+    Default queries always filter on `deleted_at IS NULL`, so tombstones
+    never need to be in hot-path indexes; the index stays small no matter
+    how many rows get soft deleted.
+    """
+    return models.Index(fields=list(fields), name=name, condition=ALIVE)
+
+
+def alive_unique(*fields, name):
+    """
+    Unique among alive rows only, so a soft-deleted row does not block
+    re-creating the same value (phone, slug, order...).
+    """
+    return models.UniqueConstraint(fields=list(fields), name=name, condition=ALIVE)
 
 
 class TimeStampedSoftDeleteModel(models.Model):
@@ -14,15 +38,32 @@ class TimeStampedSoftDeleteModel(models.Model):
     # admin/audit: includes all
     all_objects = AllObjectsManager()
 
+    # reverse relations (related_name) soft deleted / restored together
+    # with this row, e.g. ("modules", "placements") on Course
+    soft_delete_cascade = ()
+    # fields grouping the siblings of an `order` field, e.g. ("lesson",) on
+    # ContentBlock (sharedapp.services.ordering)
+    ordering_scope = ()
+
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        if self.ordering_scope and self._state.adding and not self.order:
+            # no order given: append to the siblings
+            self.order = next_order(type(self), scope_of(self))
+        super().save(*args, **kwargs)
+
     def delete(self, using=None, keep_parents=False):
         """
         Instance soft delete.
+        Children in `soft_delete_cascade` get the same `deleted_at`,
+        one UPDATE per level (see SoftDeleteQuerySet.soft_delete).
         """
         self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        with transaction.atomic():
+            self._as_queryset().soft_delete_children(self.deleted_at)
+            self.save(update_fields=["deleted_at"])
 
     def hard_delete(self):
         """
@@ -31,9 +72,42 @@ class TimeStampedSoftDeleteModel(models.Model):
         return super().delete()
 
     def restore(self):
-        self.deleted_at = None
-        self.save(update_fields=["deleted_at"])
+        """
+        Instance restore, together with the children that were
+        soft deleted in the same operation. Raises RestoreConflict (and
+        restores nothing) when one of them lost its unique value.
+        """
+        with transaction.atomic():
+            self._as_queryset().check_restore()
+            self._as_queryset().restore_children()
+            self.deleted_at = None
+            self.save(update_fields=["deleted_at"])
+
+    def _as_queryset(self):
+        return type(self).all_objects.filter(pk=self.pk)
 
     @property
     def is_deleted(self):
-        return self.deleted_at is not None
\ No newline at end of file
+        return self.deleted_at is not None
+
+
+class SoftDeleteArchive(models.Model):
+    """
+    Tombstones moved out of the hot tables by the purge job
+    (sharedapp.services.purge). One row per archived row, keyed by model.
+    """
+
+    model_label = models.CharField(max_length=100)  # e.g. "contentapp.lesson"
+    object_id = models.CharField(max_length=64)
+    data = models.JSONField(encoder=DjangoJSONEncoder)  # column values
+
+    deleted_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["model_label", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label}:{self.object_id}"
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from sharedapp import views
+
+# replaces pictures.urls: same namespace / name, so PillowPicture.url
+# reverses to the cached view
+app_name = "pictures"
+
+urlpatterns = [
+    path(
+        "<alt>/<ratio>/<int:width>w.<file_type>",
+        views.picture_placeholder,
+        name="placeholder",
+    ),
+]
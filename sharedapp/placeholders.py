@@ -0,0 +1,126 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from pictures import utils
+
+# -----------------------------
+# Cached placeholder images
+# -----------------------------
+#
+# pictures' placeholder view draws and encodes (AVIF) an image on every
+# hit. Here an encoded placeholder is looked up in
+#
+#   1. a bounded in-process LRU (PLACEHOLDER_CACHE_SIZE entries),
+#   2. a disk cache in PLACEHOLDER_CACHE_DIR (shared by all workers,
+#      survives restarts),
+#
+# and only drawn + encoded when both miss. The content of a placeholder
+# only depends on (width, height, format, alt), so its ETag is a hash of
+# the bytes and the response may be cached forever.
+#
+# Any client can ask for any alt / ratio / width, so the disk cache is
+# capped at PLACEHOLDER_DISK_CACHE_MAX_FILES: once full, new placeholders
+# only go to the LRU. Each process counts the files again every
+# DISK_RECOUNT_SECONDS, so concurrent workers may overshoot the cap a
+# little in between. Deleting the directory is always safe.
+
+DISK_RECOUNT_SECONDS = 60
+
+_lru = OrderedDict()
+_lru_lock = threading.Lock()
+
+_disk_files = None  # (file count, monotonic time of the count)
+_disk_lock = threading.Lock()
+
+
+class Placeholder:
+    __slots__ = ("content", "etag")
+
+    def __init__(self, content):
+        self.content = content
+        self.etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def _render(width, height, file_type, alt):
+    with io.BytesIO() as buffer:
+        utils.placeholder(width, height, alt=alt).save(buffer, file_type)
+        return buffer.getvalue()
+
+
+def _disk_path(key, file_type):
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return (
+        Path(settings.PLACEHOLDER_CACHE_DIR)
+        / digest[:2]
+        / f"{digest}.{file_type.lower()}"
+    )
+
+
+def _count_files(root):
+    try:
+        subdirs = [entry.path for entry in os.scandir(root) if entry.is_dir()]
+    except FileNotFoundError:
+        return 0
+    return sum(
+        1
+        for subdir in subdirs
+        for entry in os.scandir(subdir)
+        if not entry.name.endswith(".tmp")
+    )
+
+
+def _reserve_disk_slot():
+    """
+    Whether one more placeholder may be written to the disk cache.
+    """
+    global _disk_files
+    now = time.monotonic()
+    with _disk_lock:
+        if _disk_files is None or now - _disk_files[1] > DISK_RECOUNT_SECONDS:
+            _disk_files = (_count_files(settings.PLACEHOLDER_CACHE_DIR), now)
+        count, counted_at = _disk_files
+        if count >= settings.PLACEHOLDER_DISK_CACHE_MAX_FILES:
+            return False
+        _disk_files = (count + 1, counted_at)
+        return True
+
+
+def _load(key, width, height, file_type, alt):
+    path = _disk_path(key, file_type)
+    try:
+        return Placeholder(path.read_bytes())
+    except FileNotFoundError:
+        pass
+
+    content = _render(width, height, file_type, alt)
+    if not _reserve_disk_slot():
+        return Placeholder(content)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return Placeholder(content)
+
+
+def get_placeholder(width, height, file_type, alt):
+    key = f"{width}x{height}.{file_type}:{alt}"
+    with _lru_lock:
+        placeholder = _lru.get(key)
+        if placeholder is not None:
+            _lru.move_to_end(key)
+            return placeholder
+
+    # rendered outside the lock; two first hits may both encode, that's fine
+    placeholder = _load(key, width, height, file_type, alt)
+    with _lru_lock:
+        _lru[key] = placeholder
+        _lru.move_to_end(key)
+        while len(_lru) > settings.PLACEHOLDER_CACHE_SIZE:
+            _lru.popitem(last=False)
+    return placeholder
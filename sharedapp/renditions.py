@@ -0,0 +1,209 @@
+import hashlib
+import os
+import threading
+import time
+from fractions import Fraction
+from functools import lru_cache
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.urls import reverse
+from PIL import Image
+from pictures import conf, utils
+from pictures.models import PictureField, PillowPicture
+
+# -----------------------------
+# Lazy picture renditions
+# -----------------------------
+#
+# django-pictures renders every width x ratio x file type of an upload
+# eagerly (dozens of AVIF encodes per avatar / cover), most of which are
+# never requested. In lazy mode (PICTURES["PICTURE_CLASS"] = LazyPicture,
+# PICTURES["PROCESSOR"] = lazy_process_picture):
+#
+#   - an upload only stores the original,
+#   - a rendition URL points at `views.picture_rendition`, which encodes
+#     it on the first request into PICTURE_RENDITION_DIR and serves the
+#     file from there afterwards,
+#   - concurrent first requests for the same rendition encode it once
+#     (a thread lock inside the process, an O_EXCL lock file across
+#     processes),
+#   - replacing / deleting the original removes its cached renditions.
+#
+# A cache file is addressed by the hash of what it is made of (original
+# name, ratio, width, file type). A name may come back with a new upload
+# once the original is deleted, so the view serves renditions with an
+# ETag and a short max-age, not as immutable.
+
+RENDER_LOCK_TIMEOUT = 30  # seconds before a lock file counts as abandoned
+RENDER_LOCK_POLL = 0.05
+
+_thread_locks = [threading.Lock() for _ in range(64)]
+
+
+class RenditionNotFound(Exception):
+    pass
+
+
+def ratio_slug(ratio):
+    return f"{ratio.numerator}x{ratio.denominator}" if ratio else "original"
+
+
+def parse_ratio_slug(slug):
+    if slug == "original":
+        return None
+    try:
+        return Fraction(slug.replace("x", "/"))
+    except (ValueError, ZeroDivisionError):
+        raise RenditionNotFound(f"Invalid ratio {slug!r}")
+
+
+class LazyPicture(PillowPicture):
+    """
+    PillowPicture rendered on demand into the rendition cache
+    instead of next to the original in the storage.
+    """
+
+    @property
+    def url(self):
+        if conf.app_settings.USE_PLACEHOLDERS:
+            return super().url
+        return reverse(
+            "picture_rendition",
+            kwargs={
+                "ratio": ratio_slug(self.aspect_ratio),
+                "width": self.width,
+                "file_type": self.file_type.lower(),
+                "name": self.parent_name,
+            },
+        )
+
+    @property
+    def cache_key(self):
+        identity = "\0".join(
+            [
+                self.parent_name,
+                ratio_slug(self.aspect_ratio),
+                str(self.width),
+                self.file_type,
+            ]
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    @property
+    def path(self):
+        key = self.cache_key
+        return (
+            Path(settings.PICTURE_RENDITION_DIR)
+            / key[:2]
+            / f"{key}.{self.file_type.lower()}"
+        )
+
+    def save(self, image):
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write + rename: readers never see a half written file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.resize(image).save(
+                tmp, format=self.file_type, exif=b"", icc_profile=b""
+            )
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def delete(self):
+        self.path.unlink(missing_ok=True)
+
+
+def lazy_process_picture(*, storage, file_name, sender, new=None, old=None):
+    """
+    PICTURES["PROCESSOR"] for lazy mode: nothing is rendered at upload,
+    renditions of a replaced / deleted original are dropped from the cache.
+    """
+    for picture in old or []:
+        utils.reconstruct(*picture).delete()
+
+
+@lru_cache
+def _picture_fields():
+    return [
+        field
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, PictureField)
+    ]
+
+
+def get_picture(name, ratio, width, file_type):
+    """
+    The LazyPicture a rendition URL stands for. Only ratios / file types
+    configured on the PictureField that uploaded `name` are accepted.
+    """
+    ratio = parse_ratio_slug(ratio)
+    for field in _picture_fields():
+        upload_to = str(field.upload_to).rstrip("/")
+        if not name.startswith(f"{upload_to}/"):
+            continue
+        if ratio not in [Fraction(r) if r else None for r in field.aspect_ratios]:
+            break
+        if file_type.upper() not in field.file_types:
+            break
+        picture = LazyPicture(name, file_type.upper(), ratio, field.storage, width)
+        picture.field = field
+        return picture
+    raise RenditionNotFound(f"No rendition {ratio} {width}w.{file_type} of {name}")
+
+
+def _render(picture):
+    field = picture.field
+    try:
+        with picture.storage.open(picture.parent_name) as fs, Image.open(fs) as img:
+            # only widths pictures itself would put in a srcset (no upscaling,
+            # no arbitrary sizes requested by clients)
+            widths = utils.source_set(
+                img.size,
+                ratio=picture.aspect_ratio,
+                max_width=field.container_width,
+                cols=field.grid_columns,
+            )
+            if picture.width not in widths:
+                raise RenditionNotFound(f"Width {picture.width} not offered")
+            picture.save(PillowPicture.pre_process(img))
+    except (OSError, SuspiciousFileOperation) as exc:
+        raise RenditionNotFound(str(exc)) from exc
+
+
+def get_rendition(picture):
+    """
+    Path of the cached rendition, rendered first when missing.
+    Concurrent callers for the same rendition wait for one render.
+    """
+    path = picture.path
+    if path.exists():
+        return path
+
+    lock_path = path.with_name(f"{path.name}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with _thread_locks[int(picture.cache_key[:8], 16) % len(_thread_locks)]:
+        while not path.exists():
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # another process renders it, wait (or take over a dead lock)
+                try:
+                    if time.time() - lock_path.stat().st_mtime > RENDER_LOCK_TIMEOUT:
+                        lock_path.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass
+                time.sleep(RENDER_LOCK_POLL)
+                continue
+            try:
+                if not path.exists():
+                    _render(picture)
+            finally:
+                os.close(fd)
+                lock_path.unlink(missing_ok=True)
+    return path
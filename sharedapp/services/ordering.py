@@ -0,0 +1,184 @@
+from django.db import transaction
+from django.db.models import Case, Max, PositiveIntegerField, Value, When
+
+from sharedapp.signals import bulk_reordered
+
+# -----------------------------
+# Gap-based ordering
+# -----------------------------
+#
+# `order` values are kept sparse (ORDER_GAP apart), so inserting or moving
+# an item between two siblings only writes that one row (the midpoint).
+# When two neighbours run out of room the whole sibling group is
+# renumbered with ONE `UPDATE ... SET order = CASE pk ...`.
+#
+# Order is unique per scope (uniq_*_order_per_*) and PostgreSQL checks a
+# non-deferrable unique index row by row, so a renumbering always writes
+# into a range that does not overlap the current values (below the lowest
+# or above the highest one); no intermediate row can collide.
+#
+# Models opt in with `ordering_scope`, the fields that group siblings,
+# e.g. ("lesson",) on ContentBlock. A new row saved without an order (0,
+# the field default) is appended with `next_order`
+# (TimeStampedSoftDeleteModel.save); `insert` puts it after a sibling.
+# The helpers never hand out 0, so an order of 0 always means "not set".
+
+ORDER_GAP = 1024
+MAX_ORDER = 2**31 - 1  # PositiveIntegerField
+
+
+class OrderingError(Exception):
+    pass
+
+
+def scope_of(instance):
+    model = type(instance)
+    return {
+        model._meta.get_field(name).attname: getattr(
+            instance, model._meta.get_field(name).attname
+        )
+        for name in model.ordering_scope
+    }
+
+
+def siblings(model, scope):
+    return model.objects.filter(**scope)
+
+
+def next_order(model, scope):
+    """
+    `order` for a new row appended at the end of its scope.
+    """
+    for _ in range(2):
+        last = siblings(model, scope).aggregate(last=Max("order"))["last"]
+        order = ORDER_GAP if last is None else last + ORDER_GAP
+        if order <= MAX_ORDER:
+            return order
+        rebalance(model, scope)
+    raise OrderingError("No room left to append.")
+
+
+def _renumbered(pks, current_orders):
+    count = len(pks)
+    low, high = min(current_orders, default=0), max(current_orders, default=0)
+    if count * ORDER_GAP < low:
+        start, gap = ORDER_GAP, ORDER_GAP
+    else:
+        gap = min(ORDER_GAP, (MAX_ORDER - high) // count)
+        if gap < 1:
+            raise OrderingError("No room left to renumber, rebalance first.")
+        start = high + gap
+    return {pk: start + index * gap for index, pk in enumerate(pks)}
+
+
+def _write_orders(model, orders):
+    queryset = model.all_objects.filter(pk__in=list(orders))
+    bulk_reordered.send(sender=model, queryset=queryset)
+    return queryset.update(
+        order=Case(
+            *[When(pk=pk, then=Value(order)) for pk, order in orders.items()],
+            output_field=PositiveIntegerField(),
+        )
+    )
+
+
+def reorder(model, scope, pks):
+    """
+    Put the siblings of `scope` in the order of `pks`.
+
+    Siblings missing from `pks` keep their relative order after the listed
+    ones. One SELECT + one UPDATE whatever the number of siblings.
+    """
+    with transaction.atomic():
+        current = list(
+            siblings(model, scope)
+            .select_for_update()
+            .order_by("order")
+            .values_list("pk", "order")
+        )
+        known = {pk for pk, _ in current}
+        unknown = set(pks) - known
+        if unknown:
+            raise OrderingError(f"Not in this scope: {sorted(unknown)}")
+
+        listed = list(dict.fromkeys(pks))
+        listed_set = set(listed)
+        ordered = listed + [pk for pk, _ in current if pk not in listed_set]
+        _write_orders(model, _renumbered(ordered, [order for _, order in current]))
+
+
+def rebalance(model, scope):
+    """
+    Spread the siblings of `scope` ORDER_GAP apart again, keeping their order.
+    """
+    reorder(model, scope, [])
+
+
+def _free_slot(model, scope, after, moving_pk=None):
+    """
+    A free `order` right after the sibling `after` (None: at the front),
+    ignoring the row `moving_pk`. Rebalances the scope when the two
+    neighbours are adjacent numbers. Runs inside the caller's transaction.
+    """
+    for _ in range(2):
+        # the caller's instances may be stale: read the current orders,
+        # locked until the caller's write
+        orders = dict(
+            siblings(model, scope)
+            .select_for_update()
+            .order_by("order")
+            .values_list("pk", "order")
+        )
+        if (moving_pk is not None and moving_pk not in orders) or (
+            after is not None and after.pk not in orders
+        ):
+            raise OrderingError("The item is no longer in this scope.")
+        low = orders[after.pk] if after is not None else 0
+        following = min(
+            (
+                order
+                for pk, order in orders.items()
+                if pk != moving_pk and (after is None or order > low)
+            ),
+            default=None,
+        )
+        high = following if following is not None else low + 2 * ORDER_GAP
+        if high - low > 1:
+            return (low + high) // 2
+        rebalance(model, scope)
+    raise OrderingError("Could not make room.")
+
+
+def _check_sibling(model, scope, after):
+    if after is not None and (type(after) is not model or scope_of(after) != scope):
+        raise OrderingError("`after` must be a sibling of the item.")
+
+
+def move(instance, after=None):
+    """
+    Move `instance` right after the sibling `after` (None: to the front).
+
+    Writes a single row unless the two neighbours are adjacent numbers,
+    then the scope is rebalanced first.
+    """
+    model = type(instance)
+    scope = scope_of(instance)
+    _check_sibling(model, scope, after)
+    with transaction.atomic():
+        instance.order = _free_slot(model, scope, after, moving_pk=instance.pk)
+        _write_orders(model, {instance.pk: instance.order})
+    return instance
+
+
+def insert(instance, after=None):
+    """
+    Save the new row `instance` right after the sibling `after`
+    (None: at the front), writing no other row unless it has to rebalance.
+    """
+    model = type(instance)
+    scope = scope_of(instance)
+    _check_sibling(model, scope, after)
+    with transaction.atomic():
+        instance.order = _free_slot(model, scope, after)
+        instance.save()
+    return instance
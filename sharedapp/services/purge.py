@@ -0,0 +1,173 @@
+import time
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import connection, models, transaction
+from django.db.models import Exists, OuterRef
+
+from sharedapp.models import SoftDeleteArchive
+
+# Children before parents: a parent is only purged once none of its
+# child rows are left (see `purgeable`).
+PURGE_ORDER = [
+    "contentapp.ContentBlock",
+    "contentapp.Lesson",
+    "contentapp.Module",
+    "contentapp.CoursePlacement",
+    "contentapp.Course",
+    "contentapp.Subject",
+    "contentapp.GradeLevel",
+    "relationshipapp.GuardianRelationship",
+    "accountapp.UserRole",
+]
+
+# Rows without soft delete that belong to the row they point at (CASCADE):
+# they do not hold a tombstone back, they are deleted together with it.
+PURGE_WITH_PARENT = [
+    "progressapp.BlockProgress",
+    "progressapp.LessonProgress",
+]
+
+
+@dataclass
+class PurgeResult:
+    model_label: str
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _reverse_relations(model):
+    # include_hidden: related_name="+" relations are not in
+    # _meta.related_objects but still point at the rows
+    return [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created
+        and not field.concrete
+        and (field.one_to_many or field.one_to_one)
+    ]
+
+
+def _owned(rel):
+    return (
+        rel.on_delete is models.CASCADE
+        and rel.related_model._meta.label in PURGE_WITH_PARENT
+    )
+
+
+def _references(rel, values):
+    return rel.related_model._base_manager.filter(**{f"{rel.field.name}__in": values})
+
+
+def purgeable(model, cutoff):
+    """
+    Tombstones older than `cutoff` that no other row depends on anymore.
+
+    A dead parent can still have child rows (alive, or dead but not purged
+    yet); deleting it would cascade into them, so it waits for a later run.
+    SET_NULL references and PURGE_WITH_PARENT rows do not hold a row back,
+    `purge_model` clears / deletes them.
+    """
+    queryset = model.all_objects.dead().filter(deleted_at__lt=cutoff)
+    for rel in _reverse_relations(model):
+        if rel.on_delete in (models.SET_NULL, models.DO_NOTHING) or _owned(rel):
+            continue
+        queryset = queryset.filter(
+            ~Exists(
+                rel.related_model._base_manager.filter(
+                    **{rel.field.name: OuterRef(rel.field.target_field.attname)}
+                )
+            )
+        )
+    return queryset
+
+
+def purge_model(model, cutoff, batch_size=500, archive=True, pause=0.0, on_batch=None):
+    """
+    Archive (or just hard delete) purgeable tombstones of `model`.
+
+    Works in batches of `batch_size`, each in its own short transaction,
+    so locks are only held for one batch and an interrupted run simply
+    continues where it stopped next time. `pause` (seconds) between
+    batches leaves room for production traffic.
+    """
+    result = PurgeResult(model._meta.label_lower)
+    candidates = purgeable(model, cutoff).order_by("pk").values_list("pk", flat=True)
+    relations = _reverse_relations(model)
+    set_null = [rel for rel in relations if rel.on_delete is models.SET_NULL]
+    owned = [rel for rel in relations if _owned(rel)]
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    last_pk = None
+
+    while True:
+        started = time.monotonic()
+        page = candidates if last_pk is None else candidates.filter(pk__gt=last_pk)
+        pks = list(page[:batch_size])
+        if not pks:
+            break
+        # keyset: rows skipped below (locked) are not looked at again
+        last_pk = pks[-1]
+
+        with transaction.atomic():
+            batch = model.all_objects.filter(pk__in=pks, deleted_at__lt=cutoff)
+            if skip_locked:
+                # rows somebody is restoring right now are left for next time
+                batch = batch.select_for_update(skip_locked=True)
+            rows = list(batch.values())
+            if not rows:
+                continue
+
+            if archive:
+                SoftDeleteArchive.objects.bulk_create(
+                    SoftDeleteArchive(
+                        model_label=result.model_label,
+                        object_id=str(row["id"]),
+                        data=row,
+                        deleted_at=row["deleted_at"],
+                    )
+                    for row in rows
+                )
+            # what on_delete=SET_NULL would have done, as one UPDATE each
+            for rel in set_null:
+                target = rel.field.target_field.attname
+                _references(rel, [row[target] for row in rows]).update(
+                    **{rel.field.name: None}
+                )
+            # ... and what CASCADE would have done to PURGE_WITH_PARENT rows
+            for rel in owned:
+                target = rel.field.target_field.attname
+                _references(rel, [row[target] for row in rows])._raw_delete(
+                    rel.related_model._base_manager.db
+                )
+            # Plain DELETE ... WHERE id IN (...): nothing else depends on
+            # these rows anymore (purgeable), so Django's collector, which
+            # loads every row and sends per-row delete signals, is not needed.
+            model.all_objects.filter(pk__in=[row["id"] for row in rows])._raw_delete(
+                model.all_objects.db
+            )
+
+        result.rows += len(rows)
+        result.batches += 1
+        result.seconds += time.monotonic() - started
+        if on_batch:
+            on_batch(result)
+        if pause:
+            time.sleep(pause)
+
+    return result
+
+
+def purge_soft_deleted(cutoff, model_labels=None, **kwargs):
+    """
+    Run `purge_model` for every model in FK-safe order.
+    Returns one PurgeResult per model.
+    """
+    return [
+        purge_model(apps.get_model(label), cutoff, **kwargs)
+        for label in model_labels or PURGE_ORDER
+    ]
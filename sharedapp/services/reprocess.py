@@ -0,0 +1,209 @@
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import django
+from django.apps import apps
+from PIL import Image
+from pictures import conf, utils
+from pictures.models import PillowPicture
+
+# -----------------------------
+# Bulk picture re-processing
+# -----------------------------
+#
+# After a PICTURES change (breakpoints, file types, ...) every existing
+# upload needs the renditions of the new settings. The originals of each
+# PictureField are walked in pk order (keyset batches) and encoded in a
+# process pool, one image per task.
+#
+# A JSON checkpoint remembers, per field, the last pk done and, per file,
+# the sha256 of the original it was rendered from. An interrupted run
+# continues after the last finished batch; a complete re-run only encodes
+# originals whose content changed. Changing the picture settings
+# (`settings_fingerprint`) starts over.
+
+PICTURE_FIELDS = [
+    ("accountapp.User", "avatar"),
+    ("contentapp.Course", "cover_image"),
+]
+
+
+@dataclass
+class ReprocessResult:
+    field_label: str
+    images: int = 0
+    skipped: int = 0
+    renditions: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+    @property
+    def images_per_second(self):
+        return self.images / self.seconds if self.seconds else 0.0
+
+
+def settings_fingerprint():
+    fields = []
+    for label, name in PICTURE_FIELDS:
+        field = apps.get_model(label)._meta.get_field(name)
+        fields.append(
+            [
+                label,
+                name,
+                [str(ratio) for ratio in field.aspect_ratios],
+                field.file_types,
+                field.container_width,
+                field.grid_columns,
+            ]
+        )
+    config = {
+        "PICTURES": {
+            key: getattr(conf.app_settings, key)
+            for key in ("PIXEL_DENSITIES", "PICTURE_CLASS")
+        },
+        "fields": fields,
+    }
+    return hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class Checkpoint:
+    def __init__(self, path, fingerprint):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.last_pk = {}
+        self.hashes = {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("fingerprint") == fingerprint:
+            self.last_pk = data["last_pk"]
+            self.hashes = data["hashes"]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "fingerprint": self.fingerprint,
+                    "last_pk": self.last_pk,
+                    "hashes": self.hashes,
+                }
+            )
+        )
+        os.replace(tmp, self.path)
+
+
+def _init_worker():
+    # spawned workers start without configured apps / settings
+    django.setup()
+
+
+def render_picture(storage, file_name, pictures, known_hash):
+    """
+    Pool task: encode every rendition in `pictures` (deconstructed) from
+    the original `file_name`, unless its sha256 equals `known_hash`.
+
+    Returns (file_name, sha256, renditions written, CPU seconds).
+    """
+    started = time.process_time()
+    storage = utils.reconstruct(*storage)
+    with storage.open(file_name) as fs:
+        source = fs.read()
+    digest = hashlib.sha256(source).hexdigest()
+    if digest == known_hash:
+        return file_name, digest, 0, time.process_time() - started
+
+    with Image.open(io.BytesIO(source)) as img:
+        img = PillowPicture.pre_process(img)
+        for picture in pictures:
+            utils.reconstruct(*picture).save(img)
+    return file_name, digest, len(pictures), time.process_time() - started
+
+
+def reprocess_field(
+    label, name, pool, checkpoint, batch_size=100, restart=False, on_batch=None
+):
+    model = apps.get_model(label)
+    field = model._meta.get_field(name)
+    field_label = f"{model._meta.label_lower}.{name}"
+    result = ReprocessResult(field_label)
+
+    rows = (
+        model.all_objects.exclude(**{name: ""})
+        .exclude(**{f"{name}__isnull": True})
+        .only("pk", name, field.width_field, field.height_field)
+        .order_by("pk")
+    )
+    last_pk = 0 if restart else checkpoint.last_pk.get(field_label, 0)
+
+    while True:
+        started = time.monotonic()
+        batch = list(rows.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+
+        futures = []
+        for instance in batch:
+            file = getattr(instance, name)
+            pictures = [
+                picture.deconstruct() for picture in file.get_picture_files_list()
+            ]
+            futures.append(
+                pool.submit(
+                    render_picture,
+                    file.storage.deconstruct(),
+                    file.name,
+                    pictures,
+                    None if restart else checkpoint.hashes.get(file.name),
+                )
+            )
+        for future in futures:
+            try:
+                file_name, digest, renditions, cpu_seconds = future.result()
+            except Exception:
+                # missing / broken original, try again on the next run
+                result.failed += 1
+                continue
+            checkpoint.hashes[file_name] = digest
+            result.cpu_seconds += cpu_seconds
+            if renditions:
+                result.images += 1
+                result.renditions += renditions
+            else:
+                result.skipped += 1
+
+        last_pk = batch[-1].pk
+        checkpoint.last_pk[field_label] = last_pk
+        checkpoint.save()
+        result.seconds += time.monotonic() - started
+        if on_batch:
+            on_batch(result)
+
+    # done: the next run walks the field again (and skips unchanged originals)
+    checkpoint.last_pk.pop(field_label, None)
+    checkpoint.save()
+    return result
+
+
+def reprocess_pictures(checkpoint_path, workers=None, restart=False, **kwargs):
+    """
+    Run `reprocess_field` for every PictureField in PICTURE_FIELDS.
+    Returns one ReprocessResult per field.
+    """
+    checkpoint = Checkpoint(checkpoint_path, settings_fingerprint())
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return [
+            reprocess_field(label, name, pool, checkpoint, restart=restart, **kwargs)
+            for label, name in PICTURE_FIELDS
+        ]
@@ -0,0 +1,19 @@
+from django.dispatch import Signal
+
+# Sent by SoftDeleteQuerySet.soft_delete() right BEFORE the bulk UPDATE.
+#
+# A queryset update() does not fire pre_save/post_save, so anything that
+# keeps derived state (caches, counters...) listens here instead.
+# The queryset still matches the affected rows when receivers run.
+#
+#   sender   -> model class
+#   queryset -> the queryset being soft deleted
+bulk_soft_deleted = Signal()
+
+# Same for SoftDeleteQuerySet.restore(), sent right BEFORE the bulk UPDATE
+# (the queryset still matches the dead rows).
+bulk_restored = Signal()
+
+# Sent by sharedapp.services.ordering right BEFORE it rewrites `order`
+# with a bulk UPDATE (the queryset matches the rows being renumbered).
+bulk_reordered = Signal()
@@ -1,3 +1,171 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+
+from accountapp.models import User
+from contentapp.enums import ContentBlockType
+from contentapp.models import ContentBlock, Course, Lesson, Module
+from progressapp.models import BlockProgress, LessonProgress
+from sharedapp.managers import RestoreConflict
+from sharedapp.services.ordering import ORDER_GAP, insert, move
+from sharedapp.services.purge import purge_soft_deleted
+
+
+class MoveTests(TestCase):
+    def setUp(self):
+        self.course = Course.objects.create(title="Course", slug="course")
+
+    def add_modules(self, *orders):
+        modules = []
+        for order in orders:
+            module = Module.objects.create(course=self.course, title=f"M{order}")
+            # as given, 0 included (rows from before gap-based ordering)
+            Module.objects.filter(pk=module.pk).update(order=order)
+            module.order = order
+            modules.append(module)
+        return modules
+
+    def titles(self):
+        return list(
+            Module.objects.filter(course=self.course)
+            .order_by("order")
+            .values_list("title", flat=True)
+        )
+
+    def test_move_to_front_passes_order_zero(self):
+        *_, last = self.add_modules(0, 2000, 5000)
+
+        move(last)
+
+        self.assertEqual(self.titles(), ["M5000", "M0", "M2000"])
+
+    def test_move_to_front_rebalances_without_room(self):
+        *_, last = self.add_modules(0, 1, 2)
+
+        move(last)
+
+        self.assertEqual(self.titles(), ["M2", "M0", "M1"])
+
+    def test_move_after_uses_the_current_order(self):
+        first, second, _ = self.add_modules(1024, 2048, 3072)
+        Module.objects.filter(pk=second.pk).update(order=4096)  # second is stale
+
+        move(first, after=second)
+
+        self.assertEqual(self.titles(), ["M3072", "M2048", "M1024"])
+
+
+class InsertTests(TestCase):
+    def setUp(self):
+        self.course = Course.objects.create(title="Course", slug="course")
+
+    def titles(self):
+        return list(
+            Module.objects.filter(course=self.course)
+            .order_by("order")
+            .values_list("title", flat=True)
+        )
+
+    def test_new_rows_are_appended(self):
+        first = Module.objects.create(course=self.course, title="A")
+        second = Module.objects.create(course=self.course, title="B")
+
+        self.assertEqual((first.order, second.order), (ORDER_GAP, 2 * ORDER_GAP))
+
+    def test_insert_writes_the_midpoint(self):
+        first = Module.objects.create(course=self.course, title="A")
+        Module.objects.create(course=self.course, title="C")
+
+        inserted = insert(Module(course=self.course, title="B"), after=first)
+
+        self.assertEqual(inserted.order, ORDER_GAP + ORDER_GAP // 2)
+        self.assertEqual(self.titles(), ["A", "B", "C"])
+
+    def test_insert_at_the_front(self):
+        Module.objects.create(course=self.course, title="B")
+
+        insert(Module(course=self.course, title="A"))
+
+        self.assertEqual(self.titles(), ["A", "B"])
+
+
+class PurgeTests(TestCase):
+    def setUp(self):
+        self.student = User.base_objects.create_user("01700000000", "pass")
+        self.course = Course.objects.create(title="Course", slug="course")
+        module = Module.objects.create(course=self.course, title="Module")
+        self.lesson = Lesson.objects.create(module=module, title="Lesson")
+        self.block = ContentBlock.objects.create(
+            lesson=self.lesson, block_type=ContentBlockType.TEXT, data={"body": "x"}
+        )
+        now = timezone.now()
+        BlockProgress.objects.create(
+            student=self.student,
+            block=self.block,
+            lesson=self.lesson,
+            started_at=now,
+            updated_at=now,
+        )
+        LessonProgress.objects.create(
+            student=self.student,
+            lesson=self.lesson,
+            started_at=now,
+            updated_at=now,
+            last_block=self.block,
+        )
+
+    def test_progress_does_not_keep_purged_content_alive(self):
+        self.course.delete()
+        long_ago = timezone.now() - timedelta(days=200)
+        for model in (Course, Module, Lesson, ContentBlock):
+            model.all_objects.update(deleted_at=long_ago)
+
+        purge_soft_deleted(timezone.now() - timedelta(days=90), archive=False)
+
+        self.assertFalse(Course.all_objects.exists())
+        self.assertFalse(ContentBlock.all_objects.exists())
+        self.assertFalse(BlockProgress.objects.exists())
+        self.assertFalse(LessonProgress.objects.exists())
+        self.assertTrue(User.objects.filter(pk=self.student.pk).exists())
+
+    def test_recent_tombstones_keep_their_progress(self):
+        self.course.delete()
+
+        purge_soft_deleted(timezone.now() - timedelta(days=90), archive=False)
+
+        self.assertTrue(ContentBlock.all_objects.filter(pk=self.block.pk).exists())
+        self.assertEqual(BlockProgress.objects.count(), 1)
+
+
+class RestoreTests(TestCase):
+    def setUp(self):
+        self.course = Course.objects.create(title="Course", slug="course")
+
+    def test_restore_of_a_reused_slug_is_refused(self):
+        self.course.delete()
+        Course.objects.create(title="New", slug="course")
+
+        with self.assertRaises(RestoreConflict):
+            self.course.restore()
+
+        self.assertFalse(Course.objects.filter(pk=self.course.pk).exists())
+
+    def test_restore_of_a_reused_order_is_refused(self):
+        module = Module.objects.create(course=self.course, title="Old")
+        module.delete()
+        # appended into the slot the deleted module left
+        Module.objects.create(course=self.course, title="New")
+
+        with self.assertRaises(RestoreConflict):
+            Module.all_objects.filter(pk=module.pk).restore()
+
+        self.assertFalse(Module.objects.filter(pk=module.pk).exists())
+
+    def test_restore_cascades_when_nothing_is_taken(self):
+        Module.objects.create(course=self.course, title="Module")
+        self.course.delete()
+
+        self.course.restore()
 
-# Create your tests here.
+        self.assertEqual(Module.objects.filter(course=self.course).count(), 1)
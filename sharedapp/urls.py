@@ -0,0 +1,12 @@
+from django.urls import path
+
+from sharedapp import views
+
+
+urlpatterns = [
+    path(
+        "/<ratio>/<int:width>w.<file_type>/<path:name>",
+        views.picture_rendition,
+        name="picture_rendition",
+    ),
+]
@@ -1,3 +1,65 @@
-from django.shortcuts import render
+import math
+from fractions import Fraction
 
-# Create your views here.
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import parse_etags
+from pictures import conf
+
+from sharedapp.placeholders import get_placeholder
+from sharedapp.renditions import RenditionNotFound, get_picture, get_rendition
+
+# a placeholder URL never changes its content
+IMMUTABLE = f"public, max-age={60 * 60 * 24 * 365}, immutable"
+# a rendition URL is derived from the original's file name, which a new
+# upload may reuse: cached for a while, then revalidated by ETag
+RENDITION_CACHE_CONTROL = f"public, max-age={60 * 60}"
+PLACEHOLDER_MAX_SIZE = 4096
+
+
+def picture_rendition(request, ratio, width, file_type, name):
+    """
+    A picture rendition, encoded on the first request (see sharedapp.renditions).
+    """
+    try:
+        path = get_rendition(get_picture(name, ratio, width, file_type))
+        # replacing the original deletes its renditions, the next one is a
+        # new file (new mtime)
+        stat = path.stat()
+    except (RenditionNotFound, FileNotFoundError):
+        raise Http404("Picture not found")
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": RENDITION_CACHE_CONTROL}
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        return HttpResponseNotModified(headers=headers)
+    try:
+        return FileResponse(
+            path.open("rb"),
+            content_type=f"image/{file_type.lower()}",
+            headers=headers,
+        )
+    except FileNotFoundError:
+        raise Http404("Picture not found")
+
+
+def picture_placeholder(request, alt, ratio, width, file_type):
+    """
+    pictures' placeholder view, served from sharedapp.placeholders.
+    """
+    try:
+        ratio = Fraction(ratio.replace("x", "/"))
+        height = math.floor(width / ratio)
+    except (ValueError, ZeroDivisionError):
+        raise Http404()
+    file_type = file_type.upper()
+    if file_type not in conf.app_settings.FILE_TYPES:
+        raise Http404("File type not allowed")
+    if not (0 < width <= PLACEHOLDER_MAX_SIZE and 0 < height <= PLACEHOLDER_MAX_SIZE):
+        raise Http404()
+
+    placeholder = get_placeholder(width, height, file_type, alt)
+    headers = {"ETag": placeholder.etag, "Cache-Control": IMMUTABLE}
+    if placeholder.etag in parse_etags(request.headers.get("If-None-Match", "")):
+        return HttpResponseNotModified(headers=headers)
+    return HttpResponse(
+        placeholder.content, content_type=f"image/{file_type.lower()}", headers=headers
+    )